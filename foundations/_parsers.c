@@ -0,0 +1,387 @@
+/*
+ * _parsers.c
+ *
+ * Platform:
+ *     Windows, Linux, Mac Os X.
+ *
+ * Description:
+ *     Provides the optional compiled sections tokenizer used by
+ *     foundations.parsers.SectionsFileParser class.
+ *
+ * Others:
+ *     The tokenizer matches the lines exactly as the grammar returned by
+ *     SectionsFileParser.__get_grammar method does, and yields the same tokens than
+ *     SectionsFileParser.__tokenize_records method. Configurations or lines it cannot
+ *     handle make it return None so that the pure Python implementation is used instead.
+ */
+
+#include <Python.h>
+
+#define LINE_NONE 0
+#define LINE_COMMENT 1
+#define LINE_SECTION 2
+#define LINE_EMPTY 3
+#define LINE_ATTRIBUTE 4
+#define LINE_BARE_ATTRIBUTE 5
+
+static PyObject *TOKEN_SECTION = NULL;
+static PyObject *TOKEN_COMMENT = NULL;
+static PyObject *TOKEN_ATTRIBUTE = NULL;
+static PyObject *TOKEN_RAW = NULL;
+static PyObject *TOKEN_ERROR = NULL;
+static PyObject *KEY_ID = NULL;
+static PyObject *KEY_CONTENT = NULL;
+
+/* Matches the regex "\s" class without unicode flag: [ \t\n\r\f\v]. */
+static int
+is_space(Py_UNICODE character)
+{
+    return character == ' ' || (character >= '\t' && character <= '\r');
+}
+
+static int
+contains(PyObject *characters, Py_UNICODE character)
+{
+    Py_UNICODE *buffer = PyUnicode_AS_UNICODE(characters);
+    Py_ssize_t size = PyUnicode_GET_SIZE(characters);
+    Py_ssize_t i;
+
+    for (i = 0; i < size; i++) {
+        if (buffer[i] == character)
+            return 1;
+    }
+    return 0;
+}
+
+/* Returns given buffer slice, stripped from unicode whitespaces like unicode.strip() does. */
+static PyObject *
+strip_whitespaces(Py_UNICODE *buffer, Py_ssize_t start, Py_ssize_t end)
+{
+    while (start < end && Py_UNICODE_ISSPACE(buffer[start]))
+        start++;
+    while (end > start && Py_UNICODE_ISSPACE(buffer[end - 1]))
+        end--;
+    return PyUnicode_FromUnicode(buffer + start, end - start);
+}
+
+/* Returns given string stripped from given characters like unicode.strip(characters) does. */
+static PyObject *
+strip_characters(PyObject *string, PyObject *characters)
+{
+    Py_UNICODE *buffer = PyUnicode_AS_UNICODE(string);
+    Py_ssize_t start = 0;
+    Py_ssize_t end = PyUnicode_GET_SIZE(string);
+
+    while (start < end && contains(characters, buffer[start]))
+        start++;
+    while (end > start && contains(characters, buffer[end - 1]))
+        end--;
+    if (start == 0 && end == PyUnicode_GET_SIZE(string)) {
+        Py_INCREF(string);
+        return string;
+    }
+    return PyUnicode_FromUnicode(buffer + start, end - start);
+}
+
+/* Returns the namespace, namespace splitter and attribute concatenation. */
+static PyObject *
+set_namespace(PyObject *namespace, PyObject *namespace_splitter, PyObject *attribute)
+{
+    Py_ssize_t namespace_size = PyUnicode_GET_SIZE(namespace);
+    Py_ssize_t splitter_size = PyUnicode_GET_SIZE(namespace_splitter);
+    Py_ssize_t attribute_size = PyUnicode_GET_SIZE(attribute);
+    PyObject *long_name;
+    Py_UNICODE *buffer;
+
+    long_name = PyUnicode_FromUnicode(NULL, namespace_size + splitter_size + attribute_size);
+    if (long_name == NULL)
+        return NULL;
+
+    buffer = PyUnicode_AS_UNICODE(long_name);
+    Py_UNICODE_COPY(buffer, PyUnicode_AS_UNICODE(namespace), namespace_size);
+    Py_UNICODE_COPY(buffer + namespace_size, PyUnicode_AS_UNICODE(namespace_splitter), splitter_size);
+    Py_UNICODE_COPY(buffer + namespace_size + splitter_size, PyUnicode_AS_UNICODE(attribute), attribute_size);
+    return long_name;
+}
+
+/*
+ * Classifies given line body, storing the matched group slice into given start and end
+ * and the value slice start into given value_start.
+ */
+static int
+classify_line(Py_UNICODE *buffer,
+              Py_ssize_t size,
+              PyObject *comment_limiters,
+              PyObject *splitters,
+              Py_ssize_t *start,
+              Py_ssize_t *end,
+              Py_ssize_t *value_start)
+{
+    Py_ssize_t i = 0;
+    Py_ssize_t j;
+
+    while (i < size && is_space(buffer[i]))
+        i++;
+
+    /* "\s*[comment_limiters](?P<comment>.+)" */
+    if (i < size && contains(comment_limiters, buffer[i]) && size - i - 1 >= 1) {
+        *start = i + 1;
+        *end = size;
+        return LINE_COMMENT;
+    }
+
+    /* "\s*\[(?P<section>.+)\]\s*" */
+    if (i < size && buffer[i] == '[') {
+        j = size;
+        while (j > i && is_space(buffer[j - 1]))
+            j--;
+        if (buffer[j - 1] == ']' && j - 1 > i + 1) {
+            *start = i + 1;
+            *end = j - 1;
+            return LINE_SECTION;
+        }
+    }
+
+    /* "(?P<empty>\s*)" */
+    if (i == size)
+        return LINE_EMPTY;
+
+    /* "(?P<attribute>.+?)[splitters](?P<value>.+)" */
+    for (j = 1; j < size - 1; j++) {
+        if (contains(splitters, buffer[j])) {
+            *start = 0;
+            *end = j;
+            *value_start = j + 1;
+            return LINE_ATTRIBUTE;
+        }
+    }
+
+    /* "(?P<bare_attribute>.+?)[splitters]\s*" */
+    if (size >= 2 && contains(splitters, buffer[size - 1])) {
+        *start = 0;
+        *end = size - 1;
+        return LINE_BARE_ATTRIBUTE;
+    }
+
+    return LINE_NONE;
+}
+
+static PyObject *
+append_token(PyObject *tokens, PyObject *token, PyObject *section, PyObject *key, PyObject *value)
+{
+    PyObject *item;
+    int status;
+
+    item = PyTuple_Pack(4, token, section, key, value);
+    if (item == NULL)
+        return NULL;
+    status = PyList_Append(tokens, item);
+    Py_DECREF(item);
+    return status < 0 ? NULL : tokens;
+}
+
+static PyObject *
+tokenize(PyObject *self, PyObject *args)
+{
+    PyObject *lines, *comment_limiters, *splitters, *quotation_markers, *raw_sections;
+    PyObject *namespace_splitter, *comment_marker, *raw_section_content_identifier, *section;
+    int namespaces, strip_comments, strip_whitespaces_, strip_quotation_markers;
+    Py_ssize_t comment_id, line_offset;
+
+    PyObject *sequence = NULL, *tokens = NULL;
+    PyObject *line, *key = NULL, *value = NULL, *content = NULL, *identifier = NULL, *stripped = NULL;
+    Py_UNICODE *buffer;
+    Py_ssize_t i, j, count, size, body_size, start = 0, end = 0, value_start = 0;
+    int line_type, is_raw;
+
+    if (!PyArg_ParseTuple(args, "OUUUOiiiiUUUUnn:tokenize",
+                          &lines, &comment_limiters, &splitters, &quotation_markers, &raw_sections,
+                          &namespaces, &strip_comments, &strip_whitespaces_, &strip_quotation_markers,
+                          &namespace_splitter, &comment_marker, &raw_section_content_identifier, &section,
+                          &comment_id, &line_offset))
+        return NULL;
+
+    sequence = PySequence_Fast(lines, "'lines' argument must be a sequence!");
+    if (sequence == NULL)
+        return NULL;
+
+    count = PySequence_Fast_GET_SIZE(sequence);
+    for (i = 0; i < count; i++) {
+        line = PySequence_Fast_GET_ITEM(sequence, i);
+        if (!PyUnicode_CheckExact(line))
+            goto fallback;
+        buffer = PyUnicode_AS_UNICODE(line);
+        size = PyUnicode_GET_SIZE(line);
+        for (j = 0; j < size - 1; j++) {
+            if (buffer[j] == '\n')
+                goto fallback;
+        }
+    }
+
+    tokens = PyList_New(0);
+    if (tokens == NULL)
+        goto error;
+
+    Py_INCREF(section);
+    for (i = 0; i < count; i++) {
+        line = PySequence_Fast_GET_ITEM(sequence, i);
+        buffer = PyUnicode_AS_UNICODE(line);
+        size = PyUnicode_GET_SIZE(line);
+        body_size = size > 0 && buffer[size - 1] == '\n' ? size - 1 : size;
+
+        line_type = classify_line(buffer, body_size, comment_limiters, splitters, &start, &end, &value_start);
+
+        if (line_type == LINE_COMMENT) {
+            if (!strip_comments) {
+                identifier = PyUnicode_FromFormat("%U%zd", comment_marker, comment_id);
+                if (identifier == NULL)
+                    goto error;
+                if (namespaces) {
+                    key = set_namespace(section, namespace_splitter, identifier);
+                    Py_CLEAR(identifier);
+                } else {
+                    key = identifier;
+                    identifier = NULL;
+                }
+                if (key == NULL)
+                    goto error;
+
+                content = strip_whitespaces_ ? strip_whitespaces(buffer, start, end) : NULL;
+                if (content == NULL || PyUnicode_GET_SIZE(content) == 0) {
+                    Py_XDECREF(content);
+                    content = PyUnicode_FromUnicode(buffer + start, end - start);
+                    if (content == NULL)
+                        goto error;
+                }
+                value = Py_BuildValue("{SnSO}", KEY_ID, comment_id, KEY_CONTENT, content);
+                Py_CLEAR(content);
+                if (value == NULL || append_token(tokens, TOKEN_COMMENT, section, key, value) == NULL)
+                    goto error;
+                Py_CLEAR(key);
+                Py_CLEAR(value);
+                comment_id++;
+            }
+            continue;
+        }
+
+        if (line_type == LINE_SECTION) {
+            value = strip_whitespaces_ ? strip_whitespaces(buffer, start, end) : NULL;
+            if (value == NULL || PyUnicode_GET_SIZE(value) == 0) {
+                Py_XDECREF(value);
+                value = PyUnicode_FromUnicode(buffer + start, end - start);
+                if (value == NULL)
+                    goto error;
+            }
+            Py_DECREF(section);
+            section = value;
+            value = NULL;
+            if (append_token(tokens, TOKEN_SECTION, section, Py_None, Py_None) == NULL)
+                goto error;
+            continue;
+        }
+
+        is_raw = PySequence_Contains(raw_sections, section);
+        if (is_raw < 0)
+            goto error;
+        if (is_raw) {
+            if (append_token(tokens, TOKEN_RAW, section, raw_section_content_identifier, line) == NULL)
+                goto error;
+            continue;
+        }
+
+        if (line_type == LINE_EMPTY)
+            continue;
+
+        if (line_type == LINE_ATTRIBUTE || line_type == LINE_BARE_ATTRIBUTE) {
+            key = strip_whitespaces_ ? strip_whitespaces(buffer, start, end) :
+                  PyUnicode_FromUnicode(buffer + start, end - start);
+            if (key == NULL)
+                goto error;
+            if (namespaces) {
+                stripped = key;
+                key = set_namespace(section, namespace_splitter, stripped);
+                Py_CLEAR(stripped);
+                if (key == NULL)
+                    goto error;
+            }
+
+            if (line_type == LINE_ATTRIBUTE) {
+                value = strip_whitespaces_ ? strip_whitespaces(buffer, value_start, body_size) :
+                        PyUnicode_FromUnicode(buffer + value_start, body_size - value_start);
+                if (value == NULL)
+                    goto error;
+                if (strip_quotation_markers) {
+                    stripped = value;
+                    value = strip_characters(stripped, quotation_markers);
+                    Py_CLEAR(stripped);
+                    if (value == NULL)
+                        goto error;
+                }
+            } else {
+                Py_INCREF(Py_None);
+                value = Py_None;
+            }
+
+            if (append_token(tokens, TOKEN_ATTRIBUTE, section, key, value) == NULL)
+                goto error;
+            Py_CLEAR(key);
+            Py_CLEAR(value);
+            continue;
+        }
+
+        value = Py_BuildValue("(nOO)", line_offset + i + 1, TOKEN_ATTRIBUTE, line);
+        if (value == NULL || append_token(tokens, TOKEN_ERROR, section, Py_None, value) == NULL)
+            goto error;
+        Py_CLEAR(value);
+    }
+
+    Py_DECREF(section);
+    Py_DECREF(sequence);
+    return tokens;
+
+fallback:
+    Py_DECREF(sequence);
+    Py_RETURN_NONE;
+
+error:
+    if (tokens != NULL)
+        Py_DECREF(section);
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    Py_XDECREF(content);
+    Py_XDECREF(identifier);
+    Py_XDECREF(tokens);
+    Py_DECREF(sequence);
+    return NULL;
+}
+
+PyDoc_STRVAR(tokenize_doc,
+"tokenize(lines, comment_limiters, splitters, quotation_markers, raw_sections, namespaces, strip_comments,\n\
+         strip_whitespaces, strip_quotation_markers, namespace_splitter, comment_marker,\n\
+         raw_section_content_identifier, section, comment_id, line_offset)\n\
+\n\
+Returns the section, comment, attribute, raw and error tokens of given unicode lines,\n\
+or None if the lines cannot be tokenized.");
+
+static PyMethodDef methods[] = {
+    {"tokenize", tokenize, METH_VARARGS, tokenize_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+PyMODINIT_FUNC
+init_parsers(void)
+{
+    PyObject *module;
+
+    module = Py_InitModule3("_parsers", methods, "Provides the optional compiled sections tokenizer.");
+    if (module == NULL)
+        return;
+
+    TOKEN_SECTION = PyUnicode_FromString("section");
+    TOKEN_COMMENT = PyUnicode_FromString("comment");
+    TOKEN_ATTRIBUTE = PyUnicode_FromString("attribute");
+    TOKEN_RAW = PyUnicode_FromString("raw");
+    TOKEN_ERROR = PyUnicode_FromString("error");
+    KEY_ID = PyUnicode_FromString("id");
+    KEY_CONTENT = PyUnicode_FromString("content");
+}
@@ -16,6 +16,15 @@
 
 from __future__ import unicode_literals
 
+import cPickle
+import hashlib
+import os
+import tempfile
+
+import foundations.common
+import foundations.environment
+import foundations.exceptions
+import foundations.io
 import foundations.verbose
 
 __author__ = "Thomas Mansencal"
@@ -25,7 +34,7 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Cache"]
+__all__ = ["LOGGER", "Cache", "PersistentCache"]
 
 LOGGER = foundations.verbose.install_logger()
 
@@ -144,3 +153,302 @@ class Cache(dict):
 
         self.clear()
         return True
+
+
+class PersistentCache(object):
+    """
+    | Defines an on disk cache object storing pickled content into given directory.
+    | The least recently used content is evicted whenever the cache size exceeds the maximum size.
+    """
+
+    def __init__(self, directory=None, maximum_size=67108864):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/Cache")
+            >>> cache.add_content(("John", "Doe"), {"Luke": "Skywalker"})
+            True
+            >>> cache.get_content(("John", "Doe"))
+            {'Luke': 'Skywalker'}
+
+        :param directory: Cache directory, defaults to the user Application data directory.
+        :type directory: unicode
+        :param maximum_size: Cache maximum size in bytes.
+        :type maximum_size: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__directory = None
+        self.directory = directory or os.path.join(foundations.environment.get_user_application_data_directory(),
+                                                   "cache")
+        self.__maximum_size = None
+        self.maximum_size = maximum_size
+
+        self.__size = None
+
+    @property
+    def directory(self):
+        """
+        Property for **self.__directory** attribute.
+
+        :return: self.__directory.
+        :rtype: unicode
+        """
+
+        return self.__directory
+
+    @directory.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def directory(self, value):
+        """
+        Setter for **self.__directory** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        if value is not None:
+            assert type(value) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
+                "directory", value)
+        self.__directory = value
+        self.__size = None
+
+    @directory.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def directory(self):
+        """
+        Deleter for **self.__directory** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "directory"))
+
+    @property
+    def maximum_size(self):
+        """
+        Property for **self.__maximum_size** attribute.
+
+        :return: self.__maximum_size.
+        :rtype: int
+        """
+
+        return self.__maximum_size
+
+    @maximum_size.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_size(self, value):
+        """
+        Setter for **self.__maximum_size** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) in (int, long), "'{0}' attribute: '{1}' type is not 'int' or 'long'!".format(
+                "maximum_size", value)
+            assert value > 0, "'{0}' attribute: '{1}' need to be exactly positive!".format("maximum_size", value)
+        self.__maximum_size = value
+
+    @maximum_size.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_size(self):
+        """
+        Deleter for **self.__maximum_size** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_size"))
+
+    def __get_path(self, key):
+        """
+        Returns given key content file path.
+
+        :param key: Content key.
+        :type key: object
+        :return: Content file path.
+        :rtype: unicode
+        """
+
+        return os.path.join(self.__directory, "{0}.pkl".format(hashlib.sha1(repr(key)).hexdigest()))
+
+    def __get_entries(self):
+        """
+        Returns the cache content files paths, access times and sizes.
+
+        :return: Content files paths, access times and sizes.
+        :rtype: list
+        """
+
+        entries = []
+        if not foundations.common.path_exists(self.__directory):
+            return entries
+
+        for file in os.listdir(self.__directory):
+            if not file.endswith(".pkl"):
+                continue
+
+            path = os.path.join(self.__directory, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+    def __evict(self):
+        """
+        Evicts the least recently used content until the cache size fits the maximum size.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        entries = sorted(self.__get_entries(), key=lambda x: x[1])
+        self.__size = sum(entry[2] for entry in entries)
+        for path, access_time, size in entries:
+            if self.__size <= self.__maximum_size:
+                break
+
+            LOGGER.debug("> Evicting '{0}' cache content.".format(path))
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.__size -= size
+        return True
+
+    def add_content(self, key, value):
+        """
+        Adds given content to the cache.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/Cache")
+            >>> cache.add_content("John", "Doe")
+            True
+
+        :param key: Content key.
+        :type key: object
+        :param value: Content, must be picklable.
+        :type value: object
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Adding '{0}' content to the cache.".format(key))
+
+        foundations.io.set_directory(self.__directory)
+
+        path = self.__get_path(key)
+        file_descriptor, temporary_path = tempfile.mkstemp(suffix=".tmp", dir=self.__directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                cPickle.dump(value, file, cPickle.HIGHEST_PROTOCOL)
+            replaced_size = os.path.getsize(path) if foundations.common.path_exists(path) else 0
+            foundations.io._replace_file(temporary_path, path)
+        except (OSError, cPickle.PicklingError, TypeError) as error:
+            foundations.common.path_exists(temporary_path) and os.remove(temporary_path)
+            LOGGER.warning("!> {0} | Cannot add '{1}' content to the cache: '{2}'.".format(
+                self.__class__.__name__, key, error))
+            return False
+
+        if self.__size is None:
+            self.__evict()
+        else:
+            self.__size += os.path.getsize(path) - replaced_size
+            if self.__size > self.__maximum_size:
+                self.__evict()
+        return True
+
+    def remove_content(self, *keys):
+        """
+        Removes given content from the cache.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/Cache")
+            >>> cache.add_content("John", "Doe")
+            True
+            >>> cache.remove_content("John")
+            True
+
+        :param \*keys: Content to remove.
+        :type \*keys: \*
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Removing '{0}' content from the cache.".format(keys))
+
+        for key in keys:
+            path = self.__get_path(key)
+            if foundations.common.path_exists(path):
+                if self.__size is not None:
+                    self.__size -= os.path.getsize(path)
+                os.remove(path)
+        return True
+
+    def get_content(self, key, default=None):
+        """
+        Gets given content from the cache.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/Cache")
+            >>> cache.add_content("John", "Doe")
+            True
+            >>> cache.get_content("John")
+            'Doe'
+
+        :param key: Content to retrieve.
+        :type key: object
+        :param default: Default return value.
+        :type default: object
+        :return: Content.
+        :rtype: object
+        """
+
+        LOGGER.debug("> Retrieving '{0}' content from the cache.".format(key))
+
+        path = self.__get_path(key)
+        if not foundations.common.path_exists(path):
+            return default
+
+        try:
+            with open(path, "rb") as file:
+                value = cPickle.load(file)
+            os.utime(path, None)
+            return value
+        except Exception as error:
+            LOGGER.warning("!> {0} | Cannot retrieve '{1}' content from the cache: '{2}'.".format(
+                self.__class__.__name__, key, error))
+            self.remove_content(key)
+            return default
+
+    def flush_content(self):
+        """
+        Flushes the cache content.
+
+        Usage::
+
+            >>> cache = PersistentCache("/tmp/Cache")
+            >>> cache.add_content("John", "Doe")
+            True
+            >>> cache.flush_content()
+            True
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Flushing cache content.")
+
+        for path, access_time, size in self.__get_entries():
+            os.remove(path)
+        self.__size = 0
+        return True
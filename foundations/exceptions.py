@@ -463,6 +463,16 @@ class AbstractError(Exception):
 
         return str(self.__value)
 
+    def __reduce__(self):
+        """
+        Reduces the exception for pickling.
+
+        :return: Exception class, initialization arguments.
+        :rtype: tuple
+        """
+
+        return (self.__class__, (self.__value,))
+
 
 class ExecutionError(AbstractError):
     """
@@ -567,6 +577,16 @@ class AttributeStructureParsingError(AbstractParsingError):
         else:
             return str(self.value)
 
+    def __reduce__(self):
+        """
+        Reduces the exception for pickling.
+
+        :return: Exception class, initialization arguments.
+        :rtype: tuple
+        """
+
+        return (self.__class__, (self.value, self.__line))
+
 
 class AbstractIOError(AbstractError):
     """
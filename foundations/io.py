@@ -17,8 +17,11 @@
 from __future__ import unicode_literals
 
 import codecs
+import ctypes
 import os
+import platform
 import shutil
+import tempfile
 import urllib2
 
 import foundations.common
@@ -179,6 +182,52 @@ class File(object):
                 return True
         return False
 
+    def stream(self, mode="r", encoding=Constants.default_codec, errors=Constants.codec_error):
+        """
+        | Defines a generator used to read given file content line by line.
+        | Contrary to :meth:`File.cache` method, the content is not stored in the content cache,
+            allowing large files to be processed in constant memory.
+
+        Usage::
+
+            >>> file = File(u"file.txt")
+            >>> for line in file.stream():
+            ...     print(line)
+            Some file content ...
+            ... ready to be saved!
+
+        :param mode: File read mode.
+        :type mode: unicode
+        :param encoding: File encoding codec.
+        :type encoding: unicode
+        :param errors: File encoding errors handling.
+        :type errors: unicode
+        :return: Line.
+        :rtype: unicode
+        """
+
+        if foundations.strings.is_website(self.__path):
+            try:
+                LOGGER.debug("> Streaming '{0}' online file content.".format(self.__path))
+                handle = urllib2.urlopen(self.__path)
+            except urllib2.URLError as error:
+                raise foundations.exceptions.UrlReadError(
+                    "!> {0} | '{1}' url is not readable: '{2}'.".format(self.__class__.__name__, self.__path, error))
+            try:
+                for line in handle:
+                    yield line
+            finally:
+                handle.close()
+        elif foundations.common.path_exists(self.__path):
+            if not is_readable(self.__path):
+                raise foundations.exceptions.FileReadError(
+                    "!> {0} | '{1}' file is not readable!".format(self.__class__.__name__, self.__path))
+
+            with codecs.open(self.__path, mode, encoding, errors) as file:
+                LOGGER.debug("> Streaming '{0}' file content.".format(self.__path))
+                for line in file:
+                    yield line
+
     def uncache(self):
         """
         Uncaches the cached content.
@@ -202,11 +251,15 @@ class File(object):
 
         return "".join(self.__content) if self.cache() else ""
 
-    @foundations.exceptions.handle_exceptions(foundations.exceptions.UrlWriteError,
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError,
+                                              foundations.exceptions.UrlWriteError,
                                               foundations.exceptions.FileWriteError)
-    def write(self, mode="w", encoding=Constants.default_codec, errors=Constants.codec_error):
+    def write(self, mode="w", encoding=Constants.default_codec, errors=Constants.codec_error, atomic=False):
         """
-        Writes content to defined file.
+        | Writes content to defined file.
+        | The content is joined and written at once, in atomic mode it is written into a temporary file
+            that is then renamed to defined file so that readers never see a partially written file, the existing
+            file being replaced in a single step on Windows too, only the *w* and *wb* modes are supported.
 
         :param mode: File write mode.
         :type mode: unicode
@@ -214,6 +267,8 @@ class File(object):
         :type encoding: unicode
         :param errors: File encoding errors handling.
         :type errors: unicode
+        :param atomic: Write into a temporary file renamed to defined file.
+        :type atomic: bool
         :return: Method success.
         :rtype: bool
         """
@@ -222,17 +277,45 @@ class File(object):
             raise foundations.exceptions.UrlWriteError(
                 "!> {0} | '{1}' url is not writable!".format(self.__class__.__name__, self.__path))
 
-        if foundations.common.path_exists(self.__path):
+        if atomic and mode not in ("w", "wb"):
+            raise foundations.exceptions.ProgrammingError(
+                "!> {0} | '{1}' mode is not supported in atomic mode!".format(self.__class__.__name__, mode))
+
+        path_exists = foundations.common.path_exists(self.__path)
+        if path_exists:
             if not is_writable(self.__path):
                 raise foundations.exceptions.FileWriteError(
                     "!> {0} | '{1}' file is not writable!".format(self.__class__.__name__, self.__path))
 
-        with codecs.open(self.__path, mode, encoding, errors) as file:
-            LOGGER.debug("> Writing '{0}' file content.".format(self.__path))
-            for line in self.__content:
-                file.write(line)
-            return True
-        return False
+        if not atomic:
+            with codecs.open(self.__path, mode, encoding, errors) as file:
+                LOGGER.debug("> Writing '{0}' file content.".format(self.__path))
+                file.write("".join(self.__content))
+                return True
+            return False
+
+        file_descriptor, temporary_path = tempfile.mkstemp(prefix=".{0}.".format(os.path.basename(self.__path)),
+                                                           suffix=".tmp",
+                                                           dir=os.path.dirname(os.path.abspath(self.__path)))
+        os.close(file_descriptor)
+        try:
+            with codecs.open(temporary_path, mode, encoding, errors) as file:
+                LOGGER.debug("> Writing '{0}' file content to '{1}' temporary file.".format(self.__path,
+                                                                                         temporary_path))
+                file.write("".join(self.__content))
+
+            if path_exists:
+                shutil.copymode(self.__path, temporary_path)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temporary_path, 0o666 & ~umask)
+            _replace_file(temporary_path, self.__path)
+        except Exception as error:
+            foundations.common.path_exists(temporary_path) and os.remove(temporary_path)
+            raise foundations.exceptions.FileWriteError(
+                "!> {0} | '{1}' file cannot be written: '{2}'.".format(self.__class__.__name__, self.__path, error))
+        return True
 
     @foundations.exceptions.handle_exceptions(foundations.exceptions.UrlWriteError,
                                               foundations.exceptions.FileWriteError)
@@ -364,6 +447,28 @@ def remove(path):
             "!> {0} | Cannot remove '{1}' path: '{2}'".format(__name__, path, error))
 
 
+def _replace_file(source, target):
+    """
+    | Renames given source file to given target file, replacing it in a single step if it exists.
+    | :func:`os.rename` definition refuses to replace an existing file on Windows, *MoveFileExW* function
+        is used there instead.
+
+    :param source: Source file.
+    :type source: unicode
+    :param target: Target file.
+    :type target: unicode
+    """
+
+    if platform.system() == "Windows" or platform.system() == "Microsoft":
+        # "MOVEFILE_REPLACE_EXISTING" and "MOVEFILE_WRITE_THROUGH" flags.
+        if not ctypes.windll.kernel32.MoveFileExW(foundations.verbose.to_unicode(source),
+                                                  foundations.verbose.to_unicode(target),
+                                                  0x1 | 0x8):
+            raise ctypes.WinError()
+    else:
+        os.rename(source, target)
+
+
 def is_readable(path):
     """
     Returns if given path is readable.
@@ -18,10 +18,28 @@
 from __future__ import unicode_literals
 
 import base64
+import binascii
+import bisect
+import codecs
+import collections
 import datetime
+import fnmatch
+import hashlib
+import itertools
+import mmap
+import multiprocessing
+import multiprocessing.pool
+import os
 import re
+import struct
 import sys
-from xml.etree import ElementTree
+
+from xml.parsers import expat
+
+try:
+    from xml.etree import cElementTree as ElementTree
+except ImportError:
+    from xml.etree import ElementTree
 
 if sys.version_info[:2] <= (2, 6):
     from ordereddict import OrderedDict
@@ -36,6 +54,12 @@ import foundations.namespace
 import foundations.strings
 import foundations.verbose
 import foundations.walkers
+from foundations.globals.constants import Constants
+
+try:
+    from foundations import _parsers
+except ImportError:
+    _parsers = None
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -44,7 +68,19 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "AttributeCompound", "SectionsFileParser", "PlistFileParser", "get_attribute_compound"]
+__all__ = ["LOGGER",
+           "AttributeCompound",
+           "AttributeCompoundRecord",
+           "SectionsFileChanges",
+           "SectionAttributes",
+           "SectionsFileParser",
+           "PlistData",
+           "PlistFileParser",
+           "PlistFilesStore",
+           "get_attribute_compound",
+           "get_attribute_compounds",
+           "parse_sections_files",
+           "parse_plist_files"]
 
 LOGGER = foundations.verbose.install_logger()
 
@@ -83,6 +119,481 @@ class AttributeCompound(foundations.data_structures.Structure):
         foundations.data_structures.Structure.__init__(self, **kwargs)
 
 
+class AttributeCompoundRecord(collections.namedtuple("AttributeCompoundRecord",
+                                                     ("name", "value", "link", "type", "alias"))):
+    """
+    | Defines an immutable storage object for attributes compounds, returned by
+        :func:`get_attribute_compounds` definition.
+    | Contrary to :class:`AttributeCompound` class, the fields are stored once into a slotted tuple.
+
+    Usage::
+
+        >>> AttributeCompoundRecord(name="showCamerasDialog",
+        ...                         value="0",
+        ...                         link="@showCamerasDialog",
+        ...                         type="Boolean",
+        ...                         alias="Cameras Selection Dialog").link
+        u'@showCamerasDialog'
+    """
+
+    __slots__ = ()
+
+
+class SectionsFileChanges(foundations.data_structures.Structure):
+    """
+    Defines a storage object for the changes reported by :meth:`SectionsFileParser.reparse` method.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the class.
+
+        Usage::
+
+            SectionsFileChanges(added_sections=["Section C"],
+                                removed_sections=[],
+                                modified_sections=["Section A"],
+                                added_attributes=[("Section A", "Section A|Attribute 3"),
+                                                  ("Section C", "Section C|Attribute 1")],
+                                removed_attributes=[],
+                                modified_attributes=[("Section A", "Section A|Attribute 1")])
+
+        :param \*\*kwargs: added_sections, removed_sections, modified_sections,
+            added_attributes, removed_attributes, modified_attributes.
+        :type \*\*kwargs: dict
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        foundations.data_structures.Structure.__init__(self, **kwargs)
+
+    def __nonzero__(self):
+        """
+        Returns if changes have been reported.
+
+        :return: Changes reported.
+        :rtype: bool
+        """
+
+        return any(self.values())
+
+
+class SectionAttributes(object):
+    """
+    | Defines a compact mapping storing a section attributes, used by :class:`SectionsFileParser` class
+        when its :obj:`SectionsFileParser.compact_storage` attribute is set.
+    | Attributes names are stored without the section namespace and interned into given names table shared
+        by the sections, the namespaced attributes names are built again on access.
+    | The class is registered as a :class:`collections.MutableMapping` class virtual subclass instead of
+        inheriting from it, the abstract base classes not defining **__slots__** on Python 2 which would
+        give a **__dict__** and **__weakref__** to each instance.
+    """
+
+    __slots__ = ("__prefix", "__names", "__keys", "__values")
+
+    def __init__(self, prefix=None, names=None, items=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> names = {}
+            >>> section_attributes = SectionAttributes("Section A|", names)
+            >>> section_attributes["Section A|Attribute 1"] = "Value A"
+            >>> section_attributes.items()
+            [(u'Section A|Attribute 1', u'Value A')]
+            >>> names
+            {u'Attribute 1': u'Attribute 1'}
+
+        :param prefix: Namespace prefix stripped from the attributes names.
+        :type prefix: unicode
+        :param names: Names table used to intern the attributes names.
+        :type names: dict
+        :param items: Initial attributes, values.
+        :type items: dict or list
+        """
+
+        # --- Setting class attributes. ---
+        self.__prefix = prefix
+        self.__names = {} if names is None else names
+        self.__keys = []
+        self.__values = {}
+
+        items and self.update(items)
+
+    @property
+    def prefix(self):
+        """
+        Property for **self.__prefix** attribute.
+
+        :return: self.__prefix.
+        :rtype: unicode
+        """
+
+        return self.__prefix
+
+    @prefix.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def prefix(self, value):
+        """
+        Setter for **self.__prefix** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "prefix"))
+
+    @prefix.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def prefix(self):
+        """
+        Deleter for **self.__prefix** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "prefix"))
+
+    def __get_name(self, key):
+        """
+        Returns the stored name of given attribute.
+
+        :param key: Attribute.
+        :type key: unicode
+        :return: Stored name.
+        :rtype: unicode or tuple
+        """
+
+        prefix = self.__prefix
+        if prefix is None:
+            return key
+
+        if isinstance(key, basestring) and key.startswith(prefix):
+            return key[len(prefix):]
+        return (key,)
+
+    def __get_key(self, name):
+        """
+        Returns the attribute of given stored name.
+
+        :param name: Stored name.
+        :type name: unicode or tuple
+        :return: Attribute.
+        :rtype: unicode
+        """
+
+        if type(name) is tuple:
+            return name[0]
+        return name if self.__prefix is None else self.__prefix + name
+
+    def __getitem__(self, key):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__getitem__` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :return: Value.
+        :rtype: object
+        """
+
+        return self.__values[self.__get_name(key)]
+
+    def __setitem__(self, key, value):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__setitem__` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :param value: Value.
+        :type value: object
+        """
+
+        name = self.__get_name(key)
+        if name not in self.__values:
+            if type(name) is not tuple:
+                name = self.__names.setdefault(name, name)
+            self.__keys.append(name)
+        self.__values[name] = value
+
+    def __delitem__(self, key):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__delitem__` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        """
+
+        name = self.__get_name(key)
+        del self.__values[name]
+        self.__keys.remove(name)
+
+    def __iter__(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__iter__` method.
+
+        :return: Attributes iterator.
+        :rtype: object
+        """
+
+        for name in self.__keys:
+            yield self.__get_key(name)
+
+    def __contains__(self, key):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__contains__` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :return: Attribute existence.
+        :rtype: bool
+        """
+
+        return self.__get_name(key) in self.__values
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__len__` method.
+
+        :return: Attributes count.
+        :rtype: int
+        """
+
+        return len(self.__values)
+
+    def __repr__(self):
+        """
+        Reimplements the :meth:`object.__repr__` method.
+
+        :return: Object representation.
+        :rtype: unicode
+        """
+
+        return "{0}({1})".format(self.__class__.__name__, self.items())
+
+    def __reduce__(self):
+        """
+        Reduces the object for pickling.
+
+        :return: Object class, initialization arguments, state.
+        :rtype: tuple
+        """
+
+        return (self.__class__, (self.__prefix, self.__names), (self.__keys, self.__values))
+
+    def __setstate__(self, state):
+        """
+        Sets the object state when unpickling.
+
+        :param state: Object state.
+        :type state: tuple
+        """
+
+        self.__keys, self.__values = state
+
+    def iteritems(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.iteritems` method.
+
+        :return: Attributes, values iterator.
+        :rtype: object
+        """
+
+        values = self.__values
+        for name in self.__keys:
+            yield self.__get_key(name), values[name]
+
+    def itervalues(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.itervalues` method.
+
+        :return: Values iterator.
+        :rtype: object
+        """
+
+        values = self.__values
+        for name in self.__keys:
+            yield values[name]
+
+    def items(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.items` method.
+
+        :return: Attributes, values.
+        :rtype: list
+        """
+
+        return list(self.iteritems())
+
+    def values(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.values` method.
+
+        :return: Values.
+        :rtype: list
+        """
+
+        return list(self.itervalues())
+
+    def iterkeys(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.iterkeys` method.
+
+        :return: Attributes iterator.
+        :rtype: object
+        """
+
+        return iter(self)
+
+    def keys(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.keys` method.
+
+        :return: Attributes.
+        :rtype: list
+        """
+
+        return list(self)
+
+    def get(self, key, default=None):
+        """
+        Reimplements the :meth:`collections.MutableMapping.get` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :param default: Default return value.
+        :type default: object
+        :return: Value.
+        :rtype: object
+        """
+
+        return self.__values.get(self.__get_name(key), default)
+
+    def __eq__(self, other):
+        """
+        | Reimplements the :meth:`collections.MutableMapping.__eq__` method.
+        | The comparison is order sensitive with other ordered attributes like with :class:`collections.OrderedDict`.
+
+        :param other: Other mapping.
+        :type other: object
+        :return: Mappings equality.
+        :rtype: bool
+        """
+
+        if not isinstance(other, collections.Mapping):
+            return NotImplemented
+        if isinstance(other, (SectionAttributes, collections.OrderedDict)):
+            return list(self.iteritems()) == list(other.items())
+        return dict(self.iteritems()) == dict(other.items())
+
+    def __ne__(self, other):
+        """
+        Reimplements the :meth:`collections.MutableMapping.__ne__` method.
+
+        :param other: Other mapping.
+        :type other: object
+        :return: Mappings inequality.
+        :rtype: bool
+        """
+
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def update(self, items=(), **kwargs):
+        """
+        Reimplements the :meth:`collections.MutableMapping.update` method.
+
+        :param items: Mapping or attributes, values pairs.
+        :type items: dict or list
+        :param \*\*kwargs: Attributes, values.
+        :type \*\*kwargs: dict
+        """
+
+        if isinstance(items, collections.Mapping):
+            items = items.iteritems()
+        elif hasattr(items, "keys"):
+            items = ((key, items[key]) for key in items.keys())
+
+        for key, value in items:
+            self[key] = value
+        for key, value in kwargs.iteritems():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        """
+        Reimplements the :meth:`collections.MutableMapping.setdefault` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :param default: Default value.
+        :type default: object
+        :return: Value.
+        :rtype: object
+        """
+
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        """
+        Reimplements the :meth:`collections.MutableMapping.pop` method.
+
+        :param key: Attribute.
+        :type key: unicode
+        :param \*default: Default return value.
+        :type \*default: \*
+        :return: Value.
+        :rtype: object
+        """
+
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.popitem` method.
+
+        :return: Attribute, value.
+        :rtype: tuple
+        """
+
+        if not self.__keys:
+            raise KeyError("popitem(): mapping is empty")
+
+        key = self.__get_key(self.__keys[-1])
+        return key, self.pop(key)
+
+    def clear(self):
+        """
+        Reimplements the :meth:`collections.MutableMapping.clear` method.
+        """
+
+        self.__keys = []
+        self.__values = {}
+
+    def copy(self):
+        """
+        Returns a shallow copy of the object.
+
+        :return: Object copy.
+        :rtype: SectionAttributes
+        """
+
+        return self.__class__(self.__prefix, self.__names, self.iteritems())
+
+
+collections.MutableMapping.register(SectionAttributes)
+
+
 class SectionsFileParser(foundations.io.File):
     """
     Defines methods to parse sections file format files,
@@ -112,7 +623,9 @@ class SectionsFileParser(foundations.io.File):
                  quotation_markers=("\"", "'", "`"),
                  raw_section_content_identifier="__raw__",
                  defaults_section="_defaults",
-                 preserve_order=True):
+                 preserve_order=True,
+                 compact_storage=False,
+                 maximum_parsing_errors=None):
         """
         Initializes the class.
 
@@ -147,6 +660,10 @@ class SectionsFileParser(foundations.io.File):
         :type defaults_section: unicode
         :param preserve_order: Data order is preserved.
         :type preserve_order: bool
+        :param compact_storage: Sections attributes are stored using :class:`SectionAttributes` class.
+        :type compact_storage: bool
+        :param maximum_parsing_errors: Maximum parsing errors count collected, further errors are discarded.
+        :type maximum_parsing_errors: int
         """
 
         LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -170,6 +687,10 @@ class SectionsFileParser(foundations.io.File):
         self.defaults_section = defaults_section
         self.__preserve_order = None
         self.preserve_order = preserve_order
+        self.__compact_storage = None
+        self.compact_storage = compact_storage
+        self.__maximum_parsing_errors = None
+        self.maximum_parsing_errors = maximum_parsing_errors
 
         if not preserve_order:
             self.__sections = {}
@@ -178,6 +699,20 @@ class SectionsFileParser(foundations.io.File):
             self.__sections = OrderedDict()
             self.__comments = OrderedDict()
         self.__parsing_errors = []
+        self.__parsing_errors_records = []
+
+        self.__grammar = None
+        self.__buffer_grammar = None
+
+        self.__sections_index = None
+        self.__sections_offsets = None
+        self.__sections_options = None
+
+        self.__parse_options = None
+        self.__sections_chunks = None
+
+        self.__attributes_names = {}
+        self.__attributes_index = {}
 
     @property
     def splitters(self):
@@ -463,6 +998,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: OrderedDict or dict
         """
 
+        self.__load_sections()
         return self.__sections
 
     @sections.setter
@@ -481,9 +1017,12 @@ class SectionsFileParser(foundations.io.File):
             for key, element in value.iteritems():
                 assert type(key) is unicode, "'{0}' attribute: '{1}' type is not 'unicode'!".format(
                     "sections", key)
-                assert type(element) in (OrderedDict, dict), "'{0}' attribute: '{1}' type is not \
-                'OrderedDict' or 'dict'!".format("sections", key)
+                assert type(element) in (OrderedDict, dict, SectionAttributes), "'{0}' attribute: '{1}' type \
+                is not 'OrderedDict', 'dict' or 'SectionAttributes'!".format("sections", key)
         self.__sections = value
+        self.__sections_chunks = None
+        self.__attributes_index = {}
+        self.__sections_index = None
 
     @sections.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -504,6 +1043,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: OrderedDict or dict
         """
 
+        self.__load_sections()
         return self.__comments
 
     @comments.setter
@@ -539,12 +1079,18 @@ class SectionsFileParser(foundations.io.File):
     @property
     def parsing_errors(self):
         """
-        Property for **self.__parsing_errors** attribute.
+        | Property for **self.__parsing_errors** attribute.
+        | The parsing errors records collected while parsing are converted to
+            :class:`foundations.exceptions.AttributeStructureParsingError` class instances on first access.
 
         :return: self.__parsing_errors.
         :rtype: list
         """
 
+        self.__load_sections()
+        if self.__parsing_errors_records:
+            self.__parsing_errors.extend(self.__get_parsing_error(record) for record in self.__parsing_errors_records)
+            self.__parsing_errors_records = []
         return self.__parsing_errors
 
     @parsing_errors.setter
@@ -564,6 +1110,7 @@ class SectionsFileParser(foundations.io.File):
                     "'{0}' attribute: '{1}' is not a '{2}' subclass!".format(
                         "parsing_errors", element, foundations.exceptions.AbstractParsingError.__class__.__name__)
         self.__parsing_errors = value
+        self.__parsing_errors_records = []
 
     @parsing_errors.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -610,30 +1157,105 @@ class SectionsFileParser(foundations.io.File):
         raise foundations.exceptions.ProgrammingError(
             "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "preserve_order"))
 
-    def __getitem__(self, section):
+    @property
+    def compact_storage(self):
         """
-        Reimplements the :meth:`object.__getitem__` method.
+        Property for **self.__compact_storage** attribute.
 
-        :param section: Section name.
-        :type section: unicode
-        :return: Layout.
-        :rtype: Layout
+        :return: self.__compact_storage.
+        :rtype: bool
         """
 
-        return self.__sections.__getitem__(section)
+        return self.__compact_storage
 
-    def __setitem__(self, section, value):
+    @compact_storage.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def compact_storage(self, value):
         """
-        Reimplements the :meth:`object.__getitem__` method.
+        Setter method for **self.__compact_storage** attribute.
 
-        :param section: Section name.
-        :type section: unicode
+        :param value: Attribute value.
+        :type value: bool
+        """
+
+        if value is not None:
+            assert type(value) is bool, "'{0}' attribute: '{1}' type is not 'bool'!".format("compact_storage", value)
+        self.__compact_storage = value
+
+    @compact_storage.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def compact_storage(self):
+        """
+        Deleter method for **self.__compact_storage** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "compact_storage"))
+
+    @property
+    def maximum_parsing_errors(self):
+        """
+        Property for **self.__maximum_parsing_errors** attribute.
+
+        :return: self.__maximum_parsing_errors.
+        :rtype: int
+        """
+
+        return self.__maximum_parsing_errors
+
+    @maximum_parsing_errors.setter
+    @foundations.exceptions.handle_exceptions(AssertionError)
+    def maximum_parsing_errors(self, value):
+        """
+        Setter method for **self.__maximum_parsing_errors** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        if value is not None:
+            assert type(value) is int, "'{0}' attribute: '{1}' type is not 'int'!".format(
+                "maximum_parsing_errors", value)
+            assert value >= 0, "'{0}' attribute: '{1}' need to be positive!".format("maximum_parsing_errors", value)
+        self.__maximum_parsing_errors = value
+
+    @maximum_parsing_errors.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def maximum_parsing_errors(self):
+        """
+        Deleter method for **self.__maximum_parsing_errors** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "maximum_parsing_errors"))
+
+    def __getitem__(self, section):
+        """
+        Reimplements the :meth:`object.__getitem__` method.
+
+        :param section: Section name.
+        :type section: unicode
+        :return: Layout.
+        :rtype: Layout
+        """
+
+        self.__load_section(section)
+        return self.__sections.__getitem__(section)
+
+    def __setitem__(self, section, value):
+        """
+        Reimplements the :meth:`object.__getitem__` method.
+
+        :param section: Section name.
+        :type section: unicode
         :param section: Value.
         :type section: dict
         :return: Layout.
         :rtype: Layout
         """
 
+        if self.__sections_index:
+            self.__sections_index.pop(section, None)
         return self.__sections.__setitem__(section, value)
 
     def __iter__(self):
@@ -644,6 +1266,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: object
         """
 
+        self.__load_sections()
         return self.__sections.iteritems()
 
     def __contains__(self, section):
@@ -666,8 +1289,146 @@ class SectionsFileParser(foundations.io.File):
         :rtype: int
         """
 
+        self.__load_sections()
         return len(self.__sections)
 
+    def __get_attributes_container(self, section, namespaces=True):
+        """
+        Returns a container for given section attributes.
+
+        :param section: Section.
+        :type section: unicode
+        :param namespaces: Attributes are namespaced.
+        :type namespaces: bool
+        :return: Attributes container.
+        :rtype: OrderedDict or dict or SectionAttributes
+        """
+
+        if self.__compact_storage:
+            return SectionAttributes("{0}{1}".format(section, self.__namespace_splitter) if namespaces else None,
+                                     self.__attributes_names)
+        return {} if not self.__preserve_order else OrderedDict()
+
+    def __collect_tokens(self, tokens, namespaces=True):
+        """
+        Collects given tokens into sections, comments and parsing errors.
+
+        :param tokens: Tokens yielded by :meth:`SectionsFileParser.__tokenize` method.
+        :type tokens: generator
+        :param namespaces: Attributes are namespaced.
+        :type namespaces: bool
+        :return: Sections, comments, parsing errors.
+        :rtype: tuple
+        """
+
+        sections = {} if not self.__preserve_order else OrderedDict()
+        comments = OrderedDict()
+        parsing_errors = []
+        attributes = self.__get_attributes_container(self.__defaults_section, namespaces)
+        stored_attributes = None
+        raw_content = []
+        for token, section, key, value in tokens:
+            if token == "section":
+                attributes = self.__get_attributes_container(section, namespaces)
+                raw_content = []
+                continue
+            elif token == "comment":
+                comments[key] = value
+                continue
+            elif token == "attribute":
+                attributes[key] = value
+            elif token == "raw":
+                raw_content.append(value)
+                attributes[key] = raw_content
+            elif self.__maximum_parsing_errors is None or len(parsing_errors) < self.__maximum_parsing_errors:
+                parsing_errors.append(value)
+
+            if attributes is not stored_attributes:
+                sections[section] = stored_attributes = attributes
+        return sections, comments, parsing_errors
+
+    def __get_cache_key(self, *args):
+        """
+        Returns the persistent cache key for the current parser configuration and given parsing options.
+
+        :param \*args: Parsing options.
+        :type \*args: \*
+        :return: Cache key.
+        :rtype: tuple
+        """
+
+        return (self.__class__.__name__,
+                os.path.abspath(self.path),
+                tuple(self.__splitters),
+                self.__namespace_splitter,
+                tuple(self.__comment_limiters),
+                self.__comment_marker,
+                tuple(self.__quotation_markers),
+                self.__raw_section_content_identifier,
+                self.__defaults_section,
+                self.__preserve_order,
+                self.__compact_storage,
+                self.__maximum_parsing_errors) + \
+               tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+
+    def __merge_parsing_results(self, sections, comments, parsing_errors, raise_parsing_errors):
+        """
+        Merges given parsing results into the class attributes.
+
+        :param sections: Parsed sections.
+        :type sections: dict
+        :param comments: Parsed comments.
+        :type comments: OrderedDict
+        :param parsing_errors: Parsing errors.
+        :type parsing_errors: list
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :return: SectionFileParser instance.
+        :rtype: SectionFileParser
+        """
+
+        self.__sections.update(sections)
+        self.__comments.update(comments)
+        self.__add_parsing_errors(parsing_errors)
+
+        if (self.__parsing_errors or self.__parsing_errors_records) and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
+
+        return self
+
+    def __add_parsing_errors(self, parsing_errors):
+        """
+        Adds given parsing errors records, discarding those exceeding
+        :obj:`SectionsFileParser.maximum_parsing_errors` class property.
+
+        :param parsing_errors: Parsing errors records.
+        :type parsing_errors: list or tuple
+        """
+
+        if self.__maximum_parsing_errors is not None:
+            parsing_errors = parsing_errors[:max(0, self.__maximum_parsing_errors - len(self.__parsing_errors) -
+                                                 len(self.__parsing_errors_records))]
+        self.__parsing_errors_records.extend(parsing_errors)
+
+    def __get_parsing_error(self, record):
+        """
+        Returns the parsing error of given parsing error record.
+
+        :param record: Parsing error record: line number, error kind and line content.
+        :type record: tuple
+        :return: Parsing error.
+        :rtype: AttributeStructureParsingError
+        """
+
+        if isinstance(record, foundations.exceptions.AbstractParsingError):
+            return record
+
+        line, kind, content = record
+        return foundations.exceptions.AttributeStructureParsingError(
+            "{0} structure is invalid: {1}".format(kind.title(), content), line)
+
     @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
     def parse(self,
               raw_sections=None,
@@ -675,10 +1436,24 @@ class SectionsFileParser(foundations.io.File):
               strip_comments=True,
               strip_whitespaces=True,
               strip_quotation_markers=True,
-              raise_parsing_errors=True):
+              raise_parsing_errors=True,
+              lazy=False,
+              cache=None,
+              memory_map=False):
         """
-        Process the file content and extracts the sections / attributes
+        | Process the file content and extracts the sections / attributes
             as nested :class:`collections.OrderedDict` dictionaries or dictionaries.
+        | In lazy mode, only the sections offsets are indexed by a fast first pass over the file,
+            a section content being parsed on first access. Lazy mode requires the content not to be cached
+            and the parsing errors not to be raised, standard parsing being used otherwise: parsing errors are
+            collected as the sections are parsed, accessing the comments or the parsing errors parses
+            the remaining sections.
+        | If a :class:`foundations.cache.PersistentCache` class instance is given, the parsing results are stored
+            into it and retrieved on subsequent parsing as long as the file modification time and size are unchanged.
+        | In memory map mode, the lines are classified directly on the memory mapped file bytes, only the kept
+            sections names, attributes, values and comments being decoded. Memory map mode requires the content
+            not to be cached, the file to be encoded with default codec and the splitters and comment limiters
+            to be ASCII characters, standard parsing being used otherwise.
 
         Usage::
 
@@ -718,84 +1493,852 @@ class SectionsFileParser(foundations.io.File):
         :type strip_quotation_markers: bool
         :param raise_parsing_errors: Raise parsing errors.
         :type raise_parsing_errors: bool
+        :param lazy: Sections are parsed on first access.
+        :type lazy: bool
+        :param cache: Persistent cache used to store the parsing results.
+        :type cache: PersistentCache
+        :param memory_map: Lines are classified on the memory mapped file bytes.
+        :type memory_map: bool
         :return: SectionFileParser instance.
         :rtype: SectionFileParser
         """
 
         LOGGER.debug("> Reading sections from: '{0}'.".format(self.path))
 
-        if not self.content:
-            self.read()
+        self.__parse_options = {"raw_sections": raw_sections,
+                                "namespaces": namespaces,
+                                "strip_comments": strip_comments,
+                                "strip_whitespaces": strip_whitespaces,
+                                "strip_quotation_markers": strip_quotation_markers}
+        self.__sections_chunks = None
+
+        cache_key = stamp = None
+        if cache is not None and not self.content and foundations.common.path_exists(self.path):
+            cache_key = self.__get_cache_key(raw_sections,
+                                             namespaces,
+                                             strip_comments,
+                                             strip_whitespaces,
+                                             strip_quotation_markers)
+            stat = os.stat(self.path)
+            stamp = (stat.st_mtime, stat.st_size)
+            content = cache.get_content(cache_key)
+            if content is not None:
+                if content[0] == stamp:
+                    LOGGER.debug("> Retrieving '{0}' file sections from cache.".format(self.path))
+                    return self.__merge_parsing_results(*content[1:], raise_parsing_errors=raise_parsing_errors)
+
+                cache.remove_content(cache_key)
+
+        if lazy and not self.content and not raise_parsing_errors:
+            if self.__index_sections(raw_sections=raw_sections,
+                                     namespaces=namespaces,
+                                     strip_comments=strip_comments,
+                                     strip_whitespaces=strip_whitespaces,
+                                     strip_quotation_markers=strip_quotation_markers):
+                return self
+
+            LOGGER.debug("> '{0}' file cannot be indexed, falling back to standard parsing!".format(self.path))
+
+        data = None
+        if memory_map and not self.content and self.__get_buffer_grammar() is not None:
+            data = self.__map_file(validate=True)
+            if data is None:
+                LOGGER.debug("> '{0}' file cannot be memory mapped, falling back to standard parsing!".format(
+                    self.path))
+
+        if data is not None:
+            try:
+                sections, comments, parsing_errors = self.__collect_tokens(
+                    self.__tokenize_buffer(data,
+                                           raw_sections,
+                                           namespaces,
+                                           strip_comments,
+                                           strip_whitespaces,
+                                           strip_quotation_markers),
+                    namespaces)
+            finally:
+                if data:
+                    data.close()
+        else:
+            if not self.content:
+                self.read()
+
+            sections, comments, parsing_errors = self.__collect_tokens(self.__tokenize(self.content,
+                                                                                       raw_sections,
+                                                                                       namespaces,
+                                                                                       strip_comments,
+                                                                                       strip_whitespaces,
+                                                                                       strip_quotation_markers),
+                                                                       namespaces)
+
+        LOGGER.debug("> Sections: '%s'.", sections)
+        LOGGER.debug("> '{0}' file parsing done!".format(self.path))
+
+        if cache_key is not None:
+            cache.add_content(cache_key, (stamp, sections, comments, parsing_errors))
+
+        return self.__merge_parsing_results(sections, comments, parsing_errors, raise_parsing_errors)
+
+    def reparse(self, raise_parsing_errors=True):
+        """
+        | Process the file content again using the options of the last :meth:`SectionsFileParser.parse` method call
+            and returns the changes since then.
+        | The content is split on sections headers and only the sections whose text changed since
+            the last reparse are tokenized again, the other sections are reused as is.
+        | Contrary to :meth:`SectionsFileParser.parse` method, the sections, comments and parsing errors are
+            replaced instead of being accumulated.
+
+        Usage::
+
+            >>> sections_file_parser = SectionsFileParser("standard.rc")
+            >>> sections_file_parser.parse()
+            <foundations.parsers.SectionsFileParser object at 0x860323123>
+            >>> # The 'Component|Version' attribute value is edited.
+            >>> changes = sections_file_parser.reparse()
+            >>> changes.modified_sections
+            [u'Component']
+            >>> changes.modified_attributes
+            [(u'Component', u'Component|Version')]
+
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :return: Sections changes.
+        :rtype: SectionsFileChanges
+        """
+
+        LOGGER.debug("> Reparsing sections from: '{0}'.".format(self.path))
+
+        self.__load_sections()
+
+        options = self.__parse_options or {"raw_sections": None,
+                                           "namespaces": True,
+                                           "strip_comments": True,
+                                           "strip_whitespaces": True,
+                                           "strip_quotation_markers": True}
+        if foundations.common.path_exists(self.path):
+            self.uncache()
+            self.cache()
+        lines = self.content
+
+        previous_chunks = {}
+        for chunk in self.__sections_chunks or ():
+            previous_chunks.setdefault(chunk[:2], []).append(chunk)
+
+        match = self.__get_grammar().match
+        starts = [0]
+        for i, line in enumerate(lines):
+            if i and "[" in line:
+                search = match(line)
+                if search is not None and search.group("section") is not None:
+                    starts.append(i)
+        starts.append(len(lines))
+
+        chunks = []
+        changed_chunks = []
+        comment_id = 0
+        for start, end in zip(starts[:-1], starts[1:]):
+            digest = hashlib.sha1(foundations.strings.to_string("".join(lines[start:end])).encode(
+                Constants.default_codec, Constants.codec_error)).digest()
+            chunk = None
+            candidates = previous_chunks.get((digest, comment_id), ())
+            for j, candidate in enumerate(candidates):
+                if candidate[2] == start or not candidate[5]:
+                    chunk = candidates.pop(j)
+                    break
+
+            if chunk is None:
+                chunk = (digest, comment_id, start) + \
+                        self.__collect_tokens(self.__tokenize(lines[start:end],
+                                                              comment_id=comment_id,
+                                                              line_offset=start,
+                                                              **options),
+                                              options["namespaces"])
+                changed_chunks.append(chunk)
+            chunks.append(chunk)
+            comment_id += len(chunk[4])
+
+        sections = {} if not self.__preserve_order else OrderedDict()
+        comments = OrderedDict()
+        parsing_errors = []
+        for chunk in chunks:
+            sections.update(chunk[3])
+            comments.update(chunk[4])
+            parsing_errors.extend(chunk[5])
+
+        if self.__sections_chunks is None:
+            touched_sections = set(sections).union(self.__sections)
+        else:
+            touched_sections = set()
+            for chunk in changed_chunks:
+                touched_sections.update(chunk[3])
+            for candidates in previous_chunks.itervalues():
+                for chunk in candidates:
+                    touched_sections.update(chunk[3])
+            touched_sections.update(section for section in sections if section not in touched_sections and
+                                    sections[section] != self.__sections.get(section))
+            touched_sections.update(section for section in self.__sections if section not in sections)
+
+        changes = SectionsFileChanges(added_sections=[],
+                                      removed_sections=[],
+                                      modified_sections=[],
+                                      added_attributes=[],
+                                      removed_attributes=[],
+                                      modified_attributes=[])
+        for section in [section for section in sections if section in touched_sections] + \
+                [section for section in self.__sections if section in touched_sections and section not in sections]:
+            attributes = sections.get(section)
+            previous_attributes = self.__sections.get(section)
+            if previous_attributes is None:
+                changes.added_sections.append(section)
+                changes.added_attributes.extend((section, attribute) for attribute in attributes)
+            elif attributes is None:
+                changes.removed_sections.append(section)
+                changes.removed_attributes.extend((section, attribute) for attribute in previous_attributes)
+            elif attributes != previous_attributes:
+                changes.modified_sections.append(section)
+                for attribute, value in attributes.iteritems():
+                    if attribute not in previous_attributes:
+                        changes.added_attributes.append((section, attribute))
+                    elif value != previous_attributes[attribute]:
+                        changes.modified_attributes.append((section, attribute))
+                changes.removed_attributes.extend((section, attribute) for attribute in previous_attributes
+                                                  if attribute not in attributes)
+
+        LOGGER.debug("> '{0}' sections tokenized again out of '{1}'.".format(len(changed_chunks), len(chunks)))
+
+        # The sections store copies of the chunks attributes so that the sections edited afterwards don't alter them,
+        # the untouched sections being equal to their chunk attributes are kept.
+        for section, attributes in sections.iteritems():
+            sections[section] = attributes.copy() if section in touched_sections else self.__sections[section]
+
+        self.__sections = sections
+        self.__comments = comments
+        self.__parsing_errors = []
+        self.__parsing_errors_records = []
+        self.__add_parsing_errors(parsing_errors)
+        self.__sections_chunks = chunks
+
+        if self.__parsing_errors_records and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
+
+        return changes
+
+    def iter_parse(self,
+                   raw_sections=None,
+                   namespaces=True,
+                   strip_whitespaces=True,
+                   strip_quotation_markers=True,
+                   raise_parsing_errors=True):
+        """
+        | Defines a generator used to parse the file directly from its handle, line by line.
+        | Contrary to :meth:`SectionsFileParser.parse` method, the file content is not cached and the attributes
+            are not stored in :obj:`SectionsFileParser.sections` class property, allowing large files
+            to be parsed in constant memory.
+        | Comments are skipped, raw sections content is yielded line by line using
+            :obj:`SectionsFileParser.raw_section_content_identifier` class property as attribute and parsing errors
+            are stored in :obj:`SectionsFileParser.parsing_errors` class property.
+
+        Usage::
+
+            >>> sections_file_parser = SectionsFileParser("standard.rc")
+            >>> for section, attribute, value in sections_file_parser.iter_parse(namespaces=False):
+            ...     print(section, attribute, value)
+            (u'Component', u'Name', u'core.database')
+            (u'Component', u'Title', u'Database')
+            ...
+
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes are namespaced.
+        :type namespaces: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param raise_parsing_errors: Raise parsing errors once the file has been parsed.
+        :type raise_parsing_errors: bool
+        :return: Section, attribute, value.
+        :rtype: tuple
+        """
+
+        LOGGER.debug("> Streaming sections from: '{0}'.".format(self.path))
+
+        lines = self.content if self.content else self.stream()
+        for token, section, key, value in self.__tokenize(lines,
+                                                          raw_sections,
+                                                          namespaces,
+                                                          True,
+                                                          strip_whitespaces,
+                                                          strip_quotation_markers):
+            if token == "attribute" or token == "raw":
+                yield section, key, value
+            elif token == "error":
+                self.__add_parsing_errors((value,))
+
+        LOGGER.debug("> '{0}' file streaming done!".format(self.path))
+
+        if (self.__parsing_errors or self.__parsing_errors_records) and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
+
+    def parse_attribute_compounds(self,
+                                  raw_sections=None,
+                                  namespaces=True,
+                                  strip_comments=True,
+                                  strip_whitespaces=True,
+                                  strip_quotation_markers=True,
+                                  raise_parsing_errors=True,
+                                  splitter="|",
+                                  binding_identifier="@",
+                                  cache=None):
+        """
+        | Process the file content and returns the sections attributes compounds
+            resolved with :func:`get_attribute_compounds` definition.
+        | If a :class:`foundations.cache.PersistentCache` class instance is given, the attributes compounds are
+            stored into it keyed by the file content hash: parsing an unchanged file again skips both the parsing
+            and the attributes compounds resolution, :obj:`SectionsFileParser.sections` class property
+            being left untouched in that case.
+
+        Usage::
+
+            >>> content = ["[Section A]\n", "Attribute 1 = \"@Link | Value | Boolean | Link Parameter\"\n"]
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.content = content
+            >>> attribute_compounds = sections_file_parser.parse_attribute_compounds(namespaces=False)
+            >>> attribute_compounds["Section A"]["Attribute 1"].link
+            u'@Link'
+
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :param splitter: Attributes compounds splitter.
+        :type splitter: unicode
+        :param binding_identifier: Attributes compounds binding identifier.
+        :type binding_identifier: unicode
+        :param cache: Persistent cache used to store the attributes compounds.
+        :type cache: PersistentCache
+        :return: Sections attributes compounds.
+        :rtype: OrderedDict or dict
+        """
+
+        cache_key = None
+        if cache is not None and not self.content and foundations.common.path_exists(self.path):
+            cache_key = self.__get_cache_key(raw_sections,
+                                             namespaces,
+                                             strip_comments,
+                                             strip_whitespaces,
+                                             strip_quotation_markers,
+                                             splitter,
+                                             binding_identifier,
+                                             self.__get_content_digest())
+            attribute_compounds = cache.get_content(cache_key)
+            if attribute_compounds is not None:
+                LOGGER.debug("> Retrieving '{0}' file attributes compounds from cache.".format(self.path))
+                return attribute_compounds
+
+        self.parse(raw_sections=raw_sections,
+                   namespaces=namespaces,
+                   strip_comments=strip_comments,
+                   strip_whitespaces=strip_whitespaces,
+                   strip_quotation_markers=strip_quotation_markers,
+                   raise_parsing_errors=raise_parsing_errors)
+        self.__load_sections()
+
+        attribute_compounds = OrderedDict() if self.__preserve_order else dict()
+        for section, attributes in self.__sections.iteritems():
+            attribute_compounds[section] = get_attribute_compounds(attributes, splitter, binding_identifier)
+
+        # The attributes compounds of a file with parsing errors are not cached so that the errors are reported again.
+        if cache_key is not None and not (self.__parsing_errors or self.__parsing_errors_records):
+            cache.add_content(cache_key, attribute_compounds)
+
+        return attribute_compounds
+
+    def __get_content_digest(self):
+        """
+        Returns the file content hash.
+
+        :return: File content hash.
+        :rtype: unicode
+        """
+
+        digest = hashlib.sha1()
+        with open(self.path, "rb") as file:
+            for chunk in iter(lambda: file.read(1048576), b""):
+                digest.update(chunk)
+        return foundations.strings.to_string(digest.hexdigest())
+
+    def __tokenize(self,
+                   lines,
+                   raw_sections,
+                   namespaces,
+                   strip_comments,
+                   strip_whitespaces,
+                   strip_quotation_markers,
+                   section=None,
+                   comment_id=0,
+                   line_offset=0):
+        """
+        | Defines a generator used to tokenize given lines.
+        | Yielded tokens are either *section*, *comment*, *attribute*, *raw* or *error*.
+        | If the :mod:`foundations._parsers` compiled module is available, lists of unicode lines
+            are tokenized by it at once and the tokens list is returned instead.
+
+        :param lines: Lines to tokenize.
+        :type lines: list or generator
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param section: Section the lines start into.
+        :type section: unicode
+        :param comment_id: First comment id.
+        :type comment_id: int
+        :param line_offset: Lines count preceding given lines.
+        :type line_offset: int
+        :return: Token, section, key, value.
+        :rtype: tuple
+        """
+
+        if _parsers is not None and type(lines) is list and self.__is_tokenizer_compatible(section):
+            tokens = _parsers.tokenize(lines,
+                                       "".join(self.__comment_limiters),
+                                       "".join(self.__splitters),
+                                       "".join(self.__quotation_markers),
+                                       raw_sections or [],
+                                       bool(namespaces),
+                                       bool(strip_comments),
+                                       bool(strip_whitespaces),
+                                       bool(strip_quotation_markers),
+                                       self.__namespace_splitter,
+                                       self.__comment_marker,
+                                       self.__raw_section_content_identifier,
+                                       self.__defaults_section if section is None else section,
+                                       comment_id,
+                                       line_offset)
+            if tokens is not None:
+                return tokens
+
+        match = self.__get_grammar().match
+        records = ((line, search.groups() if search is not None else None)
+                   for line, search in ((line, match(line)) for line in lines))
+        return self.__tokenize_records(records,
+                                       raw_sections,
+                                       namespaces,
+                                       strip_comments,
+                                       strip_whitespaces,
+                                       strip_quotation_markers,
+                                       section,
+                                       comment_id,
+                                       line_offset)
+
+    def __is_tokenizer_compatible(self, section=None):
+        """
+        | Returns if the current parser configuration can be tokenized by the :mod:`foundations._parsers`
+            compiled module.
+        | The compiled tokenizer does not implement the regex character classes semantics, thus the splitters
+            and comment limiters are required not to be whitespaces or character classes special characters.
+
+        :param section: Section the lines start into.
+        :type section: unicode
+        :return: Configuration is compatible.
+        :rtype: bool
+        """
+
+        for value in (self.__namespace_splitter,
+                      self.__comment_marker,
+                      self.__raw_section_content_identifier,
+                      self.__defaults_section if section is None else section):
+            if type(value) is not unicode:
+                return False
+
+        for characters in (self.__comment_limiters, self.__splitters, self.__quotation_markers):
+            if not all(type(character) is unicode for character in characters):
+                return False
+
+        return not set("".join(self.__comment_limiters) + "".join(self.__splitters)).intersection(
+            " \t\n\r\x0b\x0c[]\\^-")
+
+    def __tokenize_buffer(self,
+                          data,
+                          raw_sections,
+                          namespaces,
+                          strip_comments,
+                          strip_whitespaces,
+                          strip_quotation_markers):
+        """
+        | Defines a generator used to tokenize given default codec encoded bytes buffer.
+        | The lines are classified by the bytes grammar directly on the buffer, only the kept
+            sections names, attributes, values and comments being decoded.
+
+        :param data: Bytes buffer to tokenize.
+        :type data: mmap or str
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :return: Token, section, key, value.
+        :rtype: tuple
+        """
+
+        codec = Constants.default_codec
+
+        def get_records():
+            for search in self.__get_buffer_grammar().finditer(data):
+                comment, header, empty, attribute, value, bare_attribute, error = search.groups()
+                if error is not None:
+                    yield search, None
+                    continue
 
-        attributes = {} if not self.__preserve_order else OrderedDict()
-        section = self.__defaults_section
+                # Matched groups are never empty, unmatched ones are kept as None.
+                yield search, (comment if strip_comments else comment and unicode(comment, codec),
+                               header and unicode(header, codec),
+                               empty,
+                               attribute and unicode(attribute, codec),
+                               value and unicode(value, codec),
+                               bare_attribute and unicode(bare_attribute, codec))
+
+        return self.__tokenize_records(get_records(),
+                                       raw_sections,
+                                       namespaces,
+                                       strip_comments,
+                                       strip_whitespaces,
+                                       strip_quotation_markers,
+                                       get_line=lambda x: unicode(x.group(), codec))
+
+    def __tokenize_records(self,
+                           records,
+                           raw_sections,
+                           namespaces,
+                           strip_comments,
+                           strip_whitespaces,
+                           strip_quotation_markers,
+                           section=None,
+                           comment_id=0,
+                           line_offset=0,
+                           get_line=None):
+        """
+        | Defines a generator used to tokenize given classified lines records.
+        | Each record is a line and its grammar groups, or *None* if the line does not match the grammar.
+        | Lines are used as is unless a callable retrieving them from the records is given.
+
+        :param records: Lines records to tokenize.
+        :type records: list or generator
+        :param raw_sections: Ignored raw sections.
+        :type raw_sections: tuple or list
+        :param namespaces: Attributes and comments are namespaced.
+        :type namespaces: bool
+        :param strip_comments: Comments are stripped.
+        :type strip_comments: bool
+        :param strip_whitespaces: Whitespaces are stripped.
+        :type strip_whitespaces: bool
+        :param strip_quotation_markers: Attributes values quotation markers are stripped.
+        :type strip_quotation_markers: bool
+        :param section: Section the lines start into.
+        :type section: unicode
+        :param comment_id: First comment id.
+        :type comment_id: int
+        :param line_offset: Lines count preceding given lines.
+        :type line_offset: int
+        :param get_line: Callable returning the raw and invalid records lines.
+        :type get_line: object
+        :return: Token, section, key, value.
+        :rtype: tuple
+        """
+
+        section = self.__defaults_section if section is None else section
         raw_sections = raw_sections or []
+        quotation_markers = "".join(self.__quotation_markers)
+
+        commentId = comment_id
+        for i, (line, search) in enumerate(records, line_offset):
+            if search is not None:
+                comment, header, empty, attribute, value, bare_attribute = search
+
+                # Comments matching.
+                if comment is not None:
+                    if not strip_comments:
+                        comment_key = namespaces and foundations.namespace.set_namespace(section, "{0}{1}".format(
+                            self.__comment_marker, commentId), self.__namespace_splitter) or \
+                                      "{0}{1}".format(self.__comment_marker, commentId)
+                        yield "comment", section, comment_key, {"id": commentId,
+                                                                "content": strip_whitespaces and
+                                                                           comment.strip() or comment}
+                        commentId += 1
+                    continue
+
+                # Sections matching.
+                if header is not None:
+                    section = strip_whitespaces and header.strip() or header
+                    yield "section", section, None, None
+                    continue
 
-        commentId = 0
-        for i, line in enumerate(self.content):
-            # Comments matching.
-            search = re.search(r"^\s*[{0}](?P<comment>.+)$".format("".join(self.__comment_limiters)), line)
-            if search:
-                if not strip_comments:
-                    comment = namespaces and foundations.namespace.set_namespace(section, "{0}{1}".format(
-                        self.__comment_marker, commentId), self.__namespace_splitter) or \
-                              "{0}{1}".format(self.__comment_marker, commentId)
-                    self.__comments[comment] = {"id": commentId, "content": strip_whitespaces and
-                                                                            search.group(
-                                                                                "comment").strip() or search.group(
-                        "comment")}
-                    commentId += 1
+            if section in raw_sections:
+                yield "raw", section, self.__raw_section_content_identifier, get_line(line) if get_line else line
                 continue
 
-            # Sections matching.
-            search = re.search(r"^\s*\[(?P<section>.+)\]\s*$", line)
-            if search:
-                section = strip_whitespaces and search.group("section").strip() or search.group("section")
-                if not self.__preserve_order:
-                    attributes = {}
-                else:
-                    attributes = OrderedDict()
-                rawContent = []
+            # Empty line matching.
+            if search is not None and empty is not None:
                 continue
 
-            if section in raw_sections:
-                rawContent.append(line)
-                attributes[self.__raw_section_content_identifier] = rawContent
+            # Attributes matching.
+            if search is not None:
+                attribute = attribute or bare_attribute
+                attribute = attribute.strip() if strip_whitespaces else attribute
+                attribute = foundations.namespace.set_namespace(section, attribute, self.__namespace_splitter) \
+                    if namespaces else attribute
+
+                if value is not None:
+                    value = value.strip() if strip_whitespaces else value
+                    value = value.strip(quotation_markers) if strip_quotation_markers else value
+                yield "attribute", section, attribute, value
             else:
-                # Empty line matching.
-                search = re.search(r"^\s*$", line)
-                if search:
+                yield "error", section, None, (i + 1, "attribute", get_line(line) if get_line else line)
+
+    def __index_sections(self, **kwargs):
+        """
+        | Indexes the file sections offsets for lazy parsing.
+        | Sections headers and comments are located with bytes patterns directly on the memory mapped file,
+            thus the file is required to be encoded with default codec and the splitters and comment limiters
+            to be ASCII characters.
+
+        :param \*\*kwargs: Tokenizing arguments.
+        :type \*\*kwargs: dict
+        :return: Method success.
+        :rtype: bool
+        """
+
+        try:
+            comment_limiters = "".join(self.__comment_limiters).encode("ascii")
+        except UnicodeEncodeError:
+            return False
+
+        grammar = self.__get_grammar()
+        headers = re.compile(br"^[ \t\r\x0b\x0c]*\[[^\n]*\n?", re.MULTILINE)
+        comments = re.compile(br"^[ \t\r\x0b\x0c]*[{0}][^\n]+$".format(comment_limiters), re.MULTILINE)
+
+        data = self.__map_file()
+        if data is None:
+            return False
+
+        LOGGER.debug("> Indexing sections from: '{0}'.".format(self.path))
+
+        size = len(data)
+        try:
+            index = OrderedDict()
+            section, start, line, comment_id = self.__defaults_section, 0, 0, 0
+            for header in headers.finditer(data):
+                search = grammar.match(data[header.start():header.end()].decode(Constants.default_codec,
+                                                                                Constants.codec_error))
+                if search is None or search.group("comment") is not None or search.group("section") is None:
                     continue
 
-                # Attributes matching.
-                search = re.search(r"^(?P<attribute>.+?)[{0}](?P<value>.+)$".format("".join(self.__splitters)), line) \
-                    or re.search(r"^(?P<attribute>.+?)[{0}]\s*$".format("".join(self.__splitters)), line)
-                if search:
-                    attribute = search.group("attribute").strip() if strip_whitespaces else search.group("attribute")
-                    attribute = foundations.namespace.set_namespace(section, attribute, self.__namespace_splitter) \
-                        if namespaces else attribute
-
-                    if len(search.groups()) == 2:
-                        value = search.group("value").strip() if strip_whitespaces else search.group("value")
-                        attributes[attribute] = value.strip("".join(self.__quotation_markers)) \
-                            if strip_quotation_markers else value
+                index.setdefault(section, []).append((start, header.start(), line, comment_id))
+                if not kwargs["strip_comments"]:
+                    comment_id += len(comments.findall(data, start, header.start()))
+                line += data[start:header.end()].count(b"\n")
+                section = search.group("section")
+                section = kwargs["strip_whitespaces"] and section.strip() or section
+                start = header.end()
+            index.setdefault(section, []).append((start, size, line, comment_id))
+        finally:
+            if size:
+                data.close()
+
+        self.__sections_index = index
+        self.__sections_offsets = {}
+        self.__sections_options = kwargs
+        return True
+
+    def __map_file(self, validate=False):
+        """
+        | Memory maps the file for bytes level processing.
+        | The file is required to be encoded with default codec and not to contain unicode line breaks
+            other than line feeds, which are only honored by standard parsing.
+
+        :param validate: Non ASCII content is validated against default codec.
+        :type validate: bool
+        :return: Memory mapped file or empty bytes, None if the file cannot be processed at bytes level.
+        :rtype: mmap or str
+        """
+
+        if not foundations.common.path_exists(self.path) or Constants.default_codec.lower() not in ("utf-8", "utf8"):
+            return None
+
+        with open(self.path, "rb") as file:
+            if not os.fstat(file.fileno()).st_size:
+                return b""
+
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Plain ASCII content without carriage returns is only scanned once.
+        if not re.search(br"[\r\x0b\x0c\x1c-\x1e\x80-\xff]", data):
+            return data
+
+        if re.search(br"\r(?!\n)|[\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]", data):
+            data.close()
+            return None
+
+        if validate and re.search(br"[\x80-\xff]", data):
+            decoder = codecs.getincrementaldecoder(Constants.default_codec)()
+            try:
+                for i in range(0, len(data), 1048576):
+                    decoder.decode(data[i:i + 1048576])
+                decoder.decode(b"", True)
+            except UnicodeDecodeError:
+                data.close()
+                return None
+
+        return data
+
+    def __load_section(self, section):
+        """
+        Parses given section content if it has been indexed for lazy parsing.
+
+        :param section: Section to parse.
+        :type section: unicode
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if not self.__sections_index or section not in self.__sections_index:
+            return False
+
+        LOGGER.debug("> Parsing '{0}' indexed section.".format(section))
+
+        with open(self.path, "rb") as file:
+            for start, end, line, comment_id in self.__sections_index.pop(section):
+                file.seek(start)
+                lines = file.read(end - start).decode(Constants.default_codec, Constants.codec_error).splitlines(True)
+
+                attributes = self.__get_attributes_container(section, self.__sections_options["namespaces"])
+                raw_content = []
+                for token, section, key, value in self.__tokenize(lines,
+                                                                  section=section,
+                                                                  comment_id=comment_id,
+                                                                  line_offset=line,
+                                                                  **self.__sections_options):
+                    if token == "comment":
+                        self.__comments[key] = value
+                        continue
+                    elif token == "attribute":
+                        attributes[key] = value
+                    elif token == "raw":
+                        raw_content.append(value)
+                        attributes[key] = raw_content
                     else:
-                        attributes[attribute] = None
-                else:
-                    self.__parsing_errors.append(foundations.exceptions.AttributeStructureParsingError(
-                        "Attribute structure is invalid: {0}".format(line), i + 1))
+                        self.__add_parsing_errors((value,))
 
-            self.__sections[section] = attributes
+                    self.__sections[section] = attributes
+                    self.__sections_offsets.setdefault(section, start)
+        return True
 
-        LOGGER.debug("> Sections: '{0}'.".format(self.__sections))
-        LOGGER.debug("> '{0}' file parsing done!".format(self.path))
+    def __load_sections(self):
+        """
+        Parses the sections indexed for lazy parsing that have not been parsed yet.
 
-        if self.__parsing_errors and raise_parsing_errors:
-            raise foundations.exceptions.FileStructureParsingError(
-                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
-                                                                                       self.path))
+        :return: Method success.
+        :rtype: bool
+        """
 
-        return self
+        if self.__sections_index is None:
+            return False
+
+        for section in self.__sections_index.keys():
+            self.__load_section(section)
+
+        if self.__preserve_order:
+            offsets = self.__sections_offsets
+            sections = OrderedDict((section, self.__sections[section])
+                                   for section in sorted(offsets, key=lambda x: offsets[x]))
+            for section, attributes in self.__sections.iteritems():
+                if section not in offsets:
+                    sections[section] = attributes
+            self.__sections = sections
+            self.__comments = OrderedDict(sorted(self.__comments.iteritems(), key=lambda x: x[1]["id"]))
+
+        self.__sections_index = None
+        return True
+
+    def __get_grammar(self):
+        """
+        | Returns the grammar used to classify the content lines.
+        | The comments, sections, empty lines, attributes with and without value patterns are combined
+            into a single compiled regex, built once per splitters and comment limiters configuration.
+
+        :return: Grammar.
+        :rtype: object
+        """
+
+        configuration = (tuple(self.__comment_limiters), tuple(self.__splitters))
+        if self.__grammar is None or self.__grammar[0] != configuration:
+            LOGGER.debug("> Compiling grammar for '{0}' configuration.".format(configuration))
+
+            comment_limiters, splitters = ("".join(characters) for characters in configuration)
+            self.__grammar = (configuration,
+                              re.compile(r"^(?:\s*[{0}](?P<comment>.+)|"
+                                         r"\s*\[(?P<section>.+)\]\s*|"
+                                         r"(?P<empty>\s*)|"
+                                         r"(?P<attribute>.+?)[{1}](?P<value>.+)|"
+                                         r"(?P<bare_attribute>.+?)[{1}]\s*)$".format(comment_limiters, splitters)))
+        return self.__grammar[1]
+
+    def __get_buffer_grammar(self):
+        """
+        | Returns the grammar used to classify the lines of a default codec encoded bytes buffer.
+        | The grammar matches the same lines than :meth:`SectionsFileParser.__get_grammar` method one,
+            with an additional pattern catching the invalid lines, and requires the splitters and comment limiters
+            to be ASCII characters. The lookahead prevents an empty match at the end of the buffer.
+
+        :return: Grammar.
+        :rtype: object
+        """
+
+        configuration = (tuple(self.__comment_limiters), tuple(self.__splitters))
+        if self.__buffer_grammar is None or self.__buffer_grammar[0] != configuration:
+            try:
+                comment_limiters, splitters = ("".join(characters).encode("ascii") for characters in configuration)
+            except UnicodeEncodeError:
+                self.__buffer_grammar = (configuration, None)
+                return None
+
+            LOGGER.debug("> Compiling bytes grammar for '{0}' configuration.".format(configuration))
+
+            self.__buffer_grammar = (configuration,
+                                     re.compile(br"^(?=[^\n]|\n)(?:{0}*[{1}](?P<comment>.+)|"
+                                                br"{0}*\[(?P<section>.+)\]{0}*|"
+                                                br"(?P<empty>{0}*)|"
+                                                br"(?P<attribute>.+?)[{2}](?P<value>.+)|"
+                                                br"(?P<bare_attribute>.+?)[{2}]{0}*|"
+                                                br"(?P<error>.*))$\n?".format(br"[ \t\r\x0b\x0c]",
+                                                                              comment_limiters,
+                                                                              splitters),
+                                                re.MULTILINE))
+        return self.__buffer_grammar[1]
 
     def section_exists(self, section):
         """
@@ -820,6 +2363,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: bool
         """
 
+        self.__load_section(section)
         if section in self.__sections:
             LOGGER.debug("> '{0}' section exists in '{1}'.".format(section, self))
             return True
@@ -852,8 +2396,7 @@ class SectionsFileParser(foundations.io.File):
         :rtype: bool
         """
 
-        if foundations.namespace.remove_namespace(attribute, root_only=True) in self.get_attributes(section,
-                                                                                                    strip_namespaces=True):
+        if self.__find_attribute(attribute, section):
             LOGGER.debug("> '{0}' attribute exists in '{1}' section.".format(attribute, section))
             return True
         else:
@@ -925,8 +2468,9 @@ class SectionsFileParser(foundations.io.File):
         :rtype: OrderedDict or dict
         """
 
-        all_attributes = OrderedDict() if self.__preserve_order else dict()
+        self.__load_sections()
 
+        all_attributes = OrderedDict() if self.__preserve_order else dict()
         for attributes in self.__sections.itervalues():
             for attribute, value in attributes.iteritems():
                 all_attributes[attribute] = value
@@ -939,14 +2483,166 @@ class SectionsFileParser(foundations.io.File):
 
         Usage::
 
-            >>> content = ["[Section A]\\n", "; Comment.\\n", "Attribute 1 = \\"Value A\\"\\n", "\\n", \
-"[Section B]\\n", "Attribute 2 = \\"Value B\\"\\n"]
-            >>> sections_file_parser = SectionsFileParser()
-            >>> sections_file_parser.content = content
-            >>> sections_file_parser.parse()
-            <foundations.parsers.SectionsFileParser object at 0x679302423>
-            >>> sections_file_parser.get_value("Attribute 1", "Section A")
-            u'Value A'
+            >>> content = ["[Section A]\\n", "; Comment.\\n", "Attribute 1 = \\"Value A\\"\\n", "\\n", \
+"[Section B]\\n", "Attribute 2 = \\"Value B\\"\\n"]
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.content = content
+            >>> sections_file_parser.parse()
+            <foundations.parsers.SectionsFileParser object at 0x679302423>
+            >>> sections_file_parser.get_value("Attribute 1", "Section A")
+            u'Value A'
+
+        :param attribute: Attribute name.
+        :type attribute: unicode
+        :param section: Section containing the searched attribute.
+        :type section: unicode
+        :param default: Default return value.
+        :type default: object
+        :return: Attribute value.
+        :rtype: unicode
+        """
+
+        value = self.__resolve_value(attribute, section, default)
+        LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
+        return value
+
+    def get_values(self, attributes, default=""):
+        """
+        Returns requested attributes values.
+
+        Usage::
+
+            >>> content = ["[Section A]\\n", "; Comment.\\n", "Attribute 1 = \\"Value A\\"\\n", "\\n", \
+"[Section B]\\n", "Attribute 2 = \\"Value B\\"\\n"]
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.content = content
+            >>> sections_file_parser.parse()
+            <foundations.parsers.SectionsFileParser object at 0x679302423>
+            >>> sections_file_parser.get_values([("Attribute 1", "Section A"), ("Attribute 2", "Section B")])
+            [u'Value A', u'Value B']
+
+        :param attributes: Attributes names and sections containing them.
+        :type attributes: list
+        :param default: Default return value.
+        :type default: object
+        :return: Attributes values.
+        :rtype: list
+        """
+
+        return [self.__resolve_value(attribute, section, default) for attribute, section in attributes]
+
+    def set_value(self, attribute, section, value):
+        """
+        Sets requested attribute value.
+
+        Usage::
+
+            >>> content = ["[Section A]\\n", "; Comment.\\n", "Attribute 1 = \\"Value A\\"\\n", "\\n", \
+"[Section B]\\n", "Attribute 2 = \\"Value B\\"\\n"]
+            >>> sections_file_parser = SectionsFileParser()
+            >>> sections_file_parser.content = content
+            >>> sections_file_parser.parse()
+            <foundations.parsers.SectionsFileParser object at 0x109304209>
+            >>> sections_file_parser.set_value("Attribute 3", "Section C", "Value C")
+            True
+
+        :param attribute: Attribute name.
+        :type attribute: unicode
+        :param section: Section containing the searched attribute.
+        :type section: unicode
+        :param value: Attribute value.
+        :type value: object
+        :return: Definition success.
+        :rtype: bool
+        """
+
+        if not self.section_exists(section):
+            LOGGER.debug("> Adding '{0}' section.".format(section))
+            self.__sections[section] = self.__get_attributes_container(
+                section, (self.__parse_options or {}).get("namespaces", True))
+
+        attributes = self.__sections[section]
+        exists = attribute in attributes
+        attributes[attribute] = value
+
+        index = self.__attributes_index.get(section)
+        if not exists and index is not None and index[0] is attributes:
+            self.__index_attribute(section, attribute, index[2])
+            index[2][attribute] = attribute
+            index[3].setdefault(self.__strip_root_namespace(attribute), []).append(attribute)
+            index[1] = len(attributes)
+
+        return True
+
+    def __strip_root_namespace(self, attribute):
+        """
+        Returns given attribute without its root namespace,
+        this method is equivalent to :func:`foundations.namespace.remove_namespace` definition with
+        **root_only** argument set.
+
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :return: Attribute without root namespace.
+        :rtype: unicode
+        """
+
+        root, separator, leaf = attribute.partition(foundations.namespace.NAMESPACE_SPLITTER)
+        return leaf if separator else attribute
+
+    def __index_attribute(self, section, attribute, keys):
+        """
+        Indexes given namespaced attribute with its short name into given keys index.
+
+        :param section: Section containing the attribute.
+        :type section: unicode
+        :param attribute: Attribute.
+        :type attribute: unicode
+        :param keys: Keys index.
+        :type keys: dict
+        """
+
+        prefix = "{0}{1}".format(section, foundations.namespace.NAMESPACE_SPLITTER)
+        if attribute.startswith(prefix):
+            keys.setdefault(attribute[len(prefix):], attribute)
+
+    def __get_attributes_index(self, section, refresh=False):
+        """
+        | Returns given section attributes index, building it if it doesn't exist or is outdated.
+        | The index stores the section attributes, their count, the attributes keys by both their names
+            and short names, and the attributes keys by their names stripped from their root namespace.
+        | The section attributes being mutable outside of the parser, an attribute replaced by another one
+            is not detected, the index lookups check the found keys and refresh the index on a miss.
+
+        :param section: Section.
+        :type section: unicode
+        :param refresh: Index is rebuilt.
+        :type refresh: bool
+        :return: Attributes index.
+        :rtype: list
+        """
+
+        self.__load_section(section)
+        attributes = self.__sections.get(section)
+        if attributes is None:
+            return
+
+        index = self.__attributes_index.get(section)
+        if refresh or index is None or index[0] is not attributes or index[1] != len(attributes):
+            LOGGER.debug("> Indexing '{0}' section attributes.".format(section))
+
+            keys = {}
+            stripped_attributes = {}
+            for attribute in attributes:
+                self.__index_attribute(section, attribute, keys)
+                stripped_attributes.setdefault(self.__strip_root_namespace(attribute), []).append(attribute)
+            for attribute in attributes:
+                keys[attribute] = attribute
+            index = self.__attributes_index[section] = [attributes, len(attributes), keys, stripped_attributes]
+        return index
+
+    def __resolve_value(self, attribute, section, default=""):
+        """
+        Returns given attribute value using given section attributes index.
 
         :param attribute: Attribute name.
         :type attribute: unicode
@@ -955,61 +2651,90 @@ class SectionsFileParser(foundations.io.File):
         :param default: Default return value.
         :type default: object
         :return: Attribute value.
-        :rtype: unicode
+        :rtype: object
         """
 
-        if not self.attribute_exists(attribute, section):
+        if not self.__find_attribute(attribute, section):
             return default
 
-        if attribute in self.__sections[section]:
-            value = self.__sections[section][attribute]
-        elif foundations.namespace.set_namespace(section, attribute) in self.__sections[section]:
-            value = self.__sections[section][foundations.namespace.set_namespace(section, attribute)]
-        LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
-        return value
+        for refresh in (False, True):
+            index = self.__get_attributes_index(section, refresh)
+            key = index[2].get(attribute)
+            if key in index[0]:
+                return index[0][key]
+        return default
 
-    def set_value(self, attribute, section, value):
+    def __find_attribute(self, attribute, section):
         """
-        Sets requested attribute value.
-
-        Usage::
-
-            >>> content = ["[Section A]\\n", "; Comment.\\n", "Attribute 1 = \\"Value A\\"\\n", "\\n", \
-"[Section B]\\n", "Attribute 2 = \\"Value B\\"\\n"]
-            >>> sections_file_parser = SectionsFileParser()
-            >>> sections_file_parser.content = content
-            >>> sections_file_parser.parse()
-            <foundations.parsers.SectionsFileParser object at 0x109304209>
-            >>> sections_file_parser.set_value("Attribute 3", "Section C", "Value C")
-            True
+        Returns if given attribute exists using given section attributes index.
 
         :param attribute: Attribute name.
         :type attribute: unicode
         :param section: Section containing the searched attribute.
         :type section: unicode
-        :param value: Attribute value.
-        :type value: object
-        :return: Definition success.
+        :return: Attribute existence.
         :rtype: bool
         """
 
-        if not self.section_exists(section):
-            LOGGER.debug("> Adding '{0}' section.".format(section))
-            self.__sections[section] = OrderedDict() if self.__preserve_order else dict()
+        stripped_attribute = self.__strip_root_namespace(attribute)
+        for refresh in (False, True):
+            index = self.__get_attributes_index(section, refresh)
+            if index is None:
+                return False
 
-        self.__sections[section][attribute] = value
+            if any(key in index[0] for key in index[3].get(stripped_attribute, ())):
+                return True
+        return False
 
-        return True
+    def __get_sections_comments(self):
+        """
+        | Returns the comments of each section.
+        | A comment belongs to every section whose name is contained in its key, the comments keys are joined
+            once and searched for each section name instead of testing every comment for every section.
+
+        :return: Sections comments.
+        :rtype: dict
+        """
+
+        sections_comments = {}
+        if not self.__comments:
+            return sections_comments
+
+        values = self.__comments.values()
+        comments = "\n".join(self.__comments)
+        offsets = [0]
+        for comment in self.__comments:
+            offsets.append(offsets[-1] + len(comment) + 1)
+        offsets.pop()
+
+        for section in self.__sections:
+            if "\n" in section:
+                sections_comments[section] = [value for comment, value in self.__comments.iteritems()
+                                              if section in comment]
+                continue
+
+            section_comments = sections_comments[section] = []
+            position = comments.find(section)
+            while position != -1:
+                index = bisect.bisect_right(offsets, position) - 1
+                section_comments.append(values[index])
+                if index + 1 == len(offsets):
+                    break
+                position = comments.find(section, offsets[index + 1])
+        return sections_comments
 
     def write(self,
               namespaces=False,
               splitter="=",
               comment_limiter=(";"),
               spaces_around_splitter=True,
-              space_after_comment_limiter=True):
+              space_after_comment_limiter=True,
+              atomic=False):
         """
-        Writes defined file using :obj:`SectionsFileParser.sections` and
+        | Writes defined file using :obj:`SectionsFileParser.sections` and
             :obj:`SectionsFileParser.comments` class properties content.
+        | The content is built in a single buffer written at once, in atomic mode it is written into
+            a temporary file then renamed to defined file.
 
         Usage::
 
@@ -1032,10 +2757,13 @@ class SectionsFileParser(foundations.io.File):
         :type spaces_around_splitter: bool
         :param space_after_comment_limiter: Space after comments limiter.
         :type space_after_comment_limiter: bool
+        :param atomic: Write into a temporary file renamed to defined file.
+        :type atomic: bool
         :return: Method success.
         :rtype: bool
         """
 
+        self.__load_sections()
         self.uncache()
 
         LOGGER.debug("> Setting '{0}' file content.".format(self.path))
@@ -1044,51 +2772,216 @@ class SectionsFileParser(foundations.io.File):
         attribute_template = foundations.strings.replace(attribute_template, {"{{": "{", "}}": "}"})
         comment_template = space_after_comment_limiter and "{0} {{0}}\n".format(comment_limiter) or \
                            "{0}{{0}}\n".format(comment_limiter)
+        format_attribute = attribute_template.format
+        format_comment = comment_template.format
+
+        namespace_splitter = self.__namespace_splitter
+        raw_section_content_identifier = self.__raw_section_content_identifier
+        sections_comments = self.__get_sections_comments()
+
+        content = self.content
         if self.__defaults_section in self.__sections:
             LOGGER.debug("> Appending '{0}' default section.".format(self.__defaults_section))
-            if self.__comments:
-                for comment, value in self.__comments.iteritems():
-                    if self.__defaults_section in comment:
-                        value = value["content"] or ""
-                        LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
-                        self.content.append(comment_template.format(value))
+            for value in sections_comments.get(self.__defaults_section, ()):
+                content.append(format_comment(value["content"] or ""))
             for attribute, value in self.__sections[self.__defaults_section].iteritems():
-                attribute = namespaces and attribute or foundations.namespace.remove_namespace(attribute,
-                                                                                               self.__namespace_splitter,
-                                                                                               root_only=True)
-                value = value or ""
-                LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
-                self.content.append(attribute_template.format(attribute, value))
-            self.content.append("\n")
+                if not namespaces:
+                    root, separator, attribute_tail = attribute.partition(namespace_splitter)
+                    attribute = attribute_tail if separator else attribute
+                content.append(format_attribute(attribute, value or ""))
+            content.append("\n")
 
         for i, section in enumerate(self.__sections):
             LOGGER.debug("> Appending '{0}' section.".format(section))
-            self.content.append("[{0}]\n".format(section))
-            if self.__comments:
-                for comment, value in self.__comments.iteritems():
-                    if section in comment:
-                        value = value["content"] or ""
-                        LOGGER.debug("> Appending '{0}' comment with '{1}' value.".format(comment, value))
-                        self.content.append(comment_template.format(value))
+            content.append("[{0}]\n".format(section))
+            for value in sections_comments.get(section, ()):
+                content.append(format_comment(value["content"] or ""))
             for attribute, value in self.__sections[section].iteritems():
-                if foundations.namespace.remove_namespace(attribute) == self.__raw_section_content_identifier:
-                    LOGGER.debug("> Appending '{0}' raw section content.".format(section))
-                    for line in value:
-                        self.content.append(line)
+                if attribute.rsplit(foundations.namespace.NAMESPACE_SPLITTER, 1)[-1] == \
+                        raw_section_content_identifier:
+                    content.extend(value)
                 else:
-                    LOGGER.debug("> Appending '{0}' section.".format(section))
-                    attribute = namespaces and attribute or foundations.namespace.remove_namespace(attribute,
-                                                                                                   self.__namespace_splitter,
-                                                                                                   root_only=True)
-                    value = value or ""
-                    LOGGER.debug("> Appending '{0}' attribute with '{1}' value.".format(attribute, value))
-                    self.content.append(attribute_template.format(attribute, value))
+                    if not namespaces:
+                        root, separator, attribute_tail = attribute.partition(namespace_splitter)
+                        attribute = attribute_tail if separator else attribute
+                    content.append(format_attribute(attribute, value or ""))
             if i != len(self.__sections) - 1:
-                self.content.append("\n")
-        foundations.io.File.write(self)
+                content.append("\n")
+        foundations.io.File.write(self, atomic=atomic)
         return True
 
 
+class PlistData(object):
+    """
+    | Defines a lazy plist data value, used by :class:`PlistFileParser` class when parsing with lazy data.
+    | The value source is either the element base64 text or a raw bytes buffer that can reference
+        a memory mapped file without copying it, the source being decoded on first access only.
+    """
+
+    __slots__ = ("__source", "__encoded", "__value")
+
+    def __init__(self, source, encoded=False):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> plist_data = PlistData("TXkgVmFsdWUgQg==", encoded=True)
+            >>> plist_data.value
+            'My Value B'
+            >>> plist_data == "My Value B"
+            True
+
+        :param source: Base64 text or raw bytes buffer.
+        :type source: unicode or str or buffer
+        :param encoded: Source is base64 encoded.
+        :type encoded: bool
+        """
+
+        # --- Setting class attributes. ---
+        self.__source = source
+        self.__encoded = encoded
+        self.__value = None
+
+    @property
+    def value(self):
+        """
+        Property for **self.__value** attribute, the source is decoded on first access.
+
+        :return: self.__value.
+        :rtype: str
+        """
+
+        if self.__value is None:
+            if self.__encoded:
+                self.__value = base64.decodestring(self.__source)
+            else:
+                self.__value = bytes(self.__source)
+            self.__source = None
+        return self.__value
+
+    @value.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def value(self, value):
+        """
+        Setter for **self.__value** attribute.
+
+        :param value: Attribute value.
+        :type value: str
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "value"))
+
+    @value.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def value(self):
+        """
+        Deleter for **self.__value** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "value"))
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Decoded value length.
+        :rtype: int
+        """
+
+        if self.__value is None and not self.__encoded:
+            return len(self.__source)
+        return len(self.value)
+
+    def __eq__(self, other):
+        """
+        Reimplements the :meth:`object.__eq__` method.
+
+        :param other: Object to compare.
+        :type other: object
+        :return: Comparison result.
+        :rtype: bool
+        """
+
+        return self.value == (other.value if isinstance(other, PlistData) else other)
+
+    def __ne__(self, other):
+        """
+        Reimplements the :meth:`object.__ne__` method.
+
+        :param other: Object to compare.
+        :type other: object
+        :return: Comparison result.
+        :rtype: bool
+        """
+
+        return not self == other
+
+    def __hash__(self):
+        """
+        Reimplements the :meth:`object.__hash__` method.
+
+        :return: Decoded value hash.
+        :rtype: int
+        """
+
+        return hash(self.value)
+
+    def __str__(self):
+        """
+        Reimplements the :meth:`object.__str__` method.
+
+        :return: Decoded value.
+        :rtype: str
+        """
+
+        return self.value
+
+    def __repr__(self):
+        """
+        Reimplements the :meth:`object.__repr__` method.
+
+        :return: Object representation.
+        :rtype: unicode
+        """
+
+        if self.__value is None and self.__encoded:
+            return "{0}(base64 encoded)".format(self.__class__.__name__)
+        return "{0}({1} bytes)".format(self.__class__.__name__, len(self))
+
+    def __reduce__(self):
+        """
+        Reduces the object for pickling, the value being decoded.
+
+        :return: Object class, initialization arguments.
+        :rtype: tuple
+        """
+
+        return (self.__class__, (self.value,))
+
+    def get_buffer(self):
+        """
+        | Returns a memory view on the value.
+        | If the value has not been decoded yet and its source is a raw bytes buffer, the memory view
+            references the source without copying nor decoding it, allowing the value to be streamed out.
+
+        Usage::
+
+            >>> plist_data = PlistData(buffer("My Value B"))
+            >>> plist_data.get_buffer()[3:8].tobytes()
+            'Value'
+
+        :return: Value memory view.
+        :rtype: memoryview
+        """
+
+        if self.__value is None and not self.__encoded:
+            return memoryview(self.__source)
+        return memoryview(self.value)
+
+
 class PlistFileParser(foundations.io.File):
     """
     Defines methods to parse plist files.
@@ -1119,6 +3012,7 @@ class PlistFileParser(foundations.io.File):
         # --- Setting class attributes. ---
         self.__elements = None
         self.__parsing_errors = None
+        self.__index = None
 
         self.__unserializers = {"array": lambda x: [value.text for value in x],
                                 "dict": lambda x: dict((x[i].text, x[i + 1].text) for i in range(0, len(x), 2)),
@@ -1131,6 +3025,9 @@ class PlistFileParser(foundations.io.File):
                                 "real": lambda x: float(x.text),
                                 "integer": lambda x: int(x.text)}
 
+        self.__backends = {"xml": self.__parse_xml,
+                           "binary": self.__parse_binary}
+
     @property
     def elements(self):
         """
@@ -1155,6 +3052,7 @@ class PlistFileParser(foundations.io.File):
         if value is not None:
             assert type(value) is dict, "'{0}' attribute: '{1}' type is not  dict'!".format("elements", value)
         self.__elements = value
+        self.__index = None
 
     @elements.deleter
     @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
@@ -1226,61 +3124,440 @@ class PlistFileParser(foundations.io.File):
         :type value: dict
         """
 
-        raise foundations.exceptions.ProgrammingError(
-            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "unserializers"))
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "unserializers"))
+
+    @unserializers.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def unserializers(self):
+        """
+        Deleter for **self.__unserializers** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "unserializers"))
+
+    @property
+    def backends(self):
+        """
+        Property for **self.__backends** attribute.
+
+        :return: self.__backends.
+        :rtype: dict
+        """
+
+        return self.__backends
+
+    @backends.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def backends(self, value):
+        """
+        Setter for **self.__backends** attribute.
+
+        :param value: Attribute value.
+        :type value: dict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "backends"))
+
+    @backends.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def backends(self):
+        """
+        Deleter for **self.__backends** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "backends"))
+
+    @property
+    def index(self):
+        """
+        Property for **self.__index** attribute.
+
+        :return: self.__index.
+        :rtype: OrderedDict
+        """
+
+        return self.__index
+
+    @index.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def index(self, value):
+        """
+        Setter for **self.__index** attribute.
+
+        :param value: Attribute value.
+        :type value: OrderedDict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "index"))
+
+    @index.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def index(self):
+        """
+        Deleter for **self.__index** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "index"))
+
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
+    def parse(self, raise_parsing_errors=True, index=False, backend=None, lazy_data=False):
+        """
+        | Process the file content.
+        | The backend is chosen from the file header if not given: *binary* backend reads binary plists
+            directly while *xml* backend unserializes the XML plists elements
+            using :obj:`PlistFileParser.unserializers` class property.
+        | If requested, the elements are indexed by name once parsed, the index being used by
+            :meth:`PlistFileParser.element_exists`, :meth:`PlistFileParser.filter_values` and
+            :meth:`PlistFileParser.get_value` methods until :obj:`PlistFileParser.elements`
+            class property is set again.
+        | With lazy data, the data elements are returned as :class:`PlistData` class instances decoded
+            on first access, the binary plists being memory mapped so that their data values are not copied.
+
+        Usage::
+
+            >>> plist_file_parser = PlistFileParser("standard.plist")
+            >>> plist_file_parser.parse()
+            True
+            >>> plist_file_parser.elements.keys()
+            [u'Dictionary A', u'Number A', u'Array A', u'String A', u'Date A', u'Boolean A', u'Data A']
+
+        :param raise_parsing_errors: Raise parsing errors.
+        :type raise_parsing_errors: bool
+        :param index: Elements are indexed by name.
+        :type index: bool
+        :param backend: Backend name, one of :obj:`PlistFileParser.backends` class property keys.
+        :type backend: unicode
+        :param lazy_data: Data elements are decoded on first access.
+        :type lazy_data: bool
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Reading elements from: '{0}'.".format(self.path))
+
+        backend = backend or self.__get_backend()
+        if backend not in self.__backends:
+            raise foundations.exceptions.ProgrammingError(
+                "{0} | '{1}' backend is not supported!".format(self.__class__.__name__, backend))
+
+        self.__index = None
+        self.__parsing_errors = []
+        elements = self.__backends[backend](lazy_data=lazy_data)
+
+        if self.__parsing_errors:
+            if raise_parsing_errors:
+                raise foundations.exceptions.FileStructureParsingError(
+                    "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                           self.path))
+        else:
+            self.__elements = elements
+            if index:
+                self.__index_elements()
+            return True
+
+    def __get_backend(self):
+        """
+        Returns the backend able to parse the file by sniffing its header.
+
+        :return: Backend name.
+        :rtype: unicode
+        """
+
+        with open(self.path, "rb") as file:
+            return "binary" if file.read(8) == b"bplist00" else "xml"
+
+    def __parse_xml(self, lazy_data=False):
+        """
+        Parses the file as a XML plist.
+
+        :param lazy_data: Data elements are decoded on first access.
+        :type lazy_data: bool
+        :return: Elements.
+        :rtype: dict
+        """
+
+        if lazy_data:
+            return self.__parse_xml_spans()
+
+        element_tree_parser = ElementTree.iterparse(self.path)
+
+        for action, element in element_tree_parser:
+            unmarshal = self.__unserializers.get(element.tag)
+            if unmarshal:
+                data = unmarshal(element)
+                element.clear()
+                element.text = data
+            elif element.tag != "plist":
+                self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+                    "Unknown element: {0}".format(element.tag)))
+
+        if not self.__parsing_errors:
+            return foundations.common.get_first_item(element_tree_parser.root).text
+
+    def __parse_xml_spans(self):
+        """
+        | Parses the file as a XML plist, the data elements referencing their base64 text span
+            into the memory mapped file instead of being decoded.
+        | The spans are located with the expat parser bytes indexes, thus the data elements are expected
+            to contain plain base64 text.
+
+        :return: Elements.
+        :rtype: dict
+        """
+
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # The mapping is released once no data value references it anymore.
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        parser = expat.ParserCreate()
+        builder = ElementTree.TreeBuilder()
+        spans = []
+
+        def start_element(tag, attributes):
+            if tag == "data":
+                spans.append(data.find(b">", parser.CurrentByteIndex) + 1)
+            builder.start(tag, attributes)
+
+        def end_element(tag):
+            element = builder.end(tag)
+            if tag == "data":
+                start = spans.pop()
+                # Empty elements end index is their start tag one.
+                element.text = PlistData(buffer(data, start, max(0, parser.CurrentByteIndex - start)), encoded=True)
+                return
+
+            unmarshal = self.__unserializers.get(tag)
+            if unmarshal:
+                value = unmarshal(element)
+                element.clear()
+                element.text = value
+            elif tag != "plist":
+                self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+                    "Unknown element: {0}".format(tag)))
+
+        def character_data(text):
+            if not spans:
+                builder.data(text)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+
+        for i in range(0, size, 1048576):
+            parser.Parse(data[i:i + 1048576], False)
+        parser.Parse(b"", True)
+
+        root = builder.close()
+        if not self.__parsing_errors:
+            return foundations.common.get_first_item(root).text
+
+    def __parse_binary(self, lazy_data=False):
+        """
+        Parses the file as a binary plist.
+
+        :param lazy_data: Data elements are decoded on first access.
+        :type lazy_data: bool
+        :return: Elements.
+        :rtype: dict
+        """
 
-    @unserializers.deleter
-    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
-    def unserializers(self):
+        with open(self.path, "rb") as file:
+            if lazy_data and os.fstat(file.fileno()).st_size:
+                # The mapping is released once no data value references it anymore.
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = file.read()
+
+        formats = {1: b"B", 2: b"H", 4: b"I", 8: b"Q"}
+
+        def read_integers(offset, size, count=1):
+            if size in formats:
+                return struct.unpack_from(b">%d%s" % (count, formats[size]), data, offset)
+            return tuple(int(binascii.hexlify(data[offset + i * size:offset + (i + 1) * size]) or b"0", 16)
+                         for i in range(count))
+
+        # Scalar objects are immutable and usually shared, thus unserialized once.
+        scalars = {}
+
+        def unserialize(reference):
+            if reference in scalars:
+                return scalars[reference]
+
+            offset = offsets[reference]
+            marker = ord(data[offset])
+            type, information = marker >> 4, marker & 0xF
+            if type in (0xA, 0xC, 0xD):
+                count = information
+                if information == 0xF:
+                    size = 1 << (ord(data[offset + 1]) & 0xF)
+                    count = read_integers(offset + 2, size)[0]
+                    offset += 1 + size
+                values = [unserialize(child) for child in read_integers(offset + 1,
+                                                                         reference_size,
+                                                                         count * 2 if type == 0xD else count)]
+                return dict(zip(values[:count], values[count:])) if type == 0xD else values
+
+            if marker == 0x00:
+                value = None
+            elif marker == 0x08:
+                value = False
+            elif marker == 0x09:
+                value = True
+            elif type == 0x1:
+                size = 1 << information
+                value = read_integers(offset + 1, size)[0]
+                if size >= 8 and value >> (size * 8 - 1):
+                    value -= 1 << size * 8
+            elif type == 0x2:
+                value = struct.unpack_from(b">f" if information == 2 else b">d", data, offset + 1)[0]
+            elif marker == 0x33:
+                value = datetime.datetime(2001, 1, 1) + datetime.timedelta(
+                    seconds=struct.unpack_from(b">d", data, offset + 1)[0])
+            elif type == 0x8:
+                value = read_integers(offset + 1, information + 1)[0]
+            elif type in (0x4, 0x5, 0x6):
+                count = information
+                if information == 0xF:
+                    size = 1 << (ord(data[offset + 1]) & 0xF)
+                    count = read_integers(offset + 2, size)[0]
+                    offset += 1 + size
+                if type == 0x4:
+                    value = PlistData(buffer(data, offset + 1, count)) if lazy_data else \
+                        data[offset + 1:offset + 1 + count]
+                elif type == 0x5:
+                    value = data[offset + 1:offset + 1 + count].decode("ascii")
+                else:
+                    value = data[offset + 1:offset + 1 + count * 2].decode("utf-16-be")
+            else:
+                raise ValueError("Unknown object marker: {0:#04x}".format(marker))
+
+            scalars[reference] = value
+            return value
+
+        try:
+            offset_size, reference_size, objects_count, top_object, offset_table_offset = struct.unpack_from(
+                b">6xBBQQQ", data, len(data) - 32)
+            if not offset_size or not reference_size or \
+                            offset_table_offset + objects_count * offset_size > len(data) - 32:
+                raise ValueError("Invalid trailer!")
+
+            offsets = read_integers(offset_table_offset, offset_size, objects_count)
+            return unserialize(top_object)
+        # Circular objects references exhaust the recursion limit.
+        except (IndexError, KeyError, OverflowError, RuntimeError, TypeError, ValueError, struct.error) as error:
+            self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+                "Invalid binary plist: {0}".format(error)))
+
+    def __index_elements(self):
         """
-        Deleter for **self.__unserializers** attribute.
+        Indexes the elements by name, each name being mapped to its walking order, path and value occurrences.
+
+        :return: Method success.
+        :rtype: bool
         """
 
-        raise foundations.exceptions.ProgrammingError(
-            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "unserializers"))
+        self.__index = OrderedDict()
+        if not self.__elements:
+            return True
 
-    @foundations.exceptions.handle_exceptions(foundations.exceptions.FileStructureParsingError)
-    def parse(self, raise_parsing_errors=True):
+        for i, (path, element, value) in enumerate(foundations.walkers.dictionaries_walker(self.__elements)):
+            self.__index.setdefault(element, []).append((i, path, value))
+        return True
+
+    def iter_elements(self, patterns, raise_parsing_errors=True):
         """
-        Process the file content.
+        | Defines a generator used to stream the elements matching given patterns directly from the file.
+        | Contrary to :meth:`PlistFileParser.parse` method, the elements are not stored in
+            :obj:`PlistFileParser.elements` class property: the subtrees that cannot match are discarded
+            as soon as they are parsed, allowing large files to be processed in constant memory.
+        | Patterns are shell style wildcards matched against the elements names or, if they contain
+            :attr:`foundations.namespace.NAMESPACE_SPLITTER` attribute, against the elements paths.
+            Matching dictionaries are yielded whole and are not walked any further.
 
         Usage::
 
             >>> plist_file_parser = PlistFileParser("standard.plist")
-            >>> plist_file_parser.parse()
-            True
-            >>> plist_file_parser.elements.keys()
-            [u'Dictionary A', u'Number A', u'Array A', u'String A', u'Date A', u'Boolean A', u'Data A']
-
-        :param raise_parsing_errors: Raise parsing errors.
+            >>> for path, element, value in plist_file_parser.iter_elements(("String A", "Dictionary A|String*")):
+            ...     print(path, element, value)
+            ((), u'String A', u'My Value A')
+            ((u'Dictionary A',), u'String B', u'My Value B')
+            ((u'Dictionary A',), u'String C', u'My Value C')
+
+        :param patterns: Elements names or paths patterns.
+        :type patterns: tuple or list
+        :param raise_parsing_errors: Raise parsing errors once the file has been parsed.
         :type raise_parsing_errors: bool
-        :return: Method success.
-        :rtype: bool
+        :return: Path, element, value.
+        :rtype: tuple
         """
 
-        LOGGER.debug("> Reading elements from: '{0}'.".format(self.path))
+        LOGGER.debug("> Streaming elements from: '{0}'.".format(self.path))
 
-        element_tree_parser = ElementTree.iterparse(self.path)
+        names_patterns, paths_patterns = [], []
+        for pattern in patterns:
+            (paths_patterns if foundations.namespace.NAMESPACE_SPLITTER in pattern else names_patterns).append(
+                re.compile(fnmatch.translate(pattern)))
+
+        def is_matching(path):
+            return any(pattern.match(path[-1]) for pattern in names_patterns) or \
+                   (paths_patterns and any(pattern.match(foundations.namespace.NAMESPACE_SPLITTER.join(path))
+                                           for pattern in paths_patterns))
 
         self.__parsing_errors = []
-        for action, element in element_tree_parser:
+        # Opened elements stack: element, path, mode and last key read for dictionaries.
+        stack = []
+        for action, element in ElementTree.iterparse(self.path, events=(b"start", b"end")):
+            if action == "start":
+                parent = stack[-1] if stack else None
+                if parent is None or parent[2] == "walk" and parent[0].tag == "plist":
+                    path, mode = (), "walk" if element.tag in ("dict", "plist") else "skip"
+                elif parent[2] != "walk":
+                    path, mode = parent[1], parent[2]
+                elif element.tag == "key":
+                    path, mode = parent[1], "walk"
+                else:
+                    path = parent[1] + (parent[3],)
+                    mode = "capture" if is_matching(path) else "walk" if element.tag == "dict" else "skip"
+                stack.append([element, path, mode, ""])
+                continue
+
+            element, path, mode, key = stack.pop()
+            parent = stack[-1] if stack else None
+
             unmarshal = self.__unserializers.get(element.tag)
-            if unmarshal:
-                data = unmarshal(element)
-                element.clear()
-                element.text = data
-            elif element.tag != "plist":
+            if unmarshal is None and element.tag != "plist":
                 self.__parsing_errors.append(foundations.exceptions.FileStructureParsingError(
                     "Unknown element: {0}".format(element.tag)))
 
-        if self.__parsing_errors:
-            if raise_parsing_errors:
-                raise foundations.exceptions.FileStructureParsingError(
-                    "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
-                                                                                           self.path))
-        else:
-            self.__elements = foundations.common.get_first_item(element_tree_parser.root).text
-            return True
+            if mode == "capture":
+                if unmarshal:
+                    data = unmarshal(element)
+                    element.clear()
+                    element.text = data
+                if parent[2] == "capture":
+                    continue
+
+                yield path[:-1], path[-1], element.text
+            elif element.tag == "key" and mode == "walk":
+                parent[3] = unmarshal(element)
+
+            element.clear()
+            if parent is not None:
+                parent[0].remove(element)
+
+        LOGGER.debug("> '{0}' file streaming done!".format(self.path))
+
+        if self.__parsing_errors and raise_parsing_errors:
+            raise foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' structure is invalid, parsing exceptions occured!".format(self.__class__.__name__,
+                                                                                       self.path))
 
     def element_exists(self, element):
         """
@@ -1305,6 +3582,14 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return False
 
+        if self.__index is not None:
+            if element in self.__index:
+                LOGGER.debug("> '{0}' attribute exists.".format(element))
+                return True
+
+            LOGGER.debug("> '{0}' element doesn't exists.".format(element))
+            return False
+
         for item in foundations.walkers.dictionaries_walker(self.__elements):
             path, key, value = item
             if key == element:
@@ -1342,6 +3627,13 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return values
 
+        if self.__index is not None:
+            occurrences = [occurrences for element, occurrences in self.__index.iteritems()
+                           if re.search(pattern, element, flags)]
+            occurrences = occurrences[0] if len(occurrences) == 1 else \
+                sorted(itertools.chain.from_iterable(occurrences), key=lambda x: x[0])
+            return [value for i, path, value in occurrences]
+
         for item in foundations.walkers.dictionaries_walker(self.__elements):
             path, element, value = item
             if re.search(pattern, element, flags):
@@ -1370,10 +3662,203 @@ class PlistFileParser(foundations.io.File):
         if not self.__elements:
             return
 
+        # Elements without regex metacharacters are exact lookups.
+        if self.__index is not None and not re.search(r"[\\.^$*+?{}\[\]|()]", element):
+            occurrences = self.__index.get(element)
+            return occurrences[0][2] if occurrences else None
+
         values = self.filter_values(r"^{0}$".format(element))
         return foundations.common.get_first_item(values)
 
 
+class PlistFilesStore(object):
+    """
+    | Defines methods to query the elements of multiple plist files as a single set.
+    | The elements are indexed by name across the files, the values being returned along the path of the file
+        they come from.
+    """
+
+    def __init__(self, plist_files_parsers=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> plist_files_store = PlistFilesStore([PlistFileParser("standard.plist"), \
+PlistFileParser("standard_binary.plist")])
+            >>> plist_files_store.get_value("String A")
+            (u'standard.plist', u'My Value A')
+            >>> plist_files_store.filter_values(r"String A")
+            [(u'standard.plist', u'My Value A'), (u'standard_binary.plist', u'My Value A')]
+
+        :param plist_files_parsers: Parsed plist files parsers.
+        :type plist_files_parsers: list
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__plist_files_parsers = []
+        self.__index = OrderedDict()
+        self.__count = 0
+
+        for plist_file_parser in plist_files_parsers or ():
+            self.add_plist_file_parser(plist_file_parser)
+
+    @property
+    def plist_files_parsers(self):
+        """
+        Property for **self.__plist_files_parsers** attribute.
+
+        :return: self.__plist_files_parsers.
+        :rtype: list
+        """
+
+        return self.__plist_files_parsers
+
+    @plist_files_parsers.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def plist_files_parsers(self, value):
+        """
+        Setter for **self.__plist_files_parsers** attribute.
+
+        :param value: Attribute value.
+        :type value: list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "plist_files_parsers"))
+
+    @plist_files_parsers.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def plist_files_parsers(self):
+        """
+        Deleter for **self.__plist_files_parsers** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "plist_files_parsers"))
+
+    @property
+    def index(self):
+        """
+        Property for **self.__index** attribute.
+
+        :return: self.__index.
+        :rtype: OrderedDict
+        """
+
+        return self.__index
+
+    @index.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def index(self, value):
+        """
+        Setter for **self.__index** attribute.
+
+        :param value: Attribute value.
+        :type value: OrderedDict
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "index"))
+
+    @index.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def index(self):
+        """
+        Deleter for **self.__index** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "index"))
+
+    def __len__(self):
+        """
+        Reimplements the :meth:`object.__len__` method.
+
+        :return: Plist files count.
+        :rtype: int
+        """
+
+        return len(self.__plist_files_parsers)
+
+    def add_plist_file_parser(self, plist_file_parser):
+        """
+        Adds given parsed plist file parser to the store and indexes its elements.
+
+        :param plist_file_parser: Parsed plist file parser.
+        :type plist_file_parser: PlistFileParser
+        :return: Method success.
+        :rtype: bool
+        """
+
+        LOGGER.debug("> Indexing '{0}' file elements.".format(plist_file_parser.path))
+
+        self.__plist_files_parsers.append(plist_file_parser)
+        if not isinstance(plist_file_parser.elements, dict):
+            return True
+
+        for path, element, value in foundations.walkers.dictionaries_walker(plist_file_parser.elements):
+            self.__index.setdefault(element, []).append((self.__count, plist_file_parser.path, path, value))
+            self.__count += 1
+        return True
+
+    def element_exists(self, element):
+        """
+        Checks if given element exists in any of the plist files.
+
+        :param element: Element to check existence.
+        :type element: unicode
+        :return: Element existence.
+        :rtype: bool
+        """
+
+        return element in self.__index
+
+    def filter_values(self, pattern, flags=0):
+        """
+        | Filters the plist files elements using given pattern.
+        | Will return a list of matching elements values along the path of the file they come from,
+            in the plist files order.
+
+        :param pattern: Regex filtering pattern.
+        :type pattern: unicode
+        :param flags: Regex flags.
+        :type flags: int
+        :return: File, value.
+        :rtype: list
+        """
+
+        occurrences = [occurrences for element, occurrences in self.__index.iteritems()
+                       if re.search(pattern, element, flags)]
+        occurrences = occurrences[0] if len(occurrences) == 1 else \
+            sorted(itertools.chain.from_iterable(occurrences), key=lambda x: x[0])
+        return [(file, value) for i, file, path, value in occurrences]
+
+    def get_value(self, element):
+        """
+        | Returns the given element value along the path of the file it comes from.
+        | If multiple elements with the same name exists, only the first encountered will be returned.
+
+        :param element: Element to get the value.
+        :type element: unicode
+        :return: File, value.
+        :rtype: tuple
+        """
+
+        # Elements without regex metacharacters are exact lookups.
+        if not re.search(r"[\\.^$*+?{}\[\]|()]", element):
+            occurrences = self.__index.get(element)
+            if not occurrences:
+                return
+
+            i, file, path, value = occurrences[0]
+            return file, value
+
+        return foundations.common.get_first_item(self.filter_values(r"^{0}$".format(element)))
+
+
 def get_attribute_compound(attribute, value=None, splitter="|", binding_identifier="@"):
     """
     Returns an attribute compound.
@@ -1407,17 +3892,273 @@ def get_attribute_compound(attribute, value=None, splitter="|", binding_identifi
 
     LOGGER.debug("> Attribute: '{0}', value: '{1}'.".format(attribute, value))
 
-    if type(value) is unicode:
-        if splitter in value:
-            value_tokens = value.split(splitter)
-            if len(value_tokens) >= 3 and re.search(r"{0}\w*".format(binding_identifier), value_tokens[0]):
-                return AttributeCompound(name=attribute,
-                                         value=value_tokens[1].strip(),
-                                         link=value_tokens[0].strip(),
-                                         type=value_tokens[2].strip(),
-                                         alias=len(value_tokens) == 4 and value_tokens[3].strip() or None)
-        else:
-            if re.search(r"{0}\w*".format(binding_identifier), value):
-                return AttributeCompound(name=attribute, value=None, link=value, type=None, alias=None)
+    value, link, type, alias = _get_attribute_compound_fields(value, splitter, binding_identifier)
+    return AttributeCompound(name=attribute, value=value, link=link, type=type, alias=alias)
+
+
+def get_attribute_compounds(mapping, splitter="|", binding_identifier="@"):
+    """
+    | Returns the attributes compounds of given attributes, values mapping.
+    | The binding identifier pattern is compiled once and the fields of identical values are parsed once,
+        thus this definition is meant to be used when processing many attributes at once.
+
+    Usage::
+
+        >>> data = {"Attribute Compound": "@Link | Value | Boolean | Link Parameter"}
+        >>> attribute_compounds = foundations.parsers.get_attribute_compounds(data)
+        >>> attribute_compounds["Attribute Compound"].link
+        u'@Link'
+
+    :param mapping: Attributes, values mapping.
+    :type mapping: dict
+    :param splitter: Splitter.
+    :type splitter: unicode
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Attributes compounds.
+    :rtype: OrderedDict
+    """
+
+    attribute_compounds = OrderedDict()
+    for attribute, value in mapping.iteritems():
+        attribute_compounds[attribute] = AttributeCompoundRecord(
+            attribute, *_get_attribute_compound_fields(value, splitter, binding_identifier))
+    return attribute_compounds
+
+
+_ATTRIBUTE_COMPOUND_FIELDS_CACHE = {}
+"""
+:param _ATTRIBUTE_COMPOUND_FIELDS_CACHE: Attributes compounds fields cache, also storing
+    the binding identifiers compiled patterns.
+:type _ATTRIBUTE_COMPOUND_FIELDS_CACHE: dict
+"""
+
+
+def _get_attribute_compound_fields(value, splitter="|", binding_identifier="@"):
+    """
+    Returns the attribute compound fields of given value, the fields of unicode values being memoized.
+
+    :param value: Attribute value.
+    :type value: object
+    :param splitter: Splitter.
+    :type splitter: unicode
+    :param binding_identifier: Binding identifier.
+    :type binding_identifier: unicode
+    :return: Value, link, type, alias.
+    :rtype: tuple
+    """
+
+    if type(value) is not unicode:
+        return value, None, None, None
+
+    key = (value, splitter, binding_identifier)
+    fields = _ATTRIBUTE_COMPOUND_FIELDS_CACHE.get(key)
+    if fields is not None:
+        return fields
+
+    pattern = _ATTRIBUTE_COMPOUND_FIELDS_CACHE.get(binding_identifier)
+    if pattern is None:
+        pattern = _ATTRIBUTE_COMPOUND_FIELDS_CACHE[binding_identifier] = re.compile(
+            r"{0}\w*".format(binding_identifier))
+
+    fields = value, None, None, None
+    if splitter in value:
+        value_tokens = value.split(splitter)
+        if len(value_tokens) >= 3 and pattern.search(value_tokens[0]):
+            fields = (value_tokens[1].strip(),
+                      value_tokens[0].strip(),
+                      value_tokens[2].strip(),
+                      len(value_tokens) == 4 and value_tokens[3].strip() or None)
+    elif pattern.search(value):
+        fields = None, value, None, None
+
+    if len(_ATTRIBUTE_COMPOUND_FIELDS_CACHE) >= 65536:
+        _ATTRIBUTE_COMPOUND_FIELDS_CACHE.clear()
+    _ATTRIBUTE_COMPOUND_FIELDS_CACHE[key] = fields
+    return fields
+
+
+def _map_files(function, arguments, workers=None, executor="process"):
+    """
+    Maps given files parsing definition on given arguments using a pool of workers.
+
+    :param function: Files parsing definition.
+    :type function: object
+    :param arguments: Files parsing definition arguments.
+    :type arguments: list
+    :param workers: Workers count, defaults to the cpu count.
+    :type workers: int
+    :param executor: Executor type, either 'process' or 'thread'.
+    :type executor: unicode
+    :return: Files parsing results.
+    :rtype: list
+    """
+
+    if executor == "process":
+        pool_class = multiprocessing.Pool
+    elif executor == "thread":
+        pool_class = multiprocessing.pool.ThreadPool
+    else:
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' executor is not supported, use 'process' or 'thread'!".format(__name__, executor))
+
+    workers = workers or multiprocessing.cpu_count()
+
+    LOGGER.debug("> Mapping '{0}' files using '{1}' '{2}' workers.".format(len(arguments), workers, executor))
+
+    if workers == 1 or len(arguments) <= 1:
+        return map(function, arguments)
+
+    pool = pool_class(min(workers, len(arguments)))
+    try:
+        return pool.map(function, arguments, max(1, len(arguments) // (workers * 4)))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _parse_sections_file(arguments):
+    """
+    Parses given sections file, this definition is executed by :func:`parse_sections_files` definition workers.
+
+    :param arguments: Sections file path, parser options, parsing options.
+    :type arguments: tuple
+    :return: Sections, comments, parsing errors.
+    :rtype: tuple
+    """
+
+    path, parser_options, parse_options = arguments
+
+    sections_file_parser = SectionsFileParser(path, **parser_options)
+    try:
+        if not foundations.common.path_exists(path):
+            raise foundations.exceptions.FileExistsError("'{0}' file doesn't exists!".format(path))
+
+        sections_file_parser.parse(raise_parsing_errors=False, **parse_options)
+    except Exception as error:
+        sections_file_parser.parsing_errors.append(foundations.exceptions.FileStructureParsingError(
+            "{0} | '{1}' file cannot be parsed: '{2}'.".format(SectionsFileParser.__name__, path, error)))
+
+    return sections_file_parser.sections, sections_file_parser.comments, sections_file_parser.parsing_errors
+
+
+def parse_sections_files(paths, workers=None, executor="process", parser_options=None, **parse_options):
+    """
+    | Parses given sections files in parallel and returns the :class:`SectionsFileParser` class instances
+        in the same order than given paths.
+    | A file failing to parse does not abort the batch, its errors are stored
+        in :obj:`SectionsFileParser.parsing_errors` class property, thus the **raise_parsing_errors**
+        parsing option is not supported.
+
+    Usage::
+
+        >>> sections_files_parsers = parse_sections_files(["standard.rc", "standard.ibl"], workers=2)
+        >>> sections_files_parsers[0].sections.keys()
+        [u'Component', u'Informations']
+
+    :param paths: Sections files paths.
+    :type paths: list
+    :param workers: Workers count, defaults to the cpu count.
+    :type workers: int
+    :param executor: Executor type, either 'process' or 'thread'.
+    :type executor: unicode
+    :param parser_options: :class:`SectionsFileParser` class arguments.
+    :type parser_options: dict
+    :param \*\*parse_options: :meth:`SectionsFileParser.parse` method arguments.
+    :type \*\*parse_options: dict
+    :return: SectionFileParser instances.
+    :rtype: list
+    """
+
+    if "raise_parsing_errors" in parse_options:
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | 'raise_parsing_errors' parsing option is not supported!".format(__name__))
+
+    parser_options = parser_options or {}
+
+    LOGGER.debug("> Parsing '{0}' sections files.".format(len(paths)))
+
+    results = _map_files(_parse_sections_file,
+                         [(path, parser_options, parse_options) for path in paths],
+                         workers,
+                         executor)
+
+    sections_files_parsers = []
+    for path, (sections, comments, parsing_errors) in zip(paths, results):
+        sections_file_parser = SectionsFileParser(path, **parser_options)
+        sections_file_parser.sections = sections
+        sections_file_parser.comments = comments
+        sections_file_parser.parsing_errors = parsing_errors
+        sections_files_parsers.append(sections_file_parser)
+    return sections_files_parsers
+
+
+def _parse_plist_file(arguments):
+    """
+    Parses given plist file, this definition is executed by :func:`parse_plist_files` definition workers.
+
+    :param arguments: Plist file path, parsing options.
+    :type arguments: tuple
+    :return: Elements, parsing errors.
+    :rtype: tuple
+    """
+
+    path, parse_options = arguments
+
+    plist_file_parser = PlistFileParser(path)
+    try:
+        if not foundations.common.path_exists(path):
+            raise foundations.exceptions.FileExistsError("'{0}' file doesn't exists!".format(path))
+
+        plist_file_parser.parse(raise_parsing_errors=False, **parse_options)
+    except Exception as error:
+        plist_file_parser.parsing_errors = (plist_file_parser.parsing_errors or []) + [
+            foundations.exceptions.FileStructureParsingError(
+                "{0} | '{1}' file cannot be parsed: '{2}'.".format(PlistFileParser.__name__, path, error))]
+
+    return plist_file_parser.elements, plist_file_parser.parsing_errors or []
+
+
+def parse_plist_files(paths, workers=None, executor="process", **parse_options):
+    """
+    | Parses given plist files in parallel and returns a :class:`PlistFilesStore` class instance
+        holding them in the same order than given paths.
+    | A file failing to parse does not abort the batch, its errors are stored
+        in :obj:`PlistFileParser.parsing_errors` class property.
+    | The **backend** and **lazy_data** parsing options are supported, the elements being indexed
+        by the returned :class:`PlistFilesStore` class instance and the parsing errors being always collected.
+
+    Usage::
+
+        >>> plist_files_store = parse_plist_files(["standard.plist", "standard_binary.plist"], workers=2)
+        >>> plist_files_store.get_value("String A")
+        (u'standard.plist', u'My Value A')
+
+    :param paths: Plist files paths.
+    :type paths: list
+    :param workers: Workers count, defaults to the cpu count.
+    :type workers: int
+    :param executor: Executor type, either 'process' or 'thread'.
+    :type executor: unicode
+    :param \*\*parse_options: :meth:`PlistFileParser.parse` method **backend** and **lazy_data** arguments.
+    :type \*\*parse_options: dict
+    :return: PlistFilesStore instance.
+    :rtype: PlistFilesStore
+    """
+
+    for option in parse_options:
+        if option not in ("backend", "lazy_data"):
+            raise foundations.exceptions.ProgrammingError(
+                "{0} | '{1}' parsing option is not supported!".format(__name__, option))
+
+    LOGGER.debug("> Parsing '{0}' plist files.".format(len(paths)))
+
+    results = _map_files(_parse_plist_file, [(path, parse_options) for path in paths], workers, executor)
 
-    return AttributeCompound(name=attribute, value=value, link=None, type=None, alias=None)
+    plist_files_store = PlistFilesStore()
+    for path, (elements, parsing_errors) in zip(paths, results):
+        plist_file_parser = PlistFileParser(path)
+        plist_file_parser.elements = elements
+        plist_file_parser.parsing_errors = parsing_errors
+        plist_files_store.add_plist_file_parser(plist_file_parser)
+    return plist_files_store
@@ -23,6 +23,7 @@ import random
 import re
 
 import foundations.common
+import foundations.exceptions
 import foundations.verbose
 
 __author__ = "Thomas Mansencal"
@@ -35,6 +36,7 @@ __status__ = "Production"
 __all__ = ["LOGGER",
            "ASCII_CHARACTERS",
            "to_string",
+           "FilterSet",
            "get_nice_name",
            "get_version_rank",
            "get_splitext_basename",
@@ -59,6 +61,212 @@ ASCII_CHARACTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ01234567
 to_string = foundations.verbose.to_unicode
 
 
+class FilterSet(object):
+    """
+    | Defines a set of regex filters in and filters out compiled once and used to filter words.
+    | The filters of each set are combined into a single alternation pattern, unless they contain
+        constructs depending on the whole pattern like backreferences, named groups or inline flags,
+        in which case they are compiled separately.
+    """
+
+    def __init__(self, filters_in=None, filters_out=None, flags=0):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> filter_set = FilterSet(filters_in=("John", "Doe"), filters_out=("Jane",))
+            >>> filter_set.filter(["Users", "are", "John", "Doe", "Jane", "Doe", "Z6PO"])
+            [u'John', u'Doe', u'Doe']
+            >>> filter_set.matches("Jane Doe")
+            False
+
+        :param filters_in: Regex filters in list.
+        :type filters_in: tuple or list
+        :param filters_out: Regex filters out list.
+        :type filters_out: tuple or list
+        :param flags: Regex flags.
+        :type flags: int
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__filters_in = filters_in
+        self.__filters_out = filters_out
+        self.__flags = flags
+
+        self.__patterns_in = self.__compile_filters(filters_in)
+        self.__patterns_out = self.__compile_filters(filters_out)
+
+    @property
+    def filters_in(self):
+        """
+        Property for **self.__filters_in** attribute.
+
+        :return: self.__filters_in.
+        :rtype: tuple or list
+        """
+
+        return self.__filters_in
+
+    @filters_in.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self, value):
+        """
+        Setter for **self.__filters_in** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "filters_in"))
+
+    @filters_in.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_in(self):
+        """
+        Deleter for **self.__filters_in** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_in"))
+
+    @property
+    def filters_out(self):
+        """
+        Property for **self.__filters_out** attribute.
+
+        :return: self.__filters_out.
+        :rtype: tuple or list
+        """
+
+        return self.__filters_out
+
+    @filters_out.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self, value):
+        """
+        Setter for **self.__filters_out** attribute.
+
+        :param value: Attribute value.
+        :type value: tuple or list
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "filters_out"))
+
+    @filters_out.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def filters_out(self):
+        """
+        Deleter for **self.__filters_out** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "filters_out"))
+
+    @property
+    def flags(self):
+        """
+        Property for **self.__flags** attribute.
+
+        :return: self.__flags.
+        :rtype: int
+        """
+
+        return self.__flags
+
+    @flags.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def flags(self, value):
+        """
+        Setter for **self.__flags** attribute.
+
+        :param value: Attribute value.
+        :type value: int
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "flags"))
+
+    @flags.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def flags(self):
+        """
+        Deleter for **self.__flags** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "flags"))
+
+    def __compile_filters(self, filters):
+        """
+        | Compiles given filters, combining them into alternation patterns when possible.
+        | Each alternation pattern is kept under the regular expressions engine capturing groups limit.
+
+        :param filters: Regex filters.
+        :type filters: tuple or list
+        :return: Compiled patterns.
+        :rtype: tuple
+        """
+
+        if not filters:
+            return ()
+
+        combinable = [filter for filter in filters
+                      if isinstance(filter, basestring) and not self.__flags & re.VERBOSE and
+                      not re.search(r"\\[1-9]|\(\?(?![:=!]|<=|<!)", filter)]
+        chunks, groups = [], 0
+        for filter in combinable:
+            pattern = re.compile(filter, self.__flags)
+            if not chunks or groups + pattern.groups > 99:
+                chunks.append([])
+                groups = 0
+            chunks[-1].append((filter, pattern))
+            groups += pattern.groups
+
+        patterns = [re.compile(filter, self.__flags) for filter in filters if filter not in combinable]
+        for i, chunk in enumerate(chunks):
+            if len(chunk) == 1:
+                patterns.insert(i, chunk[0][1])
+            else:
+                patterns.insert(i, re.compile("|".join("(?:{0})".format(filter) for filter, pattern in chunk),
+                                              self.__flags))
+        return tuple(patterns)
+
+    def matches(self, word):
+        """
+        Returns if given word matches one of the filters in and none of the filters out.
+
+        :param word: Word to match.
+        :type word: unicode
+        :return: Word matches.
+        :rtype: bool
+        """
+
+        if self.__patterns_in and not any(pattern.search(word) for pattern in self.__patterns_in):
+            return False
+
+        if self.__patterns_out and any(pattern.search(word) for pattern in self.__patterns_out):
+            return False
+
+        return True
+
+    def filter(self, words):
+        """
+        Filters given words.
+
+        :param words: Words to filter.
+        :type words: list
+        :return: Filtered words.
+        :rtype: list
+        """
+
+        return [word for word in words if self.matches(word)]
+
+
 def get_nice_name(name):
     """
     Converts a string to nice string: **currentLogText** -> **Current Log Text**.
@@ -192,9 +400,11 @@ def get_words(data):
     return words
 
 
-def filter_words(words, filters_in=None, filters_out=None, flags=0):
+def filter_words(words, filters_in=None, filters_out=None, flags=0, filter_set=None):
     """
-    Filters the words using the given filters.
+    | Filters the words using the given filters.
+    | A :class:`FilterSet` class instance can be given to reuse filters compiled once, in which case
+        the **filters_in**, **filters_out** and **flags** arguments are ignored.
 
     Usage::
 
@@ -211,10 +421,17 @@ def filter_words(words, filters_in=None, filters_out=None, flags=0):
     :type filters_in: tuple or list
     :param flags: Regex flags.
     :type flags: int
+    :param filter_set: Compiled filters.
+    :type filter_set: FilterSet
     :return: Filtered words.
     :rtype: list
     """
 
+    if filter_set is not None:
+        filtered_words = filter_set.filter(words)
+        LOGGER.debug("> Filtered words: '{0}'".format(", ".join(filtered_words)))
+        return filtered_words
+
     filtered_words = []
     for word in words:
         if filters_in:
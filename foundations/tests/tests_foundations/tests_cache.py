@@ -16,7 +16,10 @@
 
 from __future__ import unicode_literals
 
+import os
+import shutil
 import sys
+import tempfile
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
@@ -24,6 +27,7 @@ else:
     import unittest
 
 from foundations.cache import Cache
+from foundations.cache import PersistentCache
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
@@ -33,7 +37,8 @@ __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
 __all__ = ["RESOURCES_DIRECTORY",
-           "TestCache"]
+           "TestCache",
+           "TestPersistentCache"]
 
 
 class TestCache(unittest.TestCase):
@@ -95,6 +100,121 @@ class TestCache(unittest.TestCase):
         self.assertDictEqual(cache, {})
 
 
+class TestPersistentCache(unittest.TestCase):
+    """
+    Defines :class:`foundations.cache.PersistentCache` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests environment.
+        """
+
+        self.__directory = unicode(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """
+        Cleans the tests environment.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("directory",
+                               "maximum_size")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PersistentCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("add_content",
+                            "remove_content",
+                            "get_content",
+                            "flush_content")
+
+        for method in required_methods:
+            self.assertIn(method, dir(PersistentCache))
+
+    def test_add_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.add_content` method.
+        """
+
+        cache = PersistentCache(self.__directory)
+        self.assertTrue(cache.add_content(("John", "Doe"), {"Luke": "Skywalker"}))
+        self.assertDictEqual(PersistentCache(self.__directory).get_content(("John", "Doe")), {"Luke": "Skywalker"})
+        self.assertFalse(cache.add_content("John", lambda: None))
+
+        for i in range(8):
+            self.assertTrue(cache.add_content("Luke", "-" * 1024 * i))
+        self.assertEqual(cache.get_content("Luke"), "-" * 1024 * 7)
+        self.assertEqual(cache._PersistentCache__size, sum(os.path.getsize(os.path.join(self.__directory, file))
+                                                           for file in os.listdir(self.__directory)))
+
+    def test_remove_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.remove_content` method.
+        """
+
+        cache = PersistentCache(self.__directory)
+        cache.add_content("John", "Doe")
+        cache.add_content("Luke", "Skywalker")
+        self.assertTrue(cache.remove_content("John", "Luke"))
+        self.assertIsNone(cache.get_content("John"))
+        self.assertIsNone(cache.get_content("Luke"))
+
+    def test_get_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.get_content` method.
+        """
+
+        cache = PersistentCache(self.__directory)
+        content = {"John": "Doe", "Luke": "Skywalker"}
+        for key, value in content.iteritems():
+            cache.add_content(key, value)
+        for key, value in content.iteritems():
+            self.assertEqual(cache.get_content(key), value)
+        self.assertEqual(cache.get_content("Anakin", "Skywalker"), "Skywalker")
+
+        for file in os.listdir(self.__directory):
+            with open(os.path.join(self.__directory, file), "wb") as output:
+                output.write(b"Corrupted")
+        self.assertIsNone(cache.get_content("John"))
+        self.assertEqual(len(os.listdir(self.__directory)), 1)
+
+    def test_flush_content(self):
+        """
+        Tests :meth:`foundations.cache.PersistentCache.flush_content` method.
+        """
+
+        cache = PersistentCache(self.__directory)
+        cache.add_content("John", "Doe")
+        cache.add_content("Luke", "Skywalker")
+        self.assertTrue(cache.flush_content())
+        self.assertListEqual(os.listdir(self.__directory), [])
+
+    def test_eviction(self):
+        """
+        Tests :class:`foundations.cache.PersistentCache` class least recently used content eviction.
+        """
+
+        cache = PersistentCache(self.__directory, maximum_size=4096)
+        for i in range(8):
+            cache.add_content(i, "-" * 1024)
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.__directory, file))
+                                 for file in os.listdir(self.__directory)), 4096)
+        self.assertEqual(cache.get_content(7), "-" * 1024)
+        self.assertIsNone(cache.get_content(0))
+
+
 if __name__ == "__main__":
     import foundations.tests.utilities
 
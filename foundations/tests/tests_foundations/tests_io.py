@@ -88,6 +88,7 @@ class TestFile(unittest.TestCase):
         """
 
         required_methods = ("cache",
+                            "stream",
                             "uncache",
                             "read",
                             "write",
@@ -109,6 +110,15 @@ class TestFile(unittest.TestCase):
         self.assertIsInstance(io_file.content, list)
         self.assertListEqual(io_file.content, FILE_CONTENT)
 
+    def test_stream(self):
+        """
+        Tests :meth:`foundations.io.File.stream` method.
+        """
+
+        io_file = File(TEXT_FILE)
+        self.assertListEqual(list(io_file.stream()), FILE_CONTENT)
+        self.assertListEqual(io_file.content, [])
+
     def test_uncache(self):
         """
         Tests :meth:`foundations.io.File.uncache` method.
@@ -146,6 +156,59 @@ class TestFile(unittest.TestCase):
         self.assertListEqual(io_file.content, FILE_CONTENT)
         os.close(file_descriptor)
 
+        file_descriptor, path = tempfile.mkstemp()
+        os.chmod(path, 0o644)
+        io_file = File(unicode(path))
+        io_file.content = FILE_CONTENT
+        self.assertTrue(io_file.write(atomic=True))
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
+        self.assertFalse([file for file in os.listdir(os.path.dirname(path))
+                          if file.startswith(".{0}.".format(os.path.basename(path)))])
+        io_file.cache()
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+
+        io_file.content = FILE_CONTENT[:1]
+        self.assertIsNone(io_file.write(mode="a", atomic=True))
+        io_file.cache()
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+        os.close(file_descriptor)
+
+    def test_write_atomic_windows(self):
+        """
+        Tests :meth:`foundations.io.File.write` method in atomic mode on Windows.
+        """
+
+        moves = []
+
+        class Kernel32(object):
+            def MoveFileExW(self, source, target, flags):
+                moves.append((source, target, flags, os.path.exists(target)))
+                os.rename(source, target)
+                return 1
+
+        file_descriptor, path = tempfile.mkstemp()
+        io_file = File(unicode(path))
+        io_file.content = FILE_CONTENT
+        system, windll = foundations.io.platform.system, getattr(foundations.io.ctypes, "windll", None)
+        foundations.io.platform.system = lambda: "Windows"
+        foundations.io.ctypes.windll = type(b"WinDLL", (object,), {"kernel32": Kernel32()})
+        try:
+            self.assertTrue(io_file.write(atomic=True))
+        finally:
+            foundations.io.platform.system = system
+            if windll is None:
+                del foundations.io.ctypes.windll
+            else:
+                foundations.io.ctypes.windll = windll
+
+        self.assertEqual(len(moves), 1)
+        self.assertEqual(moves[0][1], path)
+        self.assertTrue(moves[0][2] & 0x1)
+        self.assertTrue(moves[0][3])
+        io_file.cache()
+        self.assertListEqual(io_file.content, FILE_CONTENT)
+        os.close(file_descriptor)
+
     def test_append(self):
         """
         Tests :meth:`foundations.io.File.append` method.
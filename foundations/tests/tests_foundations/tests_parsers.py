@@ -16,8 +16,12 @@
 
 from __future__ import unicode_literals
 
+import collections
 import datetime
 import os
+import pickle
+import shutil
+import struct
 import tempfile
 import sys
 
@@ -28,10 +32,16 @@ else:
     import unittest
     from collections import OrderedDict
 
+import foundations.common
+import foundations.exceptions
 import foundations.namespace
 import foundations.parsers
 import foundations.walkers
+from foundations.cache import PersistentCache
+from foundations.parsers import PlistData
 from foundations.parsers import PlistFileParser
+from foundations.parsers import PlistFilesStore
+from foundations.parsers import SectionAttributes
 from foundations.parsers import SectionsFileParser
 
 __author__ = "Thomas Mansencal"
@@ -60,9 +70,15 @@ __all__ = ["RESOURCES_DIRECTORY",
            "SCRIPT_RAW_SECTION",
            "CHINESE_IBL_SET_FILE",
            "CHINESE_IBL_SET_FILE_RANDOM_ATTRIBUTES",
+           "TestSectionAttributes",
            "TestSectionsFileParser",
+           "TestPlistData",
            "TestPlistFileParser",
-           "TestGetAttributeCompound"]
+           "TestGetAttributeCompound",
+           "TestGetAttributeCompounds",
+           "TestPlistFilesStore",
+           "TestParseSectionsFiles",
+           "TestParsePlistFiles"]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
 COMPONENT_FILE = os.path.join(RESOURCES_DIRECTORY, "standard.rc")
@@ -72,6 +88,7 @@ DEFAULTS_FILE = os.path.join(RESOURCES_DIRECTORY, "defaults.rc")
 STRIPPING_FILE = os.path.join(RESOURCES_DIRECTORY, "stripping.rc")
 PARSING_ERRORS_FILE = os.path.join(RESOURCES_DIRECTORY, "parsing_errors.rc")
 PLIST_FILE = os.path.join(RESOURCES_DIRECTORY, "standard.plist")
+BINARY_PLIST_FILE = os.path.join(RESOURCES_DIRECTORY, "standard_binary.plist")
 STANDARD_FILES = {"component": COMPONENT_FILE,
                   "ibl_set": IBL_SET_FILE,
                   "template": TEMPLATE_FILE}
@@ -378,6 +395,91 @@ PLIST_FILE_CONTENT = {"Dictionary A": {"String C": "My Value C", "String B": "My
                       "Data A": "My Value B"}
 
 
+class TestSectionAttributes(unittest.TestCase):
+    """
+    Defines :class:`foundations.parsers.SectionAttributes` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("prefix",)
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SectionAttributes))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__getitem__",
+                            "__setitem__",
+                            "__delitem__",
+                            "__iter__",
+                            "__contains__",
+                            "__len__",
+                            "iteritems",
+                            "itervalues",
+                            "items",
+                            "values",
+                            "iterkeys",
+                            "keys",
+                            "get",
+                            "update",
+                            "setdefault",
+                            "pop",
+                            "popitem",
+                            "clear",
+                            "copy")
+
+        for method in required_methods:
+            self.assertIn(method, dir(SectionAttributes))
+
+    def test_section_attributes(self):
+        """
+        Tests :class:`foundations.parsers.SectionAttributes` class.
+        """
+
+        names = {}
+        section_attributes = SectionAttributes("Section A|", names)
+        section_attributes["Section A|Attribute 1"] = "Value A"
+        section_attributes["Attribute 2"] = "Value B"
+        section_attributes["Section A|Attribute 3"] = "Value C"
+        self.assertListEqual(section_attributes.items(), [("Section A|Attribute 1", "Value A"),
+                                                          ("Attribute 2", "Value B"),
+                                                          ("Section A|Attribute 3", "Value C")])
+        self.assertIn("Section A|Attribute 1", section_attributes)
+        self.assertNotIn("Attribute 1", section_attributes)
+        self.assertEqual(section_attributes["Attribute 2"], "Value B")
+        self.assertDictEqual(names, {"Attribute 1": "Attribute 1", "Attribute 3": "Attribute 3"})
+
+        del section_attributes["Section A|Attribute 1"]
+        self.assertEqual(len(section_attributes), 2)
+        self.assertEqual(section_attributes, {"Attribute 2": "Value B", "Section A|Attribute 3": "Value C"})
+        self.assertEqual(section_attributes.copy(), section_attributes)
+        self.assertListEqual(pickle.loads(pickle.dumps(section_attributes, pickle.HIGHEST_PROTOCOL)).items(),
+                             section_attributes.items())
+
+        section_attributes = SectionAttributes(items=[("Attribute 1", "Value A")])
+        self.assertListEqual(section_attributes.keys(), ["Attribute 1"])
+        self.assertIsInstance(section_attributes, collections.MutableMapping)
+        self.assertFalse(hasattr(section_attributes, "__dict__"))
+
+        section_attributes.update({"Attribute 2": "Value B"})
+        self.assertEqual(section_attributes.get("Attribute 2"), "Value B")
+        self.assertEqual(section_attributes.get("Attribute 3", "Value C"), "Value C")
+        self.assertEqual(section_attributes.setdefault("Attribute 3", "Value C"), "Value C")
+        self.assertEqual(section_attributes.pop("Attribute 3"), "Value C")
+        self.assertEqual(section_attributes.pop("Attribute 3", None), None)
+        self.assertTupleEqual(section_attributes.popitem(), ("Attribute 2", "Value B"))
+        self.assertNotEqual(section_attributes, {})
+        section_attributes.clear()
+        self.assertEqual(section_attributes, {})
+
+
 class TestSectionsFileParser(unittest.TestCase):
     """
     Defines :class:`foundations.parsers.SectionsFileParser` class units tests methods.
@@ -400,7 +502,9 @@ class TestSectionsFileParser(unittest.TestCase):
                                "sections",
                                "comments",
                                "parsing_errors",
-                               "preserve_order")
+                               "preserve_order",
+                               "compact_storage",
+                               "maximum_parsing_errors")
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(SectionsFileParser))
@@ -411,11 +515,15 @@ class TestSectionsFileParser(unittest.TestCase):
         """
 
         required_methods = ("parse",
+                            "reparse",
+                            "iter_parse",
+                            "parse_attribute_compounds",
                             "section_exists",
                             "attribute_exists",
                             "get_attributes",
                             "get_all_attributes",
                             "get_value",
+                            "get_values",
                             "set_value",
                             "write")
 
@@ -492,6 +600,308 @@ class TestSectionsFileParser(unittest.TestCase):
             self.assertIsInstance(sections_file_parser.sections, dict)
             self.assertIsInstance(sections_file_parser.comments, dict)
 
+    def test_parse_compact_storage(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method with compact sections storage.
+        """
+
+        for type, file in STANDARD_FILES.iteritems():
+            for namespaces in (True, False):
+                sections_file_parser = SectionsFileParser(file)
+                sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], namespaces=namespaces)
+
+                compact_sections_file_parser = SectionsFileParser(file, compact_storage=True)
+                compact_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                                   namespaces=namespaces)
+                for section, attributes in compact_sections_file_parser.sections.iteritems():
+                    self.assertIsInstance(attributes, SectionAttributes)
+                    self.assertListEqual(attributes.items(), sections_file_parser.sections[section].items())
+                    self.assertListEqual(compact_sections_file_parser.get_attributes(section,
+                                                                                     strip_namespaces=True).items(),
+                                         sections_file_parser.get_attributes(section, strip_namespaces=True).items())
+                self.assertListEqual(compact_sections_file_parser.get_all_attributes().items(),
+                                     sections_file_parser.get_all_attributes().items())
+
+            for attribute, value in RANDOM_ATTRIBUTES[type].iteritems():
+                self.assertEqual(compact_sections_file_parser.get_value(foundations.namespace.remove_namespace(
+                    attribute, root_only=True), foundations.namespace.get_namespace(attribute, root_only=True)), value)
+
+    def test_parse_lazy(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method in lazy mode.
+        """
+
+        for type, file in STANDARD_FILES.iteritems():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            lazy_sections_file_parser = SectionsFileParser(file)
+            lazy_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                            strip_comments=False,
+                                            raise_parsing_errors=False,
+                                            lazy=True)
+            for attribute, value in RANDOM_ATTRIBUTES[type].iteritems():
+                self.assertEqual(lazy_sections_file_parser.get_value(attribute,
+                                                                     foundations.namespace.get_namespace(
+                                                                         attribute, root_only=True)), value)
+            self.assertListEqual(lazy_sections_file_parser.sections.items(), sections_file_parser.sections.items())
+            self.assertListEqual(lazy_sections_file_parser.comments.items(), sections_file_parser.comments.items())
+            self.assertListEqual(lazy_sections_file_parser.content, [])
+
+            lazy_sections_file_parser = SectionsFileParser(file)
+            lazy_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                            strip_comments=False,
+                                            raise_parsing_errors=False,
+                                            lazy=True)
+            self.assertListEqual(lazy_sections_file_parser.comments.items(), sections_file_parser.comments.items())
+
+        sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+        sections_file_parser.parse(raise_parsing_errors=False, lazy=True)
+        self.assertListEqual(sorted(exception.line for exception in sections_file_parser.parsing_errors),
+                             sorted(PARSING_ERRORS_LINES_AND_VALUES))
+        self.assertEqual(len(sections_file_parser), 2)
+
+        sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+        self.assertIsNone(sections_file_parser.parse(lazy=True))
+        self.assertListEqual(sorted(exception.line for exception in sections_file_parser.parsing_errors),
+                             sorted(PARSING_ERRORS_LINES_AND_VALUES))
+
+    @unittest.skipIf(foundations.parsers._parsers is None, "'foundations._parsers' module is not available!")
+    def test_parse_compiled_tokenizer(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method with the compiled tokenizer.
+        """
+
+        def parse(file, compiled_tokenizer, **kwargs):
+            tokenizer = foundations.parsers._parsers
+            foundations.parsers._parsers = tokenizer if compiled_tokenizer else None
+            try:
+                sections_file_parser = SectionsFileParser(file)
+                sections_file_parser.parse(raise_parsing_errors=False, **kwargs)
+            finally:
+                foundations.parsers._parsers = tokenizer
+            return (sections_file_parser.sections.items(),
+                    sections_file_parser.comments.items(),
+                    [(exception.line, exception.value) for exception in sections_file_parser.parsing_errors])
+
+        for type, file in STANDARD_FILES.items() + [("parsing_errors", PARSING_ERRORS_FILE)]:
+            for namespaces in (True, False):
+                for strip_whitespaces in (True, False):
+                    for strip_quotation_markers in (True, False):
+                        options = {"raw_sections": STANDARD_FILES_RAW_SECTIONS.get(type),
+                                   "namespaces": namespaces,
+                                   "strip_comments": False,
+                                   "strip_whitespaces": strip_whitespaces,
+                                   "strip_quotation_markers": strip_quotation_markers}
+                        self.assertEqual(parse(file, True, **options), parse(file, False, **options))
+
+    def test_parse_memory_map(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method in memory map mode.
+        """
+
+        for type, file in STANDARD_FILES.iteritems():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            mapped_sections_file_parser = SectionsFileParser(file)
+            mapped_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                              strip_comments=False,
+                                              memory_map=True)
+            self.assertListEqual(mapped_sections_file_parser.sections.items(), sections_file_parser.sections.items())
+            self.assertListEqual(mapped_sections_file_parser.comments.items(), sections_file_parser.comments.items())
+            self.assertListEqual(mapped_sections_file_parser.content, [])
+
+        sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+        self.assertIsNone(sections_file_parser.parse(memory_map=True))
+        self.assertListEqual([(exception.line, exception.value) for exception in sections_file_parser.parsing_errors],
+                             [(exception.line, exception.value) for exception in
+                              SectionsFileParser(PARSING_ERRORS_FILE).parse(
+                                  raise_parsing_errors=False).parsing_errors])
+
+        file_descriptor, path = tempfile.mkstemp(suffix=".rc")
+        with open(path, "wb") as file:
+            file.write(b"[Section A]\r\nJohn = D\xc3\xb6e\rJane = Doe\n")
+        sections_file_parser = SectionsFileParser(unicode(path))
+        sections_file_parser.parse(memory_map=True)
+        self.assertDictEqual(sections_file_parser.sections["Section A"],
+                             {"Section A|John": "D\xf6e", "Section A|Jane": "Doe"})
+        self.assertTrue(sections_file_parser.content)
+        os.close(file_descriptor)
+        os.remove(path)
+
+    def test_parse_cache(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse` method with a persistent cache.
+        """
+
+        temp_directory = tempfile.mkdtemp()
+        cache = PersistentCache(unicode(temp_directory))
+        for type, file in STANDARD_FILES.iteritems():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type], strip_comments=False)
+
+            for i in range(2):
+                cached_sections_file_parser = SectionsFileParser(file)
+                cached_sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type],
+                                                  strip_comments=False,
+                                                  cache=cache)
+                self.assertListEqual(cached_sections_file_parser.sections.items(),
+                                     sections_file_parser.sections.items())
+                self.assertListEqual(cached_sections_file_parser.comments.items(),
+                                     sections_file_parser.comments.items())
+            self.assertListEqual(cached_sections_file_parser.content, [])
+
+        for i in range(2):
+            sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+            self.assertIsNone(sections_file_parser.parse(cache=cache))
+            self.assertListEqual(sorted(exception.line for exception in sections_file_parser.parsing_errors),
+                                 sorted(PARSING_ERRORS_LINES_AND_VALUES))
+
+        file_descriptor, path = tempfile.mkstemp(dir=temp_directory, suffix=".rc")
+        with open(path, "w") as file:
+            file.write("[Section A]\nJohn = Doe\n")
+        SectionsFileParser(unicode(path)).parse(cache=cache)
+        os.utime(path, (0, 0))
+        with open(path, "w") as file:
+            file.write("[Section A]\nJohn = Skywalker\n")
+        sections_file_parser = SectionsFileParser(unicode(path)).parse(cache=cache)
+        self.assertEqual(sections_file_parser.get_value("John", "Section A"), "Skywalker")
+        os.close(file_descriptor)
+        shutil.rmtree(temp_directory)
+
+    def test_parse_attribute_compounds(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.parse_attribute_compounds` method.
+        """
+
+        sections_file_parser = SectionsFileParser(TEMPLATE_FILE)
+        sections_file_parser.parse(raw_sections=("Script",))
+        attribute_compounds = SectionsFileParser(TEMPLATE_FILE).parse_attribute_compounds(raw_sections=("Script",))
+        self.assertListEqual(attribute_compounds.keys(), sections_file_parser.sections.keys())
+        for section, attributes in sections_file_parser.sections.iteritems():
+            for attribute, value in attributes.iteritems():
+                self.assertDictEqual(attribute_compounds[section][attribute]._asdict(),
+                                     dict(foundations.parsers.get_attribute_compound(attribute, value)))
+
+        temp_directory = tempfile.mkdtemp()
+        cache = PersistentCache(unicode(temp_directory))
+        path = os.path.join(temp_directory, "standard.sIBLT")
+        shutil.copyfile(TEMPLATE_FILE, path)
+        for i in range(2):
+            cached_sections_file_parser = SectionsFileParser(unicode(path))
+            self.assertEqual(cached_sections_file_parser.parse_attribute_compounds(raw_sections=("Script",),
+                                                                                   cache=cache),
+                             attribute_compounds)
+        self.assertDictEqual(cached_sections_file_parser.sections, OrderedDict())
+
+        with open(path, "a") as file:
+            file.write("\n[Section A]\nJohn = @John | Doe | String | John Doe\n")
+        attribute_compounds = SectionsFileParser(unicode(path)).parse_attribute_compounds(raw_sections=("Script",),
+                                                                                          namespaces=False,
+                                                                                          cache=cache)
+        self.assertEqual(attribute_compounds["Section A"]["John"].value, "Doe")
+
+        path = os.path.join(temp_directory, "parsing_errors.rc")
+        shutil.copyfile(PARSING_ERRORS_FILE, path)
+        for i in range(2):
+            sections_file_parser = SectionsFileParser(unicode(path))
+            sections_file_parser.parse_attribute_compounds(raise_parsing_errors=False, cache=cache)
+            self.assertListEqual(sorted(exception.line for exception in sections_file_parser.parsing_errors),
+                                 sorted(PARSING_ERRORS_LINES_AND_VALUES))
+        shutil.rmtree(temp_directory)
+
+    def test_reparse(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.reparse` method.
+        """
+
+        file_descriptor, path = tempfile.mkstemp()
+        shutil.copyfile(COMPONENT_FILE, path)
+        sections_file_parser = SectionsFileParser(unicode(path))
+        sections_file_parser.parse(strip_comments=False)
+        self.assertFalse(sections_file_parser.reparse())
+
+        with open(path) as file:
+            content = file.read()
+        with open(path, "w") as file:
+            file.write(content.replace("Rank = 5", "Rank = 6\nStatus = Enabled").replace(
+                "Email = thomas.mansencal@gmail.com\n", "") + "\n[Dependencies]\nCore = core.global\n")
+        changes = sections_file_parser.reparse()
+        self.assertListEqual(changes.added_sections, ["Dependencies"])
+        self.assertListEqual(changes.removed_sections, [])
+        self.assertListEqual(changes.modified_sections, ["Component", "Informations"])
+        self.assertListEqual(changes.added_attributes, [("Component", "Component|Status"),
+                                                        ("Dependencies", "Dependencies|Core")])
+        self.assertListEqual(changes.removed_attributes, [("Informations", "Informations|Email")])
+        self.assertListEqual(changes.modified_attributes, [("Component", "Component|Rank")])
+
+        checking_sections_file_parser = SectionsFileParser(unicode(path))
+        checking_sections_file_parser.parse(strip_comments=False)
+        self.assertListEqual(sections_file_parser.sections.items(), checking_sections_file_parser.sections.items())
+        self.assertListEqual(sections_file_parser.comments.items(), checking_sections_file_parser.comments.items())
+
+        with open(path, "w") as file:
+            file.write(content)
+        changes = sections_file_parser.reparse()
+        self.assertListEqual(changes.removed_sections, ["Dependencies"])
+        self.assertListEqual(changes.modified_sections, ["Component", "Informations"])
+
+        sections_file_parser.set_value("Component|Rank", "Component", "7")
+        sections_file_parser.set_value("Core", "Dependencies", "core.global")
+        changes = sections_file_parser.reparse()
+        self.assertListEqual(changes.removed_sections, ["Dependencies"])
+        self.assertListEqual(changes.modified_attributes, [("Component", "Component|Rank")])
+        self.assertEqual(sections_file_parser.get_value("Rank", "Component"), "5")
+        self.assertFalse(sections_file_parser.reparse())
+        os.close(file_descriptor)
+
+    def test_reparse_compact_storage(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.reparse` method with compact storage.
+        """
+
+        for compact_storage in (False, True):
+            file_descriptor, path = tempfile.mkstemp()
+            with open(path, "w") as file:
+                file.write("[A]\na = 1\nb = 2\n")
+            sections_file_parser = SectionsFileParser(unicode(path), compact_storage=compact_storage)
+            sections_file_parser.parse()
+            self.assertFalse(sections_file_parser.reparse())
+
+            with open(path, "w") as file:
+                file.write("[A]\nb = 2\na = 1\n")
+            changes = sections_file_parser.reparse()
+            self.assertListEqual(changes.modified_sections, ["A"])
+            self.assertListEqual(sections_file_parser.sections["A"].keys(), ["A|b", "A|a"])
+            os.close(file_descriptor)
+
+    def test_iter_parse(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.iter_parse` method.
+        """
+
+        for type, file in STANDARD_FILES.iteritems():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+
+            streaming_sections_file_parser = SectionsFileParser(file)
+            sections = OrderedDict()
+            for section, attribute, value in streaming_sections_file_parser.iter_parse(
+                    raw_sections=STANDARD_FILES_RAW_SECTIONS[type]):
+                if attribute == streaming_sections_file_parser.raw_section_content_identifier:
+                    sections.setdefault(section, OrderedDict()).setdefault(attribute, []).append(value)
+                else:
+                    sections.setdefault(section, OrderedDict())[attribute] = value
+            self.assertDictEqual(sections, sections_file_parser.sections)
+            self.assertListEqual(streaming_sections_file_parser.content, [])
+
+        sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE)
+        for item in sections_file_parser.iter_parse(raise_parsing_errors=False):
+            pass
+        self.assertListEqual(sorted(exception.line for exception in sections_file_parser.parsing_errors),
+                             sorted(PARSING_ERRORS_LINES_AND_VALUES))
+
     def test_parse_international(self):
         """
         Tests :meth:`foundations.parsers.SectionsFileParser.parse` in international specific context.
@@ -601,6 +1011,19 @@ class TestSectionsFileParser(unittest.TestCase):
             self.assertIn(exception.line, PARSING_ERRORS_LINES_AND_VALUES)
             self.assertEqual(exception.value, PARSING_ERRORS_LINES_AND_VALUES[exception.line])
 
+        for maximum_parsing_errors in (0, 1, len(PARSING_ERRORS_LINES_AND_VALUES) + 1, 256):
+            sections_file_parser = SectionsFileParser(PARSING_ERRORS_FILE,
+                                                      maximum_parsing_errors=maximum_parsing_errors)
+            sections_file_parser.parse(raise_parsing_errors=False)
+            sections_file_parser.parse(raise_parsing_errors=False)
+            parsing_errors = sections_file_parser.parsing_errors
+            self.assertEqual(len(parsing_errors),
+                             min(maximum_parsing_errors, len(PARSING_ERRORS_LINES_AND_VALUES) * 2))
+            for exception in parsing_errors:
+                self.assertIsInstance(exception, foundations.exceptions.AttributeStructureParsingError)
+                self.assertEqual(exception.value, PARSING_ERRORS_LINES_AND_VALUES[exception.line])
+            self.assertIs(sections_file_parser.parsing_errors, parsing_errors)
+
     def test_section_exists(self):
         """
         Tests :meth:`foundations.parsers.SectionsFileParser.section_exists` method.
@@ -674,6 +1097,35 @@ class TestSectionsFileParser(unittest.TestCase):
             self.assertEqual(sections_file_parser.get_value("attribute", "section", default=None), None)
             self.assertEqual(sections_file_parser.get_value("attribute", "section", default=list()), list())
 
+        sections_file_parser = SectionsFileParser()
+        sections_file_parser.set_value("John", "Section A", "Doe")
+        self.assertEqual(sections_file_parser.get_value("John", "Section A"), "Doe")
+        del sections_file_parser["Section A"]["John"]
+        sections_file_parser["Section A"]["Luke"] = "Skywalker"
+        self.assertFalse(sections_file_parser.attribute_exists("John", "Section A"))
+        self.assertTrue(sections_file_parser.attribute_exists("Luke", "Section A"))
+        self.assertEqual(sections_file_parser.get_value("John", "Section A", default=None), None)
+        self.assertEqual(sections_file_parser.get_value("Luke", "Section A"), "Skywalker")
+
+    def test_get_values(self):
+        """
+        Tests :meth:`foundations.parsers.SectionsFileParser.get_values` method.
+        """
+
+        for type, file in STANDARD_FILES.iteritems():
+            sections_file_parser = SectionsFileParser(file)
+            sections_file_parser.parse(raw_sections=STANDARD_FILES_RAW_SECTIONS[type])
+            attributes = [(attribute, foundations.namespace.get_namespace(attribute, root_only=True))
+                          for attribute in RANDOM_ATTRIBUTES[type]]
+            self.assertListEqual(sections_file_parser.get_values(attributes), RANDOM_ATTRIBUTES[type].values())
+            self.assertListEqual(sections_file_parser.get_values([("attribute", "section")], default=None), [None])
+
+            section, attribute = foundations.common.get_first_item(attributes)[::-1]
+            sections_file_parser.set_value("John", section, "Doe")
+            sections_file_parser.set_value(attribute, section, "Luke")
+            self.assertListEqual(sections_file_parser.get_values([("John", section), (attribute, section)]),
+                                 ["Doe", "Luke"])
+
     def test_set_value(self):
         """
         Tests :meth:`foundations.parsers.SectionsFileParser.set_value` method.
@@ -742,6 +1194,100 @@ class TestSectionsFileParser(unittest.TestCase):
         checking_sections_file_parser.parse()
         os.close(file_descriptor)
 
+        # Sections names contained in other sections comments.
+        file_descriptor, path = tempfile.mkstemp()
+        write_sections_file_parser = SectionsFileParser(unicode(path))
+        write_sections_file_parser.sections = OrderedDict([("Section", {"Section|John": "Doe"}),
+                                                           ("Section A", {"Section A|Luke": "Skywalker"})])
+        write_sections_file_parser.comments = OrderedDict([("Section|#0", {"content": "Comment 0", "id": 0}),
+                                                           ("Section A|#1", {"content": "Comment 1", "id": 1})])
+        write_sections_file_parser.write(atomic=True)
+        self.assertEqual(write_sections_file_parser.read(),
+                         "[Section]\n; Comment 0\n; Comment 1\nJohn = Doe\n\n"
+                         "[Section A]\n; Comment 1\nLuke = Skywalker\n")
+        os.close(file_descriptor)
+
+
+class TestPlistData(unittest.TestCase):
+    """
+    Defines :class:`foundations.parsers.PlistData` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("value",)
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlistData))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("__len__",
+                            "__eq__",
+                            "__ne__",
+                            "__hash__",
+                            "__str__",
+                            "__repr__",
+                            "__reduce__",
+                            "get_buffer")
+
+        for method in required_methods:
+            self.assertIn(method, dir(PlistData))
+
+    def test_value(self):
+        """
+        Tests :attr:`foundations.parsers.PlistData.value` attribute.
+        """
+
+        self.assertEqual(PlistData(b"TXkgVmFsdWUgQg==", encoded=True).value, b"My Value B")
+        self.assertEqual(PlistData(buffer(b"My Value B")).value, b"My Value B")
+        self.assertEqual(PlistData(b"", encoded=True).value, b"")
+
+    def test__len__(self):
+        """
+        Tests :meth:`foundations.parsers.PlistData.__len__` method.
+        """
+
+        self.assertEqual(len(PlistData(b"TXkgVmFsdWUgQg==", encoded=True)), 10)
+        self.assertEqual(len(PlistData(buffer(b"My Value B", 3))), 7)
+
+    def test__eq__(self):
+        """
+        Tests :meth:`foundations.parsers.PlistData.__eq__` method.
+        """
+
+        plist_data = PlistData(b"TXkgVmFsdWUgQg==", encoded=True)
+        self.assertEqual(plist_data, b"My Value B")
+        self.assertEqual(b"My Value B", plist_data)
+        self.assertEqual(plist_data, PlistData(buffer(b"My Value B")))
+        self.assertNotEqual(plist_data, b"My Value A")
+        self.assertEqual(hash(plist_data), hash(b"My Value B"))
+
+    def test__reduce__(self):
+        """
+        Tests :meth:`foundations.parsers.PlistData.__reduce__` method.
+        """
+
+        plist_data = pickle.loads(pickle.dumps(PlistData(buffer(b"My Value B"))))
+        self.assertEqual(plist_data, b"My Value B")
+
+    def test_get_buffer(self):
+        """
+        Tests :meth:`foundations.parsers.PlistData.get_buffer` method.
+        """
+
+        source = buffer(b"My Value B")
+        plist_data = PlistData(source)
+        self.assertIsInstance(plist_data.get_buffer(), memoryview)
+        self.assertEqual(plist_data.get_buffer()[3:8].tobytes(), b"Value")
+        self.assertEqual(PlistData(b"TXkgVmFsdWUgQg==", encoded=True).get_buffer().tobytes(), b"My Value B")
+
 
 class TestPlistFileParser(unittest.TestCase):
     """
@@ -757,7 +1303,9 @@ class TestPlistFileParser(unittest.TestCase):
                                "content",
                                "elements",
                                "parsing_errors",
-                               "unserializers")
+                               "unserializers",
+                               "backends",
+                               "index")
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(PlistFileParser))
@@ -768,6 +1316,7 @@ class TestPlistFileParser(unittest.TestCase):
         """
 
         required_methods = ("parse",
+                            "iter_elements",
                             "element_exists",
                             "filter_values",
                             "get_value")
@@ -783,6 +1332,104 @@ class TestPlistFileParser(unittest.TestCase):
         plist_file_parser = PlistFileParser(PLIST_FILE)
         self.assertTrue(plist_file_parser.parse())
         self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+        self.assertIsNone(plist_file_parser.index)
+
+    def test_parse_binary(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.parse` method with binary plists.
+        """
+
+        plist_file_parser = PlistFileParser(BINARY_PLIST_FILE)
+        self.assertTrue(plist_file_parser.parse())
+        self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+        self.assertTrue(plist_file_parser.parse(backend="binary"))
+        self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+        self.assertEqual(plist_file_parser.get_value("String B"), PLIST_FILE_CONTENT["Dictionary A"]["String B"])
+        self.assertRaises(foundations.exceptions.ProgrammingError, plist_file_parser.parse, backend="Nemo")
+
+        file_descriptor, path = tempfile.mkstemp(suffix=".plist")
+        with open(path, "wb") as file:
+            with open(BINARY_PLIST_FILE, "rb") as binary_file:
+                file.write(binary_file.read()[:-16])
+        plist_file_parser = PlistFileParser(unicode(path))
+        self.assertIsNone(plist_file_parser.parse(raise_parsing_errors=False))
+        self.assertEqual(len(plist_file_parser.parsing_errors), 1)
+
+        # Array referencing itself.
+        with open(path, "wb") as file:
+            file.write(b"bplist00\xa1\x00\x08" + b"\x00" * 6 + struct.pack(b">BBQQQ", 1, 1, 1, 0, 10))
+        self.assertIsNone(plist_file_parser.parse(raise_parsing_errors=False))
+        self.assertEqual(len(plist_file_parser.parsing_errors), 1)
+        os.close(file_descriptor)
+        os.remove(path)
+
+    def test_parse_lazy_data(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.parse` method with lazy data.
+        """
+
+        for path in (PLIST_FILE, BINARY_PLIST_FILE):
+            plist_file_parser = PlistFileParser(path)
+            self.assertTrue(plist_file_parser.parse(lazy_data=True))
+            self.assertIsInstance(plist_file_parser.elements["Data A"], PlistData)
+            self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+            self.assertEqual(plist_file_parser.get_value("Data A").get_buffer().tobytes(),
+                             PLIST_FILE_CONTENT["Data A"])
+
+        file_descriptor, path = tempfile.mkstemp(suffix=".plist")
+        with open(path, "w") as file:
+            file.write("<plist version=\"1.0\"><dict><key>Data A</key><data/><key>Data B</key>\n"
+                       "<data>\n\tTXkgVmFs\n\tdWUgQg==\n</data></dict></plist>")
+        plist_file_parser = PlistFileParser(unicode(path))
+        plist_file_parser.parse(lazy_data=True)
+        self.assertDictEqual(plist_file_parser.elements, {"Data A": b"", "Data B": b"My Value B"})
+        os.close(file_descriptor)
+        os.remove(path)
+
+    def test_parse_index(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.parse` method with elements indexing.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        self.assertTrue(plist_file_parser.parse(index=True))
+        self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+        for item in foundations.walkers.dictionaries_walker(PLIST_FILE_CONTENT):
+            path, element, value = item
+            self.assertIn((path, value), [(path, value) for i, path, value in plist_file_parser.index[element]])
+            self.assertTrue(plist_file_parser.element_exists(element))
+            self.assertEqual(value, plist_file_parser.get_value(element))
+        self.assertFalse(plist_file_parser.element_exists("String Nemo"))
+        self.assertIsNone(plist_file_parser.get_value("String Nemo"))
+        self.assertEqual(sorted(plist_file_parser.filter_values(r"String.*")),
+                         sorted([PLIST_FILE_CONTENT["String A"],
+                                 PLIST_FILE_CONTENT["Dictionary A"]["String B"],
+                                 PLIST_FILE_CONTENT["Dictionary A"]["String C"]]))
+        self.assertEqual(plist_file_parser.get_value(r"String [A]"), PLIST_FILE_CONTENT["String A"])
+
+        plist_file_parser.elements = {"String Z": "My Value Z"}
+        self.assertIsNone(plist_file_parser.index)
+        self.assertEqual(plist_file_parser.get_value("String Z"), "My Value Z")
+
+    def test_iter_elements(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFileParser.iter_elements` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        self.assertListEqual(list(plist_file_parser.iter_elements(("String A", "*|String B", "Nemo"))),
+                             [((), "String A", PLIST_FILE_CONTENT["String A"]),
+                              (("Dictionary A",), "String B", PLIST_FILE_CONTENT["Dictionary A"]["String B"])])
+        self.assertIsNone(plist_file_parser.elements)
+
+        elements = dict((element, value) for path, element, value in
+                        plist_file_parser.iter_elements(("Array A", "Dictionary A", "Date A", "Data A")))
+        self.assertDictEqual(elements, dict((element, PLIST_FILE_CONTENT[element])
+                                            for element in ("Array A", "Dictionary A", "Date A", "Data A")))
+
+        for item in foundations.walkers.dictionaries_walker(PLIST_FILE_CONTENT):
+            path, element, value = item
+            self.assertIn((path, element, value), list(plist_file_parser.iter_elements((element,))))
 
     def test_element_exists(self):
         """
@@ -854,6 +1501,210 @@ class TestGetAttributeCompound(unittest.TestCase):
         self.assertEqual(compound.link, foundations.parsers.get_attribute_compound("Attribute", data).link)
 
 
+class TestGetAttributeCompounds(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.get_attribute_compounds` definition units tests methods.
+    """
+
+    def test_get_attribute_compounds(self):
+        """
+        Tests :func:`foundations.parsers.get_attribute_compounds` definition.
+        """
+
+        data = foundations.parsers.OrderedDict((("Attribute A", "@Link | Value | Boolean | Link Parameter"),
+                                                ("Attribute B", "@Link"),
+                                                ("Attribute C", "Value"),
+                                                ("Attribute D", "@Link | Value | Boolean"),
+                                                ("Attribute E", "Value | Value | Value"),
+                                                ("Attribute F", "@Link | Value | Boolean | Link Parameter"),
+                                                ("Attribute G", ["Value"]),
+                                                ("Attribute H", None)))
+        attribute_compounds = foundations.parsers.get_attribute_compounds(data)
+        self.assertListEqual(attribute_compounds.keys(), data.keys())
+        for attribute, value in data.iteritems():
+            attribute_compound = attribute_compounds[attribute]
+            self.assertIsInstance(attribute_compound, foundations.parsers.AttributeCompoundRecord)
+            self.assertDictEqual(attribute_compound._asdict(),
+                                 dict(foundations.parsers.get_attribute_compound(attribute, value)))
+
+        self.assertEqual(attribute_compounds["Attribute A"],
+                         ("Attribute A", "Value", "@Link", "Boolean", "Link Parameter"))
+        self.assertRaises(AttributeError, setattr, attribute_compounds["Attribute A"], "value", "Value")
+
+        attribute_compounds = foundations.parsers.get_attribute_compounds({"Attribute": "#Link ; Value ; Boolean"},
+                                                                          splitter=";",
+                                                                          binding_identifier="#")
+        self.assertEqual(attribute_compounds["Attribute"].link, "#Link")
+        self.assertEqual(attribute_compounds["Attribute"].type, "Boolean")
+
+
+class TestPlistFilesStore(unittest.TestCase):
+    """
+    Defines :class:`foundations.parsers.PlistFilesStore` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("plist_files_parsers",
+                               "index")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PlistFilesStore))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("add_plist_file_parser",
+                            "element_exists",
+                            "filter_values",
+                            "get_value")
+
+        for method in required_methods:
+            self.assertIn(method, dir(PlistFilesStore))
+
+    def test__len__(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFilesStore.__len__` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        plist_file_parser.parse()
+        self.assertEqual(len(PlistFilesStore()), 0)
+        self.assertEqual(len(PlistFilesStore([plist_file_parser, PlistFileParser()])), 2)
+
+    def test_element_exists(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFilesStore.element_exists` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        plist_file_parser.parse()
+        plist_files_store = PlistFilesStore([plist_file_parser])
+        self.assertTrue(plist_files_store.element_exists("String A"))
+        self.assertTrue(plist_files_store.element_exists("String B"))
+        self.assertFalse(plist_files_store.element_exists("String Nemo"))
+
+    def test_filter_values(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFilesStore.filter_values` method.
+        """
+
+        plist_files_parsers = []
+        for path in (PLIST_FILE, BINARY_PLIST_FILE):
+            plist_file_parser = PlistFileParser(path)
+            plist_file_parser.parse()
+            plist_files_parsers.append(plist_file_parser)
+
+        plist_files_store = PlistFilesStore(plist_files_parsers)
+        self.assertListEqual(plist_files_store.filter_values(r"String A"),
+                             [(PLIST_FILE, PLIST_FILE_CONTENT["String A"]),
+                              (BINARY_PLIST_FILE, PLIST_FILE_CONTENT["String A"])])
+        values = plist_files_store.filter_values(r"String.*")
+        self.assertEqual(len(values), 6)
+        self.assertListEqual([file for file, value in values], [PLIST_FILE] * 3 + [BINARY_PLIST_FILE] * 3)
+        self.assertListEqual(plist_files_store.filter_values(r"Nemo"), [])
+
+    def test_get_value(self):
+        """
+        Tests :meth:`foundations.parsers.PlistFilesStore.get_value` method.
+        """
+
+        plist_file_parser = PlistFileParser(PLIST_FILE)
+        plist_file_parser.parse()
+        plist_files_store = PlistFilesStore([plist_file_parser])
+        for item in foundations.walkers.dictionaries_walker(PLIST_FILE_CONTENT):
+            path, element, value = item
+            self.assertTupleEqual(plist_files_store.get_value(element), (PLIST_FILE, value))
+        self.assertTupleEqual(plist_files_store.get_value(r"String [A]"), (PLIST_FILE, PLIST_FILE_CONTENT["String A"]))
+        self.assertIsNone(plist_files_store.get_value("String Nemo"))
+
+
+class TestParseSectionsFiles(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.parse_sections_files` definition units tests methods.
+    """
+
+    def test_parse_sections_files(self):
+        """
+        Tests :func:`foundations.parsers.parse_sections_files` definition.
+        """
+
+        paths = [COMPONENT_FILE, IBL_SET_FILE, PARSING_ERRORS_FILE, os.path.join(RESOURCES_DIRECTORY, "missing.rc")]
+        for executor in ("process", "thread"):
+            sections_files_parsers = foundations.parsers.parse_sections_files(paths, workers=2, executor=executor)
+            self.assertListEqual([sections_file_parser.path for sections_file_parser in sections_files_parsers],
+                                 paths)
+            for path, sections_file_parser in zip(paths[:2], sections_files_parsers):
+                self.assertListEqual(sections_file_parser.sections.items(),
+                                     SectionsFileParser(path).parse().sections.items())
+                self.assertListEqual(sections_file_parser.parsing_errors, [])
+            self.assertListEqual(sorted(exception.line for exception in sections_files_parsers[2].parsing_errors),
+                                 sorted(PARSING_ERRORS_LINES_AND_VALUES))
+            self.assertEqual(len(sections_files_parsers[3].parsing_errors), 1)
+
+        sections_files_parsers = foundations.parsers.parse_sections_files(paths[:1], strip_comments=False)
+        self.assertTrue(sections_files_parsers[0].comments)
+
+        sections_files_parsers = foundations.parsers.parse_sections_files(paths[:1],
+                                                                          parser_options={"preserve_order": False},
+                                                                          namespaces=False)
+        self.assertFalse(sections_files_parsers[0].preserve_order)
+        self.assertIsInstance(sections_files_parsers[0].sections, dict)
+        self.assertIn("Name", sections_files_parsers[0].sections["Component"])
+
+        self.assertRaises(foundations.exceptions.ProgrammingError,
+                          foundations.parsers.parse_sections_files,
+                          paths,
+                          executor="cluster")
+        self.assertRaises(foundations.exceptions.ProgrammingError,
+                          foundations.parsers.parse_sections_files,
+                          paths,
+                          raise_parsing_errors=True)
+
+
+class TestParsePlistFiles(unittest.TestCase):
+    """
+    Defines :func:`foundations.parsers.parse_plist_files` definition units tests methods.
+    """
+
+    def test_parse_plist_files(self):
+        """
+        Tests :func:`foundations.parsers.parse_plist_files` definition.
+        """
+
+        paths = [PLIST_FILE, BINARY_PLIST_FILE, COMPONENT_FILE, os.path.join(RESOURCES_DIRECTORY, "missing.plist")]
+        for executor in ("process", "thread"):
+            plist_files_store = foundations.parsers.parse_plist_files(paths, workers=2, executor=executor)
+            self.assertIsInstance(plist_files_store, PlistFilesStore)
+            self.assertListEqual([plist_file_parser.path for plist_file_parser in
+                                  plist_files_store.plist_files_parsers], paths)
+            for plist_file_parser in plist_files_store.plist_files_parsers[:2]:
+                self.assertDictEqual(plist_file_parser.elements, PLIST_FILE_CONTENT)
+                self.assertListEqual(plist_file_parser.parsing_errors, [])
+            for plist_file_parser in plist_files_store.plist_files_parsers[2:]:
+                self.assertIsNone(plist_file_parser.elements)
+                self.assertEqual(len(plist_file_parser.parsing_errors), 1)
+            self.assertTupleEqual(plist_files_store.get_value("String B"),
+                                  (PLIST_FILE, PLIST_FILE_CONTENT["Dictionary A"]["String B"]))
+            self.assertListEqual([file for file, value in plist_files_store.filter_values(r"Date A")],
+                                 [PLIST_FILE, BINARY_PLIST_FILE])
+
+        self.assertRaises(foundations.exceptions.ProgrammingError,
+                          foundations.parsers.parse_plist_files,
+                          paths,
+                          executor="cluster")
+        for option in ("raise_parsing_errors", "index"):
+            self.assertRaises(foundations.exceptions.ProgrammingError,
+                              foundations.parsers.parse_plist_files,
+                              paths,
+                              **{option: True})
+
+
 if __name__ == "__main__":
     import foundations.tests.utilities
 
@@ -35,7 +35,8 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["TestToString",
+__all__ = ["TestFilterSet",
+           "TestToString",
            "TestGetNiceName",
            "TestGetVersionRank",
            "TestGetSplitextBasename",
@@ -53,6 +54,68 @@ __all__ = ["TestToString",
            "TestIsWebsite"]
 
 
+class TestFilterSet(unittest.TestCase):
+    """
+    Defines :class:`foundations.strings.FilterSet` class units tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("filters_in",
+                               "filters_out",
+                               "flags")
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(foundations.strings.FilterSet))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("matches",
+                            "filter")
+
+        for method in required_methods:
+            self.assertIn(method, dir(foundations.strings.FilterSet))
+
+    def test_matches(self):
+        """
+        Tests :meth:`foundations.strings.FilterSet.matches` method.
+        """
+
+        words = "Users are John Doe and Jane Doe Doe-Doe".split()
+        for filters_in, filters_out, flags in ((None, None, 0),
+                                               (("Users", "John"), None, 0),
+                                               (("users", "john"), None, re.IGNORECASE),
+                                               (None, ("Users", "John"), 0),
+                                               (("Users",), ("Users",), 0),
+                                               (("^J", r"(?P<name>Do)e-(?P=name)"), ("(?i)jane",), 0),
+                                               ((r"(\w)\1", r"e$"), (r"^D(?=o)",), 0),
+                                               (("J # Comment.", "D"), None, re.VERBOSE)):
+            filter_set = foundations.strings.FilterSet(filters_in, filters_out, flags)
+            self.assertListEqual([word for word in words if filter_set.matches(word)],
+                                 foundations.strings.filter_words(words, filters_in, filters_out, flags))
+
+        words = ["x{0}".format(i) for i in range(0, 240, 8)]
+        filters = ["^(x)({0})$".format(i) for i in range(120)]
+        filter_set = foundations.strings.FilterSet(filters_in=filters, filters_out=filters[::2])
+        self.assertListEqual([word for word in words if filter_set.matches(word)],
+                             foundations.strings.filter_words(words, filters, filters[::2]))
+
+    def test_filter(self):
+        """
+        Tests :meth:`foundations.strings.FilterSet.filter` method.
+        """
+
+        filter_set = foundations.strings.FilterSet(filters_in=("Users", "John"))
+        self.assertListEqual(filter_set.filter("Users are John Doe and Jane Doe".split()), "Users John".split())
+        self.assertListEqual(filter_set.filter([]), [])
+
+
 class TestToString(unittest.TestCase):
     """
     Defines :func:`foundations.strings.to_string` definition units tests methods.
@@ -220,6 +283,10 @@ class TestFilterWords(unittest.TestCase):
                                                               filters_in=("Users",),
                                                               filters_out=("Users",)),
             [])
+        self.assertListEqual(foundations.strings.filter_words("Users are John Doe and Jane Doe".split(),
+                                                              filters_in=("Nemo",),
+                                                              filter_set=foundations.strings.FilterSet(("Doe",))),
+                             "Doe Doe".split())
 
 
 class TestReplace(unittest.TestCase):
@@ -17,7 +17,11 @@ from __future__ import unicode_literals
 
 import os
 import re
+import shutil
 import sys
+import tempfile
+import threading
+import time
 
 if sys.version_info[:2] <= (2, 6):
     import unittest2 as unittest
@@ -43,9 +47,12 @@ __all__ = ["RESOURCES_DIRECTORY",
            "CHINESE_FILES_TREE_HIERARCHY",
            "CHINESE_TREE_HIERARCHY",
            "TestFilesWalker",
+           "TestEntriesWalker",
+           "TestParallelEntriesWalker",
            "TestDepthWalker",
            "TestDictionariesWalker",
-           "TestNodesWalker"]
+           "TestNodesWalker",
+           "TestFilesIndex"]
 
 RESOURCES_DIRECTORY = os.path.join(os.path.dirname(__file__), "resources")
 ROOT_DIRECTORY = "standard"
@@ -102,6 +109,40 @@ class TestFilesWalker(unittest.TestCase):
              foundations.walkers.files_walker(root_directory, filters_out=("\.ibl", "\.rc$", "\.sIBLT$", "\.txt$"))]
         self.assertTrue(not walker_files)
 
+        filter_set = foundations.strings.FilterSet(filters_in=("\.rc$", "\.txt$"), filters_out=("lorem",))
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory, filter_set=filter_set)),
+                             sorted(foundations.walkers.files_walker(root_directory,
+                                                                     filters_in=("\.rc$", "\.txt$"),
+                                                                     filters_out=("lorem",))))
+
+    def test_files_walker_pruning(self):
+        """
+        Tests :func:`foundations.walkers.files_walker` definition directories pruning.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        walker_files = list(foundations.walkers.files_walker(root_directory))
+
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory, maximum_depth=0)),
+                             sorted(path for path in walker_files if "level_0" not in path))
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory, maximum_depth=2)),
+                             sorted(path for path in walker_files if "level_2" not in path))
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory, maximum_depth=8)),
+                             sorted(walker_files))
+
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory,
+                                                                     directories_filters_out=("level_1$",))),
+                             sorted(path for path in walker_files if "level_1" not in path))
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory,
+                                                                     filters_in=("\.rc$",),
+                                                                     directories_filters_in=("level_0$",))),
+                             [foundations.strings.to_forward_slashes(os.path.join(root_directory, "standard.rc"))])
+
+        directories_filter_set = foundations.strings.FilterSet(filters_out=("level_2$",))
+        self.assertListEqual(sorted(foundations.walkers.files_walker(root_directory,
+                                                                     directories_filter_set=directories_filter_set)),
+                             sorted(path for path in walker_files if "level_2" not in path))
+
     def test_files_walker_international(self):
         """
         Tests :func:`foundations.walkers.files_walker` definition in international specific context.
@@ -132,6 +173,193 @@ class TestFilesWalker(unittest.TestCase):
         self.assertTrue(not walker_files)
 
 
+class TestEntriesWalker(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.entries_walker` definition units tests methods.
+    """
+
+    def test_entries_walker(self):
+        """
+        Tests :func:`foundations.walkers.entries_walker` definition.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        entries = list(foundations.walkers.entries_walker(root_directory, topdown=False))
+        self.assertListEqual([entry.path for entry in entries],
+                             list(foundations.walkers.files_walker(root_directory)))
+        for entry in entries:
+            self.assertIsInstance(entry, foundations.walkers.FileEntry)
+            self.assertEqual(entry.size, os.path.getsize(entry.path))
+            self.assertEqual(entry.mtime, os.path.getmtime(entry.path))
+
+        paths = [entry.path for entry in foundations.walkers.entries_walker(root_directory)]
+        self.assertListEqual(sorted(paths), sorted(entry.path for entry in entries))
+        for path in paths:
+            self.assertTrue(all(paths.index(path) < paths.index(other_path) for other_path in paths
+                                if os.path.dirname(other_path).startswith(os.path.dirname(path) + "/")))
+
+        filter_set = foundations.strings.FilterSet(filters_in=("\.rc$", "\.txt$"), filters_out=("lorem",))
+        self.assertListEqual([entry.path for entry in foundations.walkers.entries_walker(root_directory,
+                                                                                         filter_set=filter_set,
+                                                                                         topdown=False)],
+                             list(foundations.walkers.files_walker(root_directory, filter_set=filter_set)))
+
+        self.assertListEqual(list(foundations.walkers.entries_walker(os.path.join(root_directory, "missing"))), [])
+
+    def test_entries_walker_vanishing_entries(self):
+        """
+        Tests :func:`foundations.walkers.entries_walker` definition with entries vanishing while scanning.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        vanished_files = [os.path.join(directory, sorted(files)[0]).replace(os.sep, "/")
+                          for directory, directories, files in os.walk(root_directory) if len(files) > 1]
+
+        class VanishingEntry(object):
+            def __init__(self, path, vanished):
+                self.path = path
+                self.vanished = vanished
+
+            def is_dir(self):
+                return os.path.isdir(self.path)
+
+            def is_file(self):
+                return os.path.isfile(self.path)
+
+            def is_symlink(self):
+                return os.path.islink(self.path)
+
+            def stat(self):
+                if self.vanished:
+                    raise OSError("'{0}' entry vanished!".format(self.path))
+                return os.stat(self.path)
+
+        def vanishing_scandir(directory):
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                yield VanishingEntry(path, path.replace(os.sep, "/") in vanished_files)
+
+        scandir = foundations.walkers.scandir
+        foundations.walkers.scandir = vanishing_scandir
+        try:
+            paths = sorted(entry.path for entry in foundations.walkers.entries_walker(root_directory))
+        finally:
+            foundations.walkers.scandir = scandir
+
+        self.assertTrue(paths)
+        self.assertListEqual(paths,
+                             sorted(entry.path for entry in foundations.walkers.entries_walker(root_directory)
+                                    if entry.path not in vanished_files))
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "'os.symlink' definition is not available!")
+    def test_entries_walker_loops(self):
+        """
+        Tests :func:`foundations.walkers.entries_walker` definition with symbolic links loops.
+        """
+
+        temp_directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(temp_directory, "level_0", "level_1"))
+        open(os.path.join(temp_directory, "level_0", "level_1", "file.txt"), "w").close()
+        os.symlink(os.path.join(temp_directory, "level_0"), os.path.join(temp_directory, "level_0", "level_1", "loop"))
+
+        self.assertListEqual([entry.path for entry in foundations.walkers.entries_walker(unicode(temp_directory),
+                                                                                         detect_loops=True)],
+                             [os.path.join(temp_directory, "level_0", "level_1", "file.txt")])
+        self.assertListEqual([entry.path for entry in foundations.walkers.entries_walker(unicode(temp_directory),
+                                                                                         followlinks=False)],
+                             [os.path.join(temp_directory, "level_0", "level_1", "file.txt")])
+        shutil.rmtree(temp_directory)
+
+
+class TestParallelEntriesWalker(unittest.TestCase):
+    """
+    Defines :func:`foundations.walkers.parallel_entries_walker` definition units tests methods.
+    """
+
+    def test_parallel_entries_walker(self):
+        """
+        Tests :func:`foundations.walkers.parallel_entries_walker` definition.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        entries = list(foundations.walkers.entries_walker(root_directory))
+        self.assertListEqual(sorted(foundations.walkers.parallel_entries_walker(root_directory, workers=4)),
+                             sorted(entries))
+        self.assertListEqual(list(foundations.walkers.parallel_entries_walker(root_directory,
+                                                                              workers=4,
+                                                                              maximum_queue_size=1,
+                                                                              ordered=True)),
+                             entries)
+
+        filter_set = foundations.strings.FilterSet(filters_in=("\.rc$", "\.txt$"), filters_out=("lorem",))
+        self.assertListEqual(list(foundations.walkers.parallel_entries_walker(root_directory,
+                                                                              filter_set=filter_set,
+                                                                              ordered=True)),
+                             list(foundations.walkers.entries_walker(root_directory, filter_set=filter_set)))
+
+        self.assertListEqual(list(foundations.walkers.parallel_entries_walker(
+            os.path.join(root_directory, "missing"))), [])
+
+    def test_parallel_entries_walker_bound(self):
+        """
+        Tests :func:`foundations.walkers.parallel_entries_walker` definition maximum queue size in ordered mode.
+        """
+
+        temp_directory = unicode(tempfile.mkdtemp())
+        for i in range(24):
+            os.makedirs(os.path.join(temp_directory, "level_{0:02}".format(i)))
+        for parent_directory, directories, files in os.walk(temp_directory):
+            open(os.path.join(parent_directory, "file.txt"), "w").close()
+
+        scan_directory = foundations.walkers._scan_directory
+        scanned_directories = []
+
+        def slow_scan_directory(directory, *args):
+            scanned_directories.append(directory)
+            if directory.endswith("level_00"):
+                time.sleep(0.25)
+            return scan_directory(directory, *args)
+
+        foundations.walkers._scan_directory = slow_scan_directory
+        try:
+            entries = []
+            for entry in foundations.walkers.parallel_entries_walker(temp_directory,
+                                                                     workers=8,
+                                                                     maximum_queue_size=4,
+                                                                     ordered=True):
+                entries.append(entry)
+                self.assertLessEqual(len(scanned_directories), len(entries) + 4 + 1)
+        finally:
+            foundations.walkers._scan_directory = scan_directory
+
+        self.assertListEqual(entries, list(foundations.walkers.entries_walker(temp_directory)))
+        shutil.rmtree(temp_directory)
+
+    def test_parallel_entries_walker_cancellation(self):
+        """
+        Tests :func:`foundations.walkers.parallel_entries_walker` definition cancellation.
+        """
+
+        root_directory = os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY)
+        threads_count = threading.active_count()
+
+        walker = foundations.walkers.parallel_entries_walker(root_directory, workers=4, maximum_queue_size=1)
+        next(walker)
+        walker.close()
+        self.assertEqual(threading.active_count(), threads_count)
+
+        cancel_event = threading.Event()
+        entries = []
+        for entry in foundations.walkers.parallel_entries_walker(root_directory,
+                                                                 workers=4,
+                                                                 maximum_queue_size=1,
+                                                                 cancel_event=cancel_event):
+            entries.append(entry)
+            cancel_event.set()
+        self.assertLess(len(entries), len(FILES_TREE_HIERARCHY))
+        self.assertEqual(threading.active_count(), threads_count)
+
+
 class TestDepthWalker(unittest.TestCase):
     """
     Defines :func:`foundations.walkers.depth_walker` definition units tests methods.
@@ -209,6 +437,143 @@ class TestNodesWalker(unittest.TestCase):
         self.assertEquals(list(foundations.walkers.nodes_walker(node_h, ascendants=True)), values)
 
 
+class TestFilesIndex(unittest.TestCase):
+    """
+    Defines :class:`foundations.walkers.FilesIndex` class units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initializes the tests.
+        """
+
+        self.__directory = unicode(tempfile.mkdtemp())
+        self.__database = os.path.join(self.__directory, "files_index.db")
+        self.__root_directory = os.path.join(self.__directory, "root")
+        shutil.copytree(os.path.join(RESOURCES_DIRECTORY, ROOT_DIRECTORY), self.__root_directory)
+        self.__set_modification_times(self.__root_directory, 1000000000)
+
+    def tearDown(self):
+        """
+        Cleans the tests.
+        """
+
+        shutil.rmtree(self.__directory)
+
+    def __set_modification_times(self, directory, mtime):
+        """
+        Sets given directory and its sub-directories modification times.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :param mtime: Modification time.
+        :type mtime: int
+        """
+
+        for parent_directory, directories, files in os.walk(directory):
+            os.utime(parent_directory, (mtime, mtime))
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ("database",)
+
+        files_index = foundations.walkers.FilesIndex(":memory:")
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(files_index))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ("update",
+                            "query",
+                            "close")
+
+        for method in required_methods:
+            self.assertIn(method, dir(foundations.walkers.FilesIndex))
+
+    def test_update(self):
+        """
+        Tests :meth:`foundations.walkers.FilesIndex.update` method.
+        """
+
+        files_index = foundations.walkers.FilesIndex(self.__database)
+        self.assertEqual(files_index.update(self.__root_directory), 4)
+        self.assertEqual(files_index.update(self.__root_directory), 0)
+        files_index.close()
+
+        files_index = foundations.walkers.FilesIndex(self.__database)
+        self.assertEqual(files_index.update(self.__root_directory), 0)
+
+        level_1_directory = os.path.join(self.__root_directory, "level_0", "level_1")
+        open(os.path.join(level_1_directory, "new.rc"), "w").close()
+        os.utime(level_1_directory, (1000000001, 1000000001))
+        self.assertEqual(files_index.update(self.__root_directory), 1)
+        self.assertIn(foundations.strings.to_forward_slashes(os.path.join(level_1_directory, "new.rc")),
+                      [entry.path for entry in files_index.query(self.__root_directory, update=False)])
+
+        self.assertEqual(files_index.update(level_1_directory), 0)
+        self.assertEqual(files_index.update(self.__root_directory), 0)
+
+        shutil.rmtree(level_1_directory)
+        os.utime(os.path.join(self.__root_directory, "level_0"), (1000000001, 1000000001))
+        self.assertEqual(files_index.update(self.__root_directory), 1)
+        self.assertListEqual([entry.path for entry in files_index.query(level_1_directory, update=False)], [])
+        files_index.close()
+
+    def test_query(self):
+        """
+        Tests :meth:`foundations.walkers.FilesIndex.query` method.
+        """
+
+        files_index = foundations.walkers.FilesIndex(self.__database)
+        entries = list(files_index.query(self.__root_directory))
+        self.assertListEqual(sorted(entries), sorted(foundations.walkers.entries_walker(self.__root_directory)))
+
+        self.assertListEqual([entry.path for entry in files_index.query(self.__root_directory,
+                                                                        filters_in=("\.rc$", "\.txt$"),
+                                                                        filters_out=("lorem",))],
+                             sorted(foundations.walkers.files_walker(self.__root_directory,
+                                                                     filters_in=("\.rc$", "\.txt$"),
+                                                                     filters_out=("lorem",))))
+
+        level_0_directory = os.path.join(self.__root_directory, "level_0")
+        self.assertListEqual([entry.path for entry in files_index.query(level_0_directory, update=False)],
+                             sorted(foundations.walkers.files_walker(level_0_directory)))
+        self.assertListEqual(list(files_index.query(os.path.join(self.__root_directory, "missing"))), [])
+        files_index.close()
+
+    def test_query_working_directory(self):
+        """
+        Tests :meth:`foundations.walkers.FilesIndex.query` method with relative paths.
+        """
+
+        other_directory = os.path.join(self.__directory, "other")
+        shutil.copytree(self.__root_directory, other_directory)
+        open(os.path.join(self.__root_directory, "level_0", "only_in_root.txt"), "w").close()
+        self.__set_modification_times(self.__root_directory, 1000000000)
+        self.__set_modification_times(other_directory, 1000000000)
+
+        working_directory = os.getcwd()
+        try:
+            files_index = foundations.walkers.FilesIndex(self.__database)
+            os.chdir(self.__root_directory)
+            self.assertIn(foundations.strings.to_forward_slashes(
+                os.path.join(os.getcwd(), "level_0", "only_in_root.txt")),
+                [entry.path for entry in files_index.query("level_0")])
+
+            os.chdir(other_directory)
+            self.assertListEqual([entry.path for entry in files_index.query("level_0")],
+                                 sorted(foundations.walkers.files_walker(os.path.join(os.getcwd(), "level_0"))))
+            files_index.close()
+        finally:
+            os.chdir(working_directory)
+
+
 if __name__ == "__main__":
     import foundations.tests.utilities
 
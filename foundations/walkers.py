@@ -16,8 +16,27 @@
 
 from __future__ import unicode_literals
 
+import Queue
+import collections
+import heapq
+import multiprocessing
 import os
-
+import sqlite3
+import stat
+import threading
+import time
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+import foundations.environment
+import foundations.exceptions
+import foundations.io
 import foundations.strings
 import foundations.verbose
 
@@ -28,14 +47,44 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "files_walker", "depth_walker", "dictionaries_walker", "nodes_walker"]
+__all__ = ["LOGGER",
+           "FileEntry",
+           "files_walker",
+           "entries_walker",
+           "parallel_entries_walker",
+           "depth_walker",
+           "dictionaries_walker",
+           "nodes_walker",
+           "FilesIndex"]
 
 LOGGER = foundations.verbose.install_logger()
 
 
-def files_walker(directory, filters_in=None, filters_out=None, flags=0):
+class FileEntry(collections.namedtuple("FileEntry", ("path", "size", "mtime"))):
+    """
+    Defines a storage object for the files yielded by :func:`entries_walker` definition.
+    """
+
+    __slots__ = ()
+
+
+def files_walker(directory,
+                 filters_in=None,
+                 filters_out=None,
+                 flags=0,
+                 filter_set=None,
+                 directories_filters_in=None,
+                 directories_filters_out=None,
+                 directories_filter_set=None,
+                 maximum_depth=None):
     """
-    Defines a generator used to walk files using given filters.
+    | Defines a generator used to walk files using given filters.
+    | The filters are compiled once into a :class:`foundations.strings.FilterSet` class instance,
+        an existing instance can be given instead, in which case the **filters_in**, **filters_out**
+        and **flags** arguments are ignored.
+    | The directories filters are matched against the sub-directories paths, the filtered out sub-directories
+        and the sub-directories deeper than given maximum depth being pruned and thus never listed.
+        The directories are walked top-down when pruning, bottom-up otherwise.
 
     Usage::
 
@@ -50,6 +99,13 @@ def files_walker(directory, filters_in=None, filters_out=None, flags=0):
         ...     print(file)
         ...
         ./foundations/tests/tests_foundations/resources/standard/level_0/level_1/level_2/standard.sIBLT
+        >>> for file in files_walker("./foundations/tests/tests_foundations/resources/standard/level_0",
+        ...                          directories_filters_out=("level_2$",)):
+        ...     print(file)
+        ...
+        ./foundations/tests/tests_foundations/resources/standard/level_0/standard.ibl
+        ./foundations/tests/tests_foundations/resources/standard/level_0/level_1/lorem_ipsum.txt
+        ./foundations/tests/tests_foundations/resources/standard/level_0/level_1/standard.rc
 
     :param directory: Directory to recursively walk.
     :type directory: unicode
@@ -59,22 +115,52 @@ def files_walker(directory, filters_in=None, filters_out=None, flags=0):
     :type filters_in: tuple or list
     :param flags: Regex flags.
     :type flags: int
+    :param filter_set: Compiled filters.
+    :type filter_set: FilterSet
+    :param directories_filters_in: Directories regex filters in list.
+    :type directories_filters_in: tuple or list
+    :param directories_filters_out: Directories regex filters out list.
+    :type directories_filters_out: tuple or list
+    :param directories_filter_set: Directories compiled filters, the **directories_filters_in**
+        and **directories_filters_out** arguments are ignored if given.
+    :type directories_filter_set: FilterSet
+    :param maximum_depth: Maximum sub-directories depth, 0 walking only given directory.
+    :type maximum_depth: int
     :return: File.
     :rtype: unicode
     """
 
-    if filters_in:
-        LOGGER.debug("> Current filters in: '{0}'.".format(filters_in))
+    if filter_set is None:
+        filter_set = foundations.strings.FilterSet(filters_in, filters_out, flags)
 
-    if filters_out:
-        LOGGER.debug("> Current filters out: '{0}'.".format(filters_out))
+    if filter_set.filters_in:
+        LOGGER.debug("> Current filters in: '{0}'.".format(filter_set.filters_in))
+
+    if filter_set.filters_out:
+        LOGGER.debug("> Current filters out: '{0}'.".format(filter_set.filters_out))
+
+    if directories_filter_set is None and (directories_filters_in or directories_filters_out):
+        directories_filter_set = foundations.strings.FilterSet(directories_filters_in, directories_filters_out, flags)
+
+    prune = directories_filter_set is not None or maximum_depth is not None
+    depths = {directory: 0}
+    for parent_directory, directories, files in os.walk(directory, topdown=prune, followlinks=True):
+        if prune:
+            depth = depths.pop(parent_directory)
+            if maximum_depth is not None and depth >= maximum_depth:
+                del directories[:]
+            elif directories_filter_set is not None:
+                directories[:] = [name for name in directories
+                                  if directories_filter_set.matches(
+                                      foundations.strings.to_forward_slashes(os.path.join(parent_directory, name)))]
+            for name in directories:
+                depths[os.path.join(parent_directory, name)] = depth + 1
 
-    for parent_directory, directories, files in os.walk(directory, topdown=False, followlinks=True):
         for file in files:
             LOGGER.debug("> Current file: '{0}' in '{1}'.".format(file, directory))
             path = foundations.strings.to_forward_slashes(os.path.join(parent_directory, file))
             if os.path.isfile(path):
-                if not foundations.strings.filter_words((path,), filters_in, filters_out, flags):
+                if not filter_set.matches(path):
                     continue
 
                 LOGGER.debug("> '{0}' file filtered in!".format(path))
@@ -82,6 +168,357 @@ def files_walker(directory, filters_in=None, filters_out=None, flags=0):
                 yield path
 
 
+def _scan_directory(directory, filter_set, followlinks=True, detect_loops=False):
+    """
+    | Scans given directory and returns its filtered files entries and its sub-directories.
+    | The entries types are retrieved from :func:`scandir` definition when available, only the filtered in files
+        and the sub-directories checked for loops being stat'ed, otherwise every entry is stat'ed once.
+
+    :param directory: Directory to scan.
+    :type directory: unicode
+    :param filter_set: Files paths filters.
+    :type filter_set: FilterSet
+    :param followlinks: Symbolic links to directories are returned.
+    :type followlinks: bool
+    :param detect_loops: Sub-directories are returned with their stat.
+    :type detect_loops: bool
+    :return: Files entries, sub-directories paths and stats.
+    :rtype: tuple
+    """
+
+    files, directories = [], []
+    if scandir is not None:
+        try:
+            entries = scandir(directory)
+        except OSError as error:
+            LOGGER.debug("> '{0}' directory cannot be scanned: '{1}'.".format(directory, error))
+            return files, directories
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if followlinks or not entry.is_symlink():
+                        directories.append((entry.path, entry.stat() if detect_loops else None))
+                elif entry.is_file():
+                    path = entry.path if os.sep == "/" else entry.path.replace(os.sep, "/")
+                    if filter_set.matches(path):
+                        entry_stat = entry.stat()
+                        files.append(FileEntry(path, entry_stat.st_size, entry_stat.st_mtime))
+            except OSError:
+                continue
+        return files, directories
+
+    try:
+        names = os.listdir(directory)
+    except OSError as error:
+        LOGGER.debug("> '{0}' directory cannot be scanned: '{1}'.".format(directory, error))
+        return files, directories
+
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            entry_stat = os.stat(path)
+        except OSError:
+            continue
+
+        if stat.S_ISDIR(entry_stat.st_mode):
+            if followlinks or not os.path.islink(path):
+                directories.append((path, entry_stat))
+        elif stat.S_ISREG(entry_stat.st_mode):
+            path = path if os.sep == "/" else path.replace(os.sep, "/")
+            if filter_set.matches(path):
+                files.append(FileEntry(path, entry_stat.st_size, entry_stat.st_mtime))
+    return files, directories
+
+
+def entries_walker(directory,
+                   filters_in=None,
+                   filters_out=None,
+                   flags=0,
+                   filter_set=None,
+                   topdown=True,
+                   followlinks=True,
+                   detect_loops=False):
+    """
+    | Defines a generator used to walk files using given filters and yielding their path, size and modification time.
+    | Contrary to :func:`files_walker` definition, each file is stat'ed once and only if it is filtered in, the files
+        and directories types being retrieved from :func:`os.scandir` definition or the *scandir* package when
+        available, which matters on network file systems. Without them, as on Python 2 when the *scandir* package
+        is not installed ( **pip install Foundations[scandir]** ), every entry is stat'ed.
+    | The files of a directory are yielded before its sub-directories ones in top-down order and after them
+        in bottom-up order. Symbolic links loops can be detected, a directory being skipped if it resolves to one
+        of its own ancestors.
+
+    Usage::
+
+        >>> for entry in entries_walker("./foundations/tests/tests_foundations/resources/standard/level_0"):
+        ...     print(entry.path, entry.size)
+        ...
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/standard.ibl', 1091)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/lorem_ipsum.txt', 447)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/standard.rc', 335)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/level_2/standard.sIBLT', 34258)
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param filters_in: Regex filters in list.
+    :type filters_in: tuple or list
+    :param filters_out: Regex filters out list.
+    :type filters_out: tuple or list
+    :param flags: Regex flags.
+    :type flags: int
+    :param filter_set: Compiled filters, the **filters_in**, **filters_out** and **flags** arguments
+        are ignored if given.
+    :type filter_set: FilterSet
+    :param topdown: Directories are walked in top-down order.
+    :type topdown: bool
+    :param followlinks: Symbolic links to directories are walked.
+    :type followlinks: bool
+    :param detect_loops: Symbolic links loops are detected.
+    :type detect_loops: bool
+    :return: File entry.
+    :rtype: FileEntry
+    """
+
+    if filter_set is None:
+        filter_set = foundations.strings.FilterSet(filters_in, filters_out, flags)
+
+    ancestors = ()
+    if detect_loops:
+        try:
+            directory_stat = os.stat(directory)
+        except OSError:
+            return
+        ancestors = ((directory_stat.st_dev, directory_stat.st_ino),)
+
+    stack = [(directory, ancestors, None)]
+    while stack:
+        directory, ancestors, files = stack.pop()
+        if files is None:
+            files, directories = _scan_directory(directory, filter_set, followlinks, detect_loops)
+
+            children = []
+            for path, directory_stat in directories:
+                if detect_loops:
+                    key = (directory_stat.st_dev, directory_stat.st_ino)
+                    if key in ancestors:
+                        LOGGER.debug("> '{0}' directory skipped, symbolic link loop detected!".format(path))
+                        continue
+                    children.append((path, ancestors + (key,), None))
+                else:
+                    children.append((path, ancestors, None))
+
+            if not topdown:
+                stack.append((directory, ancestors, files))
+                stack.extend(reversed(children))
+                continue
+
+            stack.extend(reversed(children))
+
+        for entry in files:
+            yield entry
+
+
+def parallel_entries_walker(directory,
+                            filters_in=None,
+                            filters_out=None,
+                            flags=0,
+                            filter_set=None,
+                            workers=None,
+                            maximum_queue_size=1024,
+                            ordered=False,
+                            followlinks=True,
+                            detect_loops=False,
+                            cancel_event=None):
+    """
+    | Defines a generator used to walk files using given filters with a pool of threads listing the directories
+        concurrently, yielding their path, size and modification time.
+    | Directories listing being I/O bound, this definition is meant to walk wide trees on high latency
+        file systems. The directories are scanned in :func:`entries_walker` definition top-down order priority,
+        the workers waiting before scanning a directory when the directories being scanned or whose files
+        are waiting to be consumed reach given maximum queue size.
+    | The files are yielded in directories completion order unless ordered mode is used, in which case
+        they are yielded in the same order than :func:`entries_walker` definition top-down order,
+        the results of the directories completed ahead being retained until their turn comes. The directory
+        whose files are expected next is always scanned so that the retained results stay bounded by given
+        maximum queue size.
+    | The walk is cancelled when the generator is closed or when given cancel event is set.
+
+    Usage::
+
+        >>> for entry in parallel_entries_walker("./foundations/tests/tests_foundations/resources/standard/level_0",
+        ...                                      ordered=True):
+        ...     print(entry.path, entry.size)
+        ...
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/standard.ibl', 1091)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/lorem_ipsum.txt', 447)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/standard.rc', 335)
+        (u'./foundations/tests/tests_foundations/resources/standard/level_0/level_1/level_2/standard.sIBLT', 34258)
+
+    :param directory: Directory to recursively walk.
+    :type directory: unicode
+    :param filters_in: Regex filters in list.
+    :type filters_in: tuple or list
+    :param filters_out: Regex filters out list.
+    :type filters_out: tuple or list
+    :param flags: Regex flags.
+    :type flags: int
+    :param filter_set: Compiled filters, the **filters_in**, **filters_out** and **flags** arguments
+        are ignored if given.
+    :type filter_set: FilterSet
+    :param workers: Workers count, defaults to four times the cpu count.
+    :type workers: int
+    :param maximum_queue_size: Maximum directories count being scanned or whose files are waiting to be consumed.
+    :type maximum_queue_size: int
+    :param ordered: Files are yielded in :func:`entries_walker` definition top-down order.
+    :type ordered: bool
+    :param followlinks: Symbolic links to directories are walked.
+    :type followlinks: bool
+    :param detect_loops: Symbolic links loops are detected.
+    :type detect_loops: bool
+    :param cancel_event: Event cancelling the walk once set.
+    :type cancel_event: Event
+    :return: File entry.
+    :rtype: FileEntry
+    """
+
+    if filter_set is None:
+        filter_set = foundations.strings.FilterSet(filters_in, filters_out, flags)
+
+    workers = workers or multiprocessing.cpu_count() * 4
+
+    ancestors = ()
+    if detect_loops:
+        try:
+            directory_stat = os.stat(directory)
+        except OSError:
+            return
+        ancestors = ((directory_stat.st_dev, directory_stat.st_ino),)
+
+    # Pending directories heap, the keys being the directories indexes paths from given directory,
+    # their order is the directories top-down order.
+    directories = [((), directory, ancestors)]
+    results_queue = Queue.Queue()
+    condition = threading.Condition()
+    stop_event = threading.Event()
+    state = {"pending": 1, "outstanding": 0, "key": () if ordered else None}
+
+    def get_directory():
+        """
+        Returns the next directory to scan, waiting while the maximum queue size is reached
+        unless the directory is the one whose files are expected next.
+
+        :return: Directory key, path and ancestors.
+        :rtype: tuple
+        """
+
+        with condition:
+            while not stop_event.is_set():
+                if directories and (state["outstanding"] < maximum_queue_size or directories[0][0] == state["key"]):
+                    state["outstanding"] += 1
+                    return heapq.heappop(directories)
+                condition.wait()
+
+    def release_directory(key=None):
+        """
+        Releases a consumed directory and sets the key of the directory whose files are expected next.
+
+        :param key: Directory key.
+        :type key: tuple
+        """
+
+        with condition:
+            state["outstanding"] -= 1
+            state["key"] = key
+            condition.notify_all()
+
+    def worker():
+        """
+        Scans the directories from the directories heap.
+        """
+
+        while True:
+            task = get_directory()
+            if task is None:
+                return
+
+            key, directory, ancestors = task
+            try:
+                files, sub_directories = _scan_directory(directory, filter_set, followlinks, detect_loops)
+
+                children = []
+                for path, directory_stat in sub_directories:
+                    if detect_loops:
+                        child_key = (directory_stat.st_dev, directory_stat.st_ino)
+                        if child_key in ancestors:
+                            LOGGER.debug("> '{0}' directory skipped, symbolic link loop detected!".format(path))
+                            continue
+                        children.append((path, ancestors + (child_key,)))
+                    else:
+                        children.append((path, ancestors))
+
+                with condition:
+                    state["pending"] += len(children)
+                    for i, (path, child_ancestors) in enumerate(children):
+                        heapq.heappush(directories, (key + (i,), path, child_ancestors))
+                    condition.notify_all()
+                results_queue.put((key, files, len(children)))
+            except Exception as error:
+                results_queue.put((key, error, None))
+
+            with condition:
+                state["pending"] -= 1
+                done = not state["pending"]
+            if done:
+                results_queue.put(None)
+
+    LOGGER.debug("> Walking '{0}' directory using '{1}' workers.".format(directory, workers))
+
+    threads = []
+    for i in range(workers):
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    try:
+        keys = [()]
+        completed_directories = {}
+        while cancel_event is None or not cancel_event.is_set():
+            try:
+                result = results_queue.get(timeout=0.1)
+            except Queue.Empty:
+                continue
+
+            if result is None:
+                break
+
+            key, files, count = result
+            if count is None:
+                raise files
+
+            if not ordered:
+                release_directory()
+                for entry in files:
+                    yield entry
+                continue
+
+            completed_directories[key] = (files, count)
+            while keys and keys[-1] in completed_directories:
+                key = keys.pop()
+                files, count = completed_directories.pop(key)
+                keys.extend(key + (i,) for i in reversed(range(count)))
+                release_directory(keys[-1] if keys else None)
+                for entry in files:
+                    yield entry
+    finally:
+        stop_event.set()
+        with condition:
+            condition.notify_all()
+        for thread in threads:
+            thread.join()
+
+
 def depth_walker(directory, maximum_depth=1):
     """
     Defines a generator used to walk into directories using given maximum depth.
@@ -200,3 +637,234 @@ def nodes_walker(node, ascendants=False):
 
         for sub_element in nodes_walker(element, ascendants=ascendants):
             yield sub_element
+
+
+class FilesIndex(object):
+    """
+    | Defines a persistent files index storing the files of walked directories into a *SQLite* database.
+    | The directories modification times are stored along their files, subsequent updates only listing again
+        the directories whose modification time changed, the others being stat'ed once and their stored files
+        and sub-directories reused. Files content changes not altering their parent directory modification time,
+        the stored files sizes and modification times are only refreshed when their directory is listed again.
+    | The directories and files are stored and yielded with absolute paths.
+    """
+
+    def __init__(self, database=None):
+        """
+        Initializes the class.
+
+        Usage::
+
+            >>> files_index = FilesIndex("/tmp/files_index.db")
+            >>> for entry in files_index.query("./foundations/tests/tests_foundations/resources/standard/level_0",
+            ...                                filters_in=("\.rc$",)):
+            ...     print(entry.path)
+            ...
+            /Users/JohnDoe/Foundations/foundations/tests/tests_foundations/resources/standard/level_0/level_1/standard.rc
+
+        :param database: Database file path, defaults to the user Application data directory.
+        :type database: unicode
+        """
+
+        LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+        # --- Setting class attributes. ---
+        self.__database = database or os.path.join(foundations.environment.get_user_application_data_directory(),
+                                                    "files_index.db")
+        self.__connection = None
+
+        self.__connect()
+
+    @property
+    def database(self):
+        """
+        Property for **self.__database** attribute.
+
+        :return: self.__database.
+        :rtype: unicode
+        """
+
+        return self.__database
+
+    @database.setter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def database(self, value):
+        """
+        Setter for **self.__database** attribute.
+
+        :param value: Attribute value.
+        :type value: unicode
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "database"))
+
+    @database.deleter
+    @foundations.exceptions.handle_exceptions(foundations.exceptions.ProgrammingError)
+    def database(self):
+        """
+        Deleter for **self.__database** attribute.
+        """
+
+        raise foundations.exceptions.ProgrammingError(
+            "{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "database"))
+
+    def __connect(self):
+        """
+        Connects to the database and creates its tables.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        if self.__database != ":memory:":
+            foundations.io.set_directory(os.path.dirname(os.path.abspath(self.__database)))
+
+        self.__connection = sqlite3.connect(self.__database)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS directories (path TEXT PRIMARY KEY, parent TEXT, mtime REAL)")
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, directory TEXT, size INTEGER, mtime REAL)")
+            self.__connection.execute("CREATE INDEX IF NOT EXISTS files_directory ON files (directory)")
+        return True
+
+    def __get_directory(self, directory):
+        """
+        | Returns given directory normalized absolute path and the bounds of its descendants paths.
+        | The paths are stored absolute so that the index content does not depend on the current working directory.
+
+        :param directory: Directory.
+        :type directory: unicode
+        :return: Normalized path, lower and upper bounds.
+        :rtype: tuple
+        """
+
+        directory = foundations.strings.to_forward_slashes(os.path.abspath(directory))
+        prefix = directory if directory.endswith("/") else "{0}/".format(directory)
+        return directory, prefix, "{0}0".format(prefix[:-1])
+
+    def update(self, directory, followlinks=True):
+        """
+        Updates the index with given directory files, listing again only the directories whose
+        modification time changed since the previous update.
+
+        Usage::
+
+            >>> files_index = FilesIndex("/tmp/files_index.db")
+            >>> files_index.update("./foundations/tests/tests_foundations/resources/standard/level_0")
+            3
+            >>> files_index.update("./foundations/tests/tests_foundations/resources/standard/level_0")
+            0
+
+        :param directory: Directory to index.
+        :type directory: unicode
+        :param followlinks: Symbolic links to directories are walked.
+        :type followlinks: bool
+        :return: Listed directories count.
+        :rtype: int
+        """
+
+        directory, lower_bound, upper_bound = self.__get_directory(directory)
+
+        LOGGER.debug("> Updating '{0}' directory index.".format(directory))
+
+        # Directories modified within that interval of the update start might be modified again
+        # without their modification time changing, they are stored without it to be listed again.
+        racy_time = time.time() - 2
+
+        modification_times, parents, children = {}, {}, collections.defaultdict(list)
+        for path, parent, mtime in self.__connection.execute(
+                "SELECT path, parent, mtime FROM directories WHERE path = ? OR (path >= ? AND path < ?)",
+                (directory, lower_bound, upper_bound)):
+            modification_times[path] = mtime
+            parents[path] = parent
+            children[parent].append(path)
+
+        filter_set = foundations.strings.FilterSet()
+        visited_directories, visited_keys = set(), set()
+        listed_directories = 0
+        with self.__connection:
+            stack = [(directory, parents.get(directory))]
+            while stack:
+                path, parent = stack.pop()
+                try:
+                    directory_stat = os.stat(path)
+                except OSError:
+                    continue
+
+                key = (directory_stat.st_dev, directory_stat.st_ino)
+                if not stat.S_ISDIR(directory_stat.st_mode) or key in visited_keys:
+                    continue
+
+                visited_keys.add(key)
+                visited_directories.add(path)
+                if modification_times.get(path) == directory_stat.st_mtime:
+                    if parents[path] != parent:
+                        self.__connection.execute("UPDATE directories SET parent = ? WHERE path = ?", (parent, path))
+                    stack.extend((child, path) for child in children[path])
+                    continue
+
+                LOGGER.debug("> Listing '{0}' directory.".format(path))
+
+                files, directories = _scan_directory(path, filter_set, followlinks)
+                listed_directories += 1
+
+                self.__connection.execute("DELETE FROM files WHERE directory = ?", (path,))
+                self.__connection.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                              ((entry.path, path, entry.size, entry.mtime) for entry in files))
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                    (path, parent, directory_stat.st_mtime if directory_stat.st_mtime < racy_time else None))
+                stack.extend((foundations.strings.to_forward_slashes(child), path) for child, child_stat in directories)
+
+            removed_directories = [(path,) for path in modification_times if path not in visited_directories]
+            self.__connection.executemany("DELETE FROM files WHERE directory = ?", removed_directories)
+            self.__connection.executemany("DELETE FROM directories WHERE path = ?", removed_directories)
+        return listed_directories
+
+    def query(self, directory, filters_in=None, filters_out=None, flags=0, filter_set=None, update=True):
+        """
+        | Defines a generator used to query the index for given directory files using given filters.
+        | The directory index is updated first unless requested otherwise.
+
+        :param directory: Directory to query.
+        :type directory: unicode
+        :param filters_in: Regex filters in list.
+        :type filters_in: tuple or list
+        :param filters_out: Regex filters out list.
+        :type filters_out: tuple or list
+        :param flags: Regex flags.
+        :type flags: int
+        :param filter_set: Compiled filters, the **filters_in**, **filters_out** and **flags** arguments
+            are ignored if given.
+        :type filter_set: FilterSet
+        :param update: Directory index is updated.
+        :type update: bool
+        :return: File entry.
+        :rtype: FileEntry
+        """
+
+        if filter_set is None:
+            filter_set = foundations.strings.FilterSet(filters_in, filters_out, flags)
+
+        if update:
+            self.update(directory)
+
+        directory, lower_bound, upper_bound = self.__get_directory(directory)
+        for path, size, mtime in self.__connection.execute(
+                "SELECT path, size, mtime FROM files WHERE path >= ? AND path < ? ORDER BY path",
+                (lower_bound, upper_bound)).fetchall():
+            if filter_set.matches(path):
+                yield FileEntry(path, size, mtime)
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        :return: Method success.
+        :rtype: bool
+        """
+
+        self.__connection.close()
+        return True
@@ -16,10 +16,16 @@
 
 from __future__ import unicode_literals
 
+import platform
 import re
 import sys
+from distutils.errors import CCompilerError
+from distutils.errors import DistutilsExecError
+from distutils.errors import DistutilsPlatformError
+from setuptools import Extension
 from setuptools import setup
 from setuptools import find_packages
+from setuptools.command.build_ext import build_ext
 
 import foundations.globals.constants
 
@@ -30,7 +36,7 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["get_long_description"]
+__all__ = ["OptionalBuildExt", "get_long_description"]
 
 
 def get_long_description():
@@ -54,12 +60,44 @@ def get_long_description():
     return "".join(description)
 
 
+class OptionalBuildExt(build_ext):
+    """
+    Builds the optional extensions, their pure Python implementations being used if they cannot be compiled.
+    """
+
+    def run(self):
+        """
+        Reimplements the :meth:`build_ext.run` method.
+        """
+
+        try:
+            build_ext.run(self)
+        except DistutilsPlatformError as error:
+            sys.stderr.write("!> Optional extensions cannot be built: '{0}'!\n".format(error))
+
+    def build_extension(self, extension):
+        """
+        Reimplements the :meth:`build_ext.build_extension` method.
+
+        :param extension: Extension to build.
+        :type extension: Extension
+        """
+
+        try:
+            build_ext.build_extension(self, extension)
+        except (CCompilerError, DistutilsExecError, DistutilsPlatformError, IOError, ValueError) as error:
+            sys.stderr.write("!> '{0}' optional extension cannot be built: '{1}'!\n".format(extension.name, error))
+
+
 setup(name=foundations.globals.constants.Constants.application_name,
       version=foundations.globals.constants.Constants.version,
       author=foundations.globals.constants.__author__,
       author_email=foundations.globals.constants.__email__,
       include_package_data=True,
       packages=find_packages(),
+      ext_modules=[Extension(str("foundations._parsers"), [str("foundations/_parsers.c")])]
+      if platform.python_implementation() == "CPython" else [],
+      cmdclass={"build_ext": OptionalBuildExt},
       scripts=[],
       url="https://github.com/KelSolaar/Foundations",
       license="GPLv3",
@@ -68,6 +106,7 @@ setup(name=foundations.globals.constants.Constants.application_name,
       install_requires=["ordereddict>=1.1", "unittest2>=0.5.1", "Oncilla>=0.1.0"]
       if sys.version_info[:2] <= (2, 6) else
       ["unittest2>=0.5.1", "Oncilla>=0.1.0"],
+      extras_require={"scandir": ["scandir>=1.5"]},
       classifiers=["Development Status :: 5 - Production/Stable",
                    "Environment :: Console",
                    "Intended Audience :: Developers",
@@ -0,0 +1,464 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_parsers.py**
+
+**Platform:**
+    Linux, Mac Os X.
+
+**Description:**
+    Benchmarks :mod:`foundations.parsers` module parsers throughput and memory usage on synthetic files.
+
+**Others:**
+    Results are reported as JSON so that they can be tracked across releases.
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import foundations.verbose
+from foundations.globals.constants import Constants
+from foundations.parsers import PlistFileParser
+from foundations.parsers import SectionsFileParser
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "BENCHMARKS",
+           "write_sections_file",
+           "write_plist_file",
+           "get_peak_resident_set_size",
+           "parse_sections_file",
+           "write_sections_file_parser",
+           "parse_plist_file",
+           "measure_benchmark",
+           "run_benchmark",
+           "benchmark_parsers",
+           "get_command_line_arguments",
+           "main"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def write_sections_file(path, sections=1000, attributes=100, comments_density=0.1, raw_sections=0, seed=0):
+    """
+    Writes a synthetic sections file.
+
+    :param path: File path.
+    :type path: unicode
+    :param sections: Sections count.
+    :type sections: int
+    :param attributes: Attributes count per section.
+    :type attributes: int
+    :param comments_density: Probability for an attribute to be preceded by a comment.
+    :type comments_density: float
+    :param raw_sections: Raw sections count, included into the sections count.
+    :type raw_sections: int
+    :param seed: Random generator seed.
+    :type seed: int
+    :return: Raw sections names.
+    :rtype: list
+    """
+
+    generator = random.Random(seed)
+    raw_sections_names = []
+    with open(path, "w") as file:
+        for i in range(sections):
+            if i < raw_sections:
+                section = "Raw Section {0}".format(i)
+                raw_sections_names.append(section)
+                file.write("[{0}]\n".format(section))
+                for j in range(attributes):
+                    file.write("print(\"Raw line {0}\")\n".format(j))
+            else:
+                file.write("[Section {0}]\n".format(i))
+                for j in range(attributes):
+                    if generator.random() < comments_density:
+                        file.write("; Comment {0}.\n".format(j))
+                    file.write("Attribute {0} = \"Value {1}\"\n".format(j, generator.randint(0, 1 << 16)))
+            file.write("\n")
+    return raw_sections_names
+
+
+def write_plist_file(path, depth=3, breadth=10, seed=0):
+    """
+    Writes a synthetic plist file made of nested dictionaries whose leaves hold
+    every supported value type.
+
+    :param path: File path.
+    :type path: unicode
+    :param depth: Dictionaries nesting depth.
+    :type depth: int
+    :param breadth: Child dictionaries count per dictionary.
+    :type breadth: int
+    :param seed: Random generator seed.
+    :type seed: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    generator = random.Random(seed)
+
+    def write_dictionary(file, level, indentation):
+        file.write("{0}<dict>\n".format(indentation))
+        indentation_child = indentation + "\t"
+        if level < depth:
+            for i in range(breadth):
+                file.write("{0}<key>Dictionary {1}</key>\n".format(indentation_child, i))
+                write_dictionary(file, level + 1, indentation_child)
+        else:
+            for tag, value in (("string", "Value {0}".format(generator.randint(0, 1 << 16))),
+                               ("integer", generator.randint(0, 1 << 16)),
+                               ("real", generator.random()),
+                               ("date", "2000-01-{0:02d}T00:00:00Z".format(generator.randint(1, 28))),
+                               ("data", "TXkgVmFsdWUgQg==")):
+                file.write("{0}<key>{1}</key>\n{0}<{2}>{3}</{2}>\n".format(indentation_child,
+                                                                         tag.title(),
+                                                                         tag,
+                                                                         value))
+            file.write("{0}<key>Boolean</key>\n{0}<true/>\n".format(indentation_child))
+            file.write("{0}<key>Array</key>\n{0}<array>\n".format(indentation_child))
+            for i in range(breadth):
+                file.write("{0}\t<string>Item {1}</string>\n".format(indentation_child, i))
+            file.write("{0}</array>\n".format(indentation_child))
+        file.write("{0}</dict>\n".format(indentation))
+
+    with open(path, "w") as file:
+        file.write("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
+        file.write("<!DOCTYPE plist PUBLIC \"-//Apple//DTD PLIST 1.0//EN\" "
+                   "\"http://www.apple.com/DTDs/PropertyList-1.0.dtd\">\n")
+        file.write("<plist version=\"1.0\">\n")
+        write_dictionary(file, 1, "")
+        file.write("</plist>\n")
+    return True
+
+
+def get_peak_resident_set_size():
+    """
+    Returns the current process peak resident set size.
+
+    :return: Peak resident set size in bytes.
+    :rtype: int
+    """
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def parse_sections_file(path, raw_sections):
+    """
+    Returns a callable parsing given sections file.
+
+    :param path: File path.
+    :type path: unicode
+    :param raw_sections: Raw sections names.
+    :type raw_sections: list
+    :return: Benchmarked callable.
+    :rtype: object
+    """
+
+    return lambda: SectionsFileParser(path).parse(raw_sections=raw_sections)
+
+
+def write_sections_file_parser(path, raw_sections):
+    """
+    Parses given sections file and returns a callable writing it back into a sibling file.
+
+    :param path: File path.
+    :type path: unicode
+    :param raw_sections: Raw sections names.
+    :type raw_sections: list
+    :return: Benchmarked callable.
+    :rtype: object
+    """
+
+    sections_file_parser = SectionsFileParser(path)
+    sections_file_parser.parse(raw_sections=raw_sections, strip_comments=False)
+    sections_file_parser.uncache()
+    sections_file_parser.path = "{0}.write".format(path)
+    return sections_file_parser.write
+
+
+def parse_plist_file(path, raw_sections):
+    """
+    Returns a callable parsing given plist file.
+
+    :param path: File path.
+    :type path: unicode
+    :param raw_sections: Unused.
+    :type raw_sections: list
+    :return: Benchmarked callable.
+    :rtype: object
+    """
+
+    return lambda: PlistFileParser(path).parse()
+
+
+BENCHMARKS = (("sections_file_parser.parse", "sections", parse_sections_file),
+              ("sections_file_parser.write", "sections", write_sections_file_parser),
+              ("plist_file_parser.parse", "plist", parse_plist_file))
+"""
+:param BENCHMARKS: Benchmarks name, file type and callable factory.
+:type BENCHMARKS: tuple
+"""
+
+
+def measure_benchmark(factory, path, raw_sections, connection):
+    """
+    | Runs given benchmark and sends its duration and peak resident set size increase through given connection.
+    | This definition is meant to be executed into a dedicated process.
+
+    :param factory: Benchmarked callable factory.
+    :type factory: object
+    :param path: File path.
+    :type path: unicode
+    :param raw_sections: Raw sections names.
+    :type raw_sections: list
+    :param connection: Connection used to send the measures.
+    :type connection: Connection
+    """
+
+    benchmark = factory(path, raw_sections)
+    peak_baseline = get_peak_resident_set_size()
+
+    start = time.time()
+    benchmark()
+    duration = time.time() - start
+
+    connection.send((duration, get_peak_resident_set_size() - peak_baseline))
+    connection.close()
+
+
+def run_benchmark(name, factory, path, raw_sections=None, repeats=3):
+    """
+    Runs given benchmark into dedicated processes and returns its best throughput.
+
+    :param name: Benchmark name.
+    :type name: unicode
+    :param factory: Benchmarked callable factory.
+    :type factory: object
+    :param path: File path.
+    :type path: unicode
+    :param raw_sections: Raw sections names.
+    :type raw_sections: list
+    :param repeats: Benchmark repeats count.
+    :type repeats: int
+    :return: Benchmark results.
+    :rtype: dict
+    """
+
+    LOGGER.info("{0} | Running '{1}' benchmark!".format(__name__, name))
+
+    durations, peak_sizes = [], []
+    for i in range(repeats):
+        receiver, sender = multiprocessing.Pipe(False)
+        process = multiprocessing.Process(target=measure_benchmark, args=(factory, path, raw_sections, sender))
+        process.start()
+        duration, peak_size = receiver.recv()
+        process.join()
+        durations.append(duration)
+        peak_sizes.append(peak_size)
+
+    with open(path, "rb") as file:
+        lines = sum(1 for line in file)
+    size = os.path.getsize(path)
+    duration = max(min(durations), 1e-9)
+    return {"name": name,
+            "lines": lines,
+            "bytes": size,
+            "repeats": repeats,
+            "duration": duration,
+            "lines_per_second": lines / duration,
+            "megabytes_per_second": size / 1048576. / duration,
+            "peak_memory": max(peak_sizes)}
+
+
+def benchmark_parsers(sections=1000,
+                      attributes=100,
+                      comments_density=0.1,
+                      raw_sections=0,
+                      plist_depth=3,
+                      plist_breadth=10,
+                      repeats=3,
+                      seed=0):
+    """
+    Benchmarks :mod:`foundations.parsers` module parsers on synthetic files.
+
+    :param sections: Sections count.
+    :type sections: int
+    :param attributes: Attributes count per section.
+    :type attributes: int
+    :param comments_density: Probability for an attribute to be preceded by a comment.
+    :type comments_density: float
+    :param raw_sections: Raw sections count.
+    :type raw_sections: int
+    :param plist_depth: Plist dictionaries nesting depth.
+    :type plist_depth: int
+    :param plist_breadth: Plist child dictionaries count per dictionary.
+    :type plist_breadth: int
+    :param repeats: Benchmarks repeats count.
+    :type repeats: int
+    :param seed: Random generator seed.
+    :type seed: int
+    :return: Benchmarks report.
+    :rtype: dict
+    """
+
+    parameters = {"sections": sections,
+                  "attributes": attributes,
+                  "comments_density": comments_density,
+                  "raw_sections": raw_sections,
+                  "plist_depth": plist_depth,
+                  "plist_breadth": plist_breadth,
+                  "repeats": repeats,
+                  "seed": seed}
+
+    directory = tempfile.mkdtemp()
+    try:
+        paths = {"sections": os.path.join(directory, "benchmark.rc"),
+                 "plist": os.path.join(directory, "benchmark.plist")}
+        raw_sections_names = write_sections_file(paths["sections"],
+                                                 sections,
+                                                 attributes,
+                                                 comments_density,
+                                                 raw_sections,
+                                                 seed)
+        write_plist_file(paths["plist"], plist_depth, plist_breadth, seed)
+
+        results = [run_benchmark(name, factory, paths[type], raw_sections_names, repeats)
+                   for name, type, factory in BENCHMARKS]
+    finally:
+        shutil.rmtree(directory)
+
+    return {"version": Constants.version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.utcnow().isoformat(),
+            "parameters": parameters,
+            "benchmarks": results}
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("-s",
+                        "--sections",
+                        type=int,
+                        dest="sections",
+                        default=1000,
+                        help="'Sections count.'")
+
+    parser.add_argument("-a",
+                        "--attributes",
+                        type=int,
+                        dest="attributes",
+                        default=100,
+                        help="'Attributes count per section.'")
+
+    parser.add_argument("-c",
+                        "--comments_density",
+                        type=float,
+                        dest="comments_density",
+                        default=0.1,
+                        help="'Probability for an attribute to be preceded by a comment.'")
+
+    parser.add_argument("-r",
+                        "--raw_sections",
+                        type=int,
+                        dest="raw_sections",
+                        default=0,
+                        help="'Raw sections count.'")
+
+    parser.add_argument("-d",
+                        "--plist_depth",
+                        type=int,
+                        dest="plist_depth",
+                        default=3,
+                        help="'Plist dictionaries nesting depth.'")
+
+    parser.add_argument("-b",
+                        "--plist_breadth",
+                        type=int,
+                        dest="plist_breadth",
+                        default=10,
+                        help="'Plist child dictionaries count per dictionary.'")
+
+    parser.add_argument("-n",
+                        "--repeats",
+                        type=int,
+                        dest="repeats",
+                        default=3,
+                        help="'Benchmarks repeats count.'")
+
+    parser.add_argument("-e",
+                        "--seed",
+                        type=int,
+                        dest="seed",
+                        default=0,
+                        help="'Random generator seed.'")
+
+    parser.add_argument("-o",
+                        "--output",
+                        type=unicode,
+                        dest="output",
+                        help="'JSON report output file, standard output is used if not given.'")
+
+    return parser.parse_args()
+
+
+def main():
+    """
+    Starts the Application.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    args = get_command_line_arguments()
+    report = json.dumps(benchmark_parsers(args.sections,
+                                          args.attributes,
+                                          args.comments_density,
+                                          args.raw_sections,
+                                          args.plist_depth,
+                                          args.plist_breadth,
+                                          args.repeats,
+                                          args.seed), indent=4, separators=(",", ": "), sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(report)
+    else:
+        print(report)
+    return True
+
+
+if __name__ == "__main__":
+    main()
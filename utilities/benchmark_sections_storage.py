@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**benchmark_sections_storage.py**
+
+**Platform:**
+    Linux, Mac Os X.
+
+**Description:**
+    Compares :class:`foundations.parsers.SectionsFileParser` class default and compact sections storages memory usage.
+
+**Others:**
+
+"""
+
+from __future__ import unicode_literals
+
+import argparse
+import gc
+import multiprocessing
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+import foundations.verbose
+from foundations.parsers import SectionsFileParser
+
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER",
+           "write_sections_file",
+           "get_resident_set_size",
+           "measure_storage",
+           "benchmark_sections_storage",
+           "get_command_line_arguments",
+           "main"]
+
+LOGGER = foundations.verbose.install_logger()
+
+
+def write_sections_file(path, sections=1000, attributes=100):
+    """
+    Writes a sections file with given sections and attributes count.
+
+    :param path: File path.
+    :type path: unicode
+    :param sections: Sections count.
+    :type sections: int
+    :param attributes: Attributes count per section.
+    :type attributes: int
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    with open(path, "w") as file:
+        for i in range(sections):
+            file.write("[Section {0}]\n".format(i))
+            for j in range(attributes):
+                file.write("Attribute {0} = Value {1}\n".format(j, i * attributes + j))
+            file.write("\n")
+    return True
+
+
+def get_resident_set_size():
+    """
+    Returns the current process resident set size, falling back to the peak resident set size
+    where it is not available.
+
+    :return: Resident set size in bytes.
+    :rtype: int
+    """
+
+    if os.path.exists("/proc/self/statm"):
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * resource.getpagesize()
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+
+
+def measure_storage(path, compact_storage, connection):
+    """
+    | Parses given file and sends the retained and peak resident set size increases and the parsing time
+        through given connection.
+    | This definition is meant to be executed into a dedicated process.
+
+    :param path: File path.
+    :type path: unicode
+    :param compact_storage: Parser uses compact sections storage.
+    :type compact_storage: bool
+    :param connection: Connection used to send the measures.
+    :type connection: Connection
+    """
+
+    scale = 1 if sys.platform == "darwin" else 1024
+    baseline = get_resident_set_size()
+    peak_baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+    start = time.time()
+    sections_file_parser = SectionsFileParser(path, compact_storage=compact_storage)
+    sections_file_parser.parse()
+    duration = time.time() - start
+
+    sections_file_parser.uncache()
+    gc.collect()
+
+    connection.send((get_resident_set_size() - baseline,
+                     resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale - peak_baseline,
+                     duration))
+    connection.close()
+
+
+def benchmark_sections_storage(sections=1000, attributes=100):
+    """
+    Benchmarks the default and compact sections storages.
+
+    :param sections: Sections count.
+    :type sections: int
+    :param attributes: Attributes count per section.
+    :type attributes: int
+    :return: Storage, retained and peak resident set size increases in bytes, parsing time in seconds.
+    :rtype: list
+    """
+
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "benchmark.rc")
+        write_sections_file(path, sections, attributes)
+
+        results = []
+        for compact_storage in (False, True):
+            receiver, sender = multiprocessing.Pipe(False)
+            process = multiprocessing.Process(target=measure_storage, args=(path, compact_storage, sender))
+            process.start()
+            retained_size, peak_size, duration = receiver.recv()
+            process.join()
+            results.append(("compact" if compact_storage else "default", retained_size, peak_size, duration))
+        return results
+    finally:
+        shutil.rmtree(directory)
+
+
+def get_command_line_arguments():
+    """
+    Retrieves command line arguments.
+
+    :return: Namespace.
+    :rtype: Namespace
+    """
+
+    parser = argparse.ArgumentParser(add_help=False)
+
+    parser.add_argument("-h",
+                        "--help",
+                        action="help",
+                        help="'Displays this help message and exit.'")
+
+    parser.add_argument("-s",
+                        "--sections",
+                        type=int,
+                        dest="sections",
+                        default=1000,
+                        help="'Sections count.'")
+
+    parser.add_argument("-a",
+                        "--attributes",
+                        type=int,
+                        dest="attributes",
+                        default=100,
+                        help="'Attributes count per section.'")
+
+    return parser.parse_args()
+
+
+def main():
+    """
+    Starts the Application.
+
+    :return: Definition success.
+    :rtype: bool
+    """
+
+    args = get_command_line_arguments()
+    print("{0:<8} | {1:>12} | {2:>12} | {3:>8}".format("Storage", "Retained", "Peak", "Time"))
+    for storage, retained_size, peak_size, duration in benchmark_sections_storage(args.sections, args.attributes):
+        print("{0:<8} | {1:>8.2f} MiB | {2:>8.2f} MiB | {3:>6.2f} s".format(
+            storage, retained_size / 1048576., peak_size / 1048576., duration))
+    return True
+
+
+if __name__ == "__main__":
+    main()